@@ -0,0 +1,127 @@
+"""
+Micro benchmark for the per keyword dispatch overhead from UIA.action.
+
+Compares the previous dispatch, which created a switcher dictionary with one lambda per action on every
+call, with the dispatch table which is created once at registration time.
+The benchmark uses a synthetic module with the same amount of actions as the property module, so it runs
+without FlaUI and .NET assemblies.
+
+Usage:
+    python benchmarks/dispatch_benchmark.py [--actions 45] [--calls 100000] [--repeat 5]
+"""
+import argparse
+import timeit
+import types
+from enum import Enum
+
+
+def create_action_enum(size: int):
+    """
+    Creates an action enumeration with the given amount of members.
+    """
+    return Enum("Action", {f"ACTION_{index}": f"BENCHMARK_ACTION_{index}" for index in range(size)})
+
+
+class SwitcherModule:
+    """
+    Module dispatch as used before, switcher dictionary is created on every call.
+    """
+
+    def __init__(self, action_enum):
+        self.Action = action_enum  # pylint: disable=invalid-name
+        self.execute_action = self._compile_execute_action()
+
+    def _compile_execute_action(self):
+        """
+        Generates execute_action with a switcher literal like in the previous module implementations.
+        """
+        entries = "".join(f"        self.Action.{member.name}: lambda: self._handle(values),\n"
+                          for member in self.Action)
+        source = ("def execute_action(self, action, values):\n"
+                  "    switcher = {\n" + entries + "    }\n"
+                  "    return switcher.get(action, lambda: None)()\n")
+        namespace = {}
+        exec(source, namespace)  # pylint: disable=exec-used
+
+        return types.MethodType(namespace["execute_action"], self)
+
+    @staticmethod
+    def _handle(values):
+        return values
+
+
+class TableModule:
+    """
+    Module dispatch by table, handlers are created once.
+    """
+
+    def __init__(self, action_enum):
+        self.Action = action_enum  # pylint: disable=invalid-name
+        self._action_handlers = {member: self._handle for member in self.Action}
+
+    def get_action_handlers(self):
+        """
+        Returns the precompiled dispatch table.
+        """
+        return self._action_handlers
+
+    @staticmethod
+    def _handle(values):
+        return values
+
+
+def create_switcher_dispatch(action_enum, action, values):
+    """
+    Creates the previous dispatch from UIA.action, which resolved the module and called its switcher.
+    """
+    switcher_module = SwitcherModule(action_enum)
+    switcher_actions = {member: switcher_module for member in action_enum}
+
+    def switcher_dispatch():
+        if action in switcher_actions:
+            return switcher_actions[action].execute_action(action, values)
+        return None
+
+    return switcher_dispatch
+
+
+def create_table_dispatch(action_enum, action, values):
+    """
+    Creates the dispatch from UIA.action by a table from action to handler.
+    """
+    handlers = TableModule(action_enum).get_action_handlers()
+    table_actions = {member: handlers[member] for member in action_enum}
+
+    def table_dispatch():
+        return table_actions.get(action)(values)
+
+    return table_dispatch
+
+
+def main():
+    """
+    Runs the benchmark and prints the overhead per keyword call.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--actions", type=int, default=45, help="Amount of actions from benchmark module")
+    parser.add_argument("--calls", type=int, default=100000, help="Amount of dispatched calls per run")
+    parser.add_argument("--repeat", type=int, default=5, help="Amount of runs, best run is reported")
+    args = parser.parse_args()
+
+    action_enum = create_action_enum(args.actions)
+    action = list(action_enum)[-1]
+    values = {"element": None}
+    switcher_dispatch = create_switcher_dispatch(action_enum, action, values)
+    table_dispatch = create_table_dispatch(action_enum, action, values)
+
+    results = {}
+    for name, dispatch in (("switcher per call", switcher_dispatch), ("precompiled table", table_dispatch)):
+        best = min(timeit.repeat(dispatch, number=args.calls, repeat=args.repeat))
+        results[name] = best / args.calls * 1e9
+        print(f"{name:<20} {results[name]:10.1f} ns per keyword")
+
+    print(f"{'speedup':<20} {results['switcher per call'] / results['precompiled table']:10.1f} x")
+
+
+if __name__ == "__main__":
+    main()
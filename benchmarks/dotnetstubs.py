@@ -0,0 +1,119 @@
+"""
+Stubbed .NET namespaces for benchmarks.
+
+Replaces clr, System, FlaUI and FlaUiNative by generic Python types, so the Python keyword layer can be imported
+and measured without pythonnet and the FlaUI assemblies. Only intended for benchmarks, the stubs do not emulate
+any behaviour from UI Automation.
+
+Usage:
+    import dotnetstubs
+    dotnetstubs.install()
+    import FlaUILibrary
+"""
+import importlib.abc
+import importlib.machinery
+import sys
+import types
+
+NAMESPACES = ("clr", "System", "FlaUI", "FlaUiNative")
+
+
+class _StubType(type):
+    """
+    Metaclass from stubbed .NET types, any static member is another stubbed type.
+    """
+
+    def __getattr__(cls, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _create_type(name)
+
+    def __getitem__(cls, _arguments):
+        return cls
+
+
+class _Stub(metaclass=_StubType):
+    """
+    Instance from a stubbed .NET type, any member is callable and returns another stub.
+    """
+
+    def __init__(self, *_args, **_kwargs):
+        pass
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _Stub()
+
+    def __call__(self, *_args, **_kwargs):
+        return _Stub()
+
+    def __getitem__(self, _key):
+        return _Stub()
+
+    def __iter__(self):
+        return iter(())
+
+    def __or__(self, _other):
+        return self
+
+
+def _create_type(name: str) -> type:
+    """
+    Creates a stubbed .NET type. Exceptions derive from Exception to be usable in except clauses.
+    """
+    if name.endswith("Exception"):
+        return type(name, (Exception,), {})
+
+    return _StubType(name, (_Stub,), {})
+
+
+class _StubModule(types.ModuleType):
+    """
+    Stubbed .NET namespace, types are created on first access and reused afterwards.
+    """
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__path__ = []
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        stub_type = _create_type(name)
+        setattr(self, name, stub_type)
+        return stub_type
+
+
+class _StubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """
+    Import hook which resolves all stubbed namespaces and their sub namespaces.
+    """
+
+    def find_spec(self, fullname, path, target=None):  # pylint: disable=unused-argument
+        """
+        Returns a module spec for stubbed namespaces only.
+        """
+        if fullname.split(".")[0] in NAMESPACES:
+            return importlib.machinery.ModuleSpec(fullname, self, is_package=True)
+        return None
+
+    def create_module(self, spec):
+        """
+        Creates the stubbed namespace.
+        """
+        return _StubModule(spec.name)
+
+    def exec_module(self, module):
+        """
+        Stubbed namespaces have no module code.
+        """
+
+
+def install():
+    """
+    Installs the import hook once. Must be called before FlaUILibrary is imported.
+    """
+    if not any(isinstance(finder, _StubFinder) for finder in sys.meta_path):
+        sys.meta_path.insert(0, _StubFinder())
@@ -0,0 +1,55 @@
+"""
+Import time budget test for FlaUILibrary.
+
+Fails if importing FlaUILibrary or creating the library exceeds its time budget, or if library import or creation
+loads UIA2 or UIA3 assemblies or creates an automation module. Libdoc, dry-runs and suite startup only need the
+keyword names and documentation, automation is created by the first keyword which needs it.
+
+Robot Framework is imported before the measurement because it is already loaded by robot and libdoc. All .NET types
+are replaced by stubs from dotnetstubs.py, so the budget covers only the Python layer.
+
+Usage:
+    python benchmarks/import_budget.py [--import-budget-ms 100] [--init-budget-ms 50] [--repeat 5]
+"""
+import argparse
+import sys
+import timeit
+from keyword_benchmark import ROBOT_MODULES, create_library, measure_import
+
+
+def main():
+    """
+    Checks all budgets and exits with 1 if one of them is exceeded.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--import-budget-ms", type=float, default=100, help="Budget for import in milliseconds")
+    parser.add_argument("--init-budget-ms", type=float, default=50, help="Budget for library creation in milliseconds")
+    parser.add_argument("--repeat", type=int, default=5, help="Amount of runs, best run is compared to budget")
+    args = parser.parse_args()
+
+    # pylint: disable=import-outside-toplevel
+    from FlaUILibrary import pythonnetwrapper
+
+    library = create_library()
+    import_ms = measure_import(args.repeat, "import.flaui_library_without_robot", ROBOT_MODULES)["best_us"] / 1000
+    init_ms = min(timeit.repeat(create_library, number=1, repeat=args.repeat)) * 1000
+
+    failures = []
+    if import_ms > args.import_budget_ms:
+        failures.append(f"Import takes {import_ms:.1f} ms, budget is {args.import_budget_ms:.1f} ms")
+    if init_ms > args.init_budget_ms:
+        failures.append(f"Library creation takes {init_ms:.1f} ms, budget is {args.init_budget_ms:.1f} ms")
+    if library.container.get_created_module() is not None:
+        failures.append("Library creation creates an automation module")
+    if pythonnetwrapper.get_loaded_assemblies():
+        failures.append(f"Library creation loads assemblies {sorted(pythonnetwrapper.get_loaded_assemblies())}")
+
+    print(f"import {import_ms:.1f} ms, library creation {init_ms:.1f} ms")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+"""
+Benchmark suite for the Python keyword layer.
+
+Measures import and construction time from FlaUILibrary, keyword dispatch by DynamicCore and the helpers
+which are called by most keywords like Converter, KeyboardInputConverter, AutomationElement and TreeItemsParser.
+All .NET types are replaced by stubs from dotnetstubs.py and element lookups use the FAKE automation with
+fake_tree.xml, so only the Python layer is measured and results are comparable between releases.
+
+Results are printed per call and can be stored as JSON to track regressions. A previous result file can be
+given as baseline to print the relative change from each benchmark.
+
+Usage:
+    python benchmarks/keyword_benchmark.py [--number 10000] [--repeat 5] [--filter converter]
+                                           [--output results.json] [--baseline previous.json]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from types import SimpleNamespace
+
+BENCHMARK_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIRECTORY = os.path.join(os.path.dirname(BENCHMARK_DIRECTORY), "src")
+FAKE_TREE_FILE = os.path.join(BENCHMARK_DIRECTORY, "fake_tree.xml")
+
+sys.path[0:0] = [BENCHMARK_DIRECTORY, SOURCE_DIRECTORY]
+
+import dotnetstubs  # pylint: disable=wrong-import-position
+
+dotnetstubs.install()
+
+# Screenshot module reads the host name from the Windows environment
+os.environ.setdefault("COMPUTERNAME", platform.node() or "benchmark")
+
+IMPORT_SCRIPT = (
+    "import sys, time\n"
+    f"sys.path[0:0] = [{BENCHMARK_DIRECTORY!r}, {SOURCE_DIRECTORY!r}]\n"
+    "import dotnetstubs, os\n"
+    "os.environ.setdefault('COMPUTERNAME', 'benchmark')\n"
+    "dotnetstubs.install()\n"
+    "{preload}"
+    "start = time.perf_counter()\n"
+    "import FlaUILibrary\n"
+    "print(time.perf_counter() - start)\n"
+)
+
+ROBOT_MODULES = ("robot.libraries.BuiltIn", "robotlibcore")
+
+TEST_LABEL_XPATH = "/Window[@Name='FlaUI WPF Test App']/Tab/TabItem[@Name='Simple Controls']/Text[@Name='Test Label']"
+
+
+class Benchmark:
+    """
+    Benchmark definition from a callable which is measured by timeit.
+    """
+
+    def __init__(self, name: str, setup, scale: float = 1.0):
+        """
+        Creates a benchmark.
+
+        Args:
+            name (str): Unique benchmark name like converter.cast_to_int, prefix is used as group.
+            setup (Callable): Creates the measured callable, not part of the measurement.
+            scale (float): Factor for the amount of calls per run for expensive benchmarks.
+        """
+        self.name = name
+        self.setup = setup
+        self.scale = scale
+
+
+def create_library(**kwargs):
+    """
+    Creates FlaUILibrary from source tree.
+    """
+    from FlaUILibrary import FlaUILibrary  # pylint: disable=import-outside-toplevel
+
+    return FlaUILibrary(**kwargs)
+
+
+def setup_library_init():
+    """
+    Construction from FlaUILibrary with default UIA3 automation.
+    """
+    return create_library
+
+
+def setup_library_init_fake():
+    """
+    Construction from FlaUILibrary with FAKE automation, includes parsing fake_tree.xml.
+    """
+    return lambda: create_library(uia="FAKE", fake_tree=FAKE_TREE_FILE)
+
+
+def setup_dispatch_get_identifier():
+    """
+    Keyword dispatch by DynamicCore without element lookup.
+    """
+    library = create_library()
+    return lambda: library.run_keyword("get_uia_identifier", [])
+
+
+def setup_dispatch_get_keyword_names():
+    """
+    Keyword name listing from DynamicCore as called by Robot on library import.
+    """
+    library = create_library()
+    return library.get_keyword_names
+
+
+def setup_dispatch_element_should_exist():
+    """
+    Keyword dispatch with XPath lookup from the fake element tree.
+    """
+    library = create_library(uia="FAKE", fake_tree=FAKE_TREE_FILE)
+    return lambda: library.run_keyword("element_should_exist", [TEST_LABEL_XPATH])
+
+
+def setup_dispatch_get_name_from_element():
+    """
+    Keyword dispatch with XPath lookup and property read from the fake element tree.
+    """
+    library = create_library(uia="FAKE", fake_tree=FAKE_TREE_FILE)
+    return lambda: library.run_keyword("get_name_from_element", [TEST_LABEL_XPATH])
+
+
+def setup_converter(method_name, value):
+    """
+    Converter cast method by name with a fixed value.
+    """
+    from FlaUILibrary.flaui.util.converter import Converter  # pylint: disable=import-outside-toplevel
+
+    method = getattr(Converter, method_name)
+    return lambda: method(value)
+
+
+def setup_converter_xpath_string():
+    """
+    Converter cast from an AutomationElement to its XPath.
+    """
+    from FlaUILibrary.flaui.util.automationelement import AutomationElement  # pylint: disable=import-outside-toplevel
+
+    return setup_converter("cast_to_xpath_string",
+                           AutomationElement("Ok", "OK", "Button", "/Window[1]/Tab[1]/TabItem[1]/Button[4]"))
+
+
+def setup_keyboard(key_combination):
+    """
+    Conversion from a key combination like s'CTRL+A' or t'Text'.
+    """
+    # pylint: disable=import-outside-toplevel
+    from FlaUILibrary.flaui.util.keyboardinputconverter import KeyboardInputConverter
+
+    return lambda: KeyboardInputConverter.convert_key_combination(key_combination)
+
+
+def setup_automation_element():
+    """
+    AutomationElement construction with AutomationId, Name and ClassName.
+    """
+    from FlaUILibrary.flaui.util.automationelement import AutomationElement  # pylint: disable=import-outside-toplevel
+
+    return lambda: AutomationElement("Ok", "OK", "Button", "/Window[1]/Tab[1]/TabItem[1]/Button[4]")
+
+
+def setup_tree_items_parser_location():
+    """
+    Location parsing from a tree item location string.
+    """
+    from FlaUILibrary.flaui.util.treeitemsparser import TreeItemsParser  # pylint: disable=import-outside-toplevel
+
+    return lambda: TreeItemsParser("N:Parent->I:3->N:Child 7->I:0", "->")
+
+
+def setup_tree_items_parser_create():
+    """
+    Parser lookup for a location string which is already compiled.
+    """
+    from FlaUILibrary.flaui.util.treeitemsparser import TreeItemsParser  # pylint: disable=import-outside-toplevel
+
+    return lambda: TreeItemsParser.create("N:Parent->I:3->N:Child 7->I:0", "->")
+
+
+def setup_tree_items_parser_walk():
+    """
+    Walk from all location steps by name and index through tree items.
+    """
+    from FlaUILibrary.flaui.util.treeitemsparser import TreeItemsParser  # pylint: disable=import-outside-toplevel
+
+    nodes = [SimpleNamespace(Name=f"Node {index}") for index in range(50)]
+    parser = TreeItemsParser("N:Node 49->I:25->N:Node 10->I:0", "->")
+
+    def walk():
+        index = 0
+        while True:
+            parser.get_treeitem(nodes, index)
+            if parser.is_last_element(index):
+                return
+            index += 1
+
+    return walk
+
+
+BENCHMARKS = [
+    Benchmark("init.flaui_library", setup_library_init, 0.01),
+    Benchmark("init.flaui_library_fake", setup_library_init_fake, 0.01),
+    Benchmark("dispatch.get_keyword_names", setup_dispatch_get_keyword_names, 0.01),
+    Benchmark("dispatch.get_uia_identifier", setup_dispatch_get_identifier),
+    Benchmark("dispatch.element_should_exist", setup_dispatch_element_should_exist, 0.1),
+    Benchmark("dispatch.get_name_from_element", setup_dispatch_get_name_from_element, 0.1),
+    Benchmark("converter.cast_to_int", lambda: setup_converter("cast_to_int", "42")),
+    Benchmark("converter.cast_to_string", lambda: setup_converter("cast_to_string", 42)),
+    Benchmark("converter.cast_to_bool", lambda: setup_converter("cast_to_bool", SimpleNamespace(Value=True))),
+    Benchmark("converter.cast_to_timespan", lambda: setup_converter("cast_to_timespan", 1000)),
+    Benchmark("converter.cast_to_xpath_string", setup_converter_xpath_string),
+    Benchmark("keyboard.shortcut", lambda: setup_keyboard("s'CTRL+SHIFT+A'")),
+    Benchmark("keyboard.text", lambda: setup_keyboard("t'Hello FlaUI'")),
+    Benchmark("keyboard.unknown_shortcut", lambda: setup_keyboard("s'CTRL+UNKNOWN'")),
+    Benchmark("automation_element.construct", setup_automation_element),
+    Benchmark("tree_items_parser.location", setup_tree_items_parser_location),
+    Benchmark("tree_items_parser.create", setup_tree_items_parser_create),
+    Benchmark("tree_items_parser.walk", setup_tree_items_parser_walk),
+]
+
+
+def summarize(name: str, number: int, timings):
+    """
+    Creates a result entry in microseconds per call from timings per run.
+    """
+    per_call = [timing / number * 1e6 for timing in timings]
+    return {
+        "name": name,
+        "group": name.split(".", 1)[0],
+        "number": number,
+        "repeat": len(per_call),
+        "best_us": round(min(per_call), 3),
+        "median_us": round(statistics.median(per_call), 3),
+        "mean_us": round(statistics.mean(per_call), 3),
+    }
+
+
+def measure_import(repeat: int, name: str = "import.flaui_library", preload=()):
+    """
+    Measures the import time from FlaUILibrary in a new interpreter per run.
+
+    Args:
+        repeat (int): Amount of runs.
+        name (str): Benchmark name.
+        preload (Tuple): Modules imported before measurement like Robot Framework, which is already loaded by robot.
+    """
+    script = IMPORT_SCRIPT.replace("{preload}", "".join(f"import {module}\n" for module in preload))
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", script],
+                                check=True, capture_output=True, text=True).stdout
+        timings.append(float(output.strip().splitlines()[-1]))
+
+    return summarize(name, 1, timings)
+
+
+def measure(benchmark: Benchmark, number: int, repeat: int):
+    """
+    Measures a benchmark with timeit.
+    """
+    function = benchmark.setup()
+    calls = max(int(number * benchmark.scale), 1)
+    function()
+
+    return summarize(benchmark.name, calls, timeit.repeat(function, number=calls, repeat=repeat))
+
+
+def load_baseline(filepath: str):
+    """
+    Loads best timings by benchmark name from a previous result file.
+    """
+    with open(filepath, "r", encoding="utf-8") as file:
+        return {result["name"]: result["best_us"] for result in json.load(file)["results"]}
+
+
+def main():
+    """
+    Runs all selected benchmarks, prints results and optionally stores them as JSON.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=10000, help="Amount of calls per run for cheap benchmarks")
+    parser.add_argument("--repeat", type=int, default=5, help="Amount of runs per benchmark")
+    parser.add_argument("--filter", default="", help="Only run benchmarks which contain this text in their name")
+    parser.add_argument("--output", help="JSON file to store results")
+    parser.add_argument("--baseline", help="JSON file from a previous run to compare best timings")
+    args = parser.parse_args()
+
+    from FlaUILibrary import version  # pylint: disable=import-outside-toplevel
+
+    baseline = load_baseline(args.baseline) if args.baseline else {}
+    results = []
+
+    if args.filter in "import.flaui_library":
+        results.append(measure_import(args.repeat))
+
+    if args.filter in "import.flaui_library_without_robot":
+        results.append(measure_import(args.repeat, "import.flaui_library_without_robot", ROBOT_MODULES))
+
+    for benchmark in BENCHMARKS:
+        if args.filter in benchmark.name:
+            results.append(measure(benchmark, args.number, args.repeat))
+
+    for result in results:
+        line = f"{result['name']:<36} {result['best_us']:12.3f} us {result['median_us']:12.3f} us median"
+        if result["name"] in baseline and baseline[result["name"]] > 0:
+            line += f" {(result['best_us'] / baseline[result['name']] - 1) * 100:+8.1f} %"
+        print(line)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump({
+                "version": version.VERSION,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "results": results,
+            }, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 # pylint: disable=invalid-name
+import os
 from enum import Enum
 from robot.libraries.BuiltIn import BuiltIn
 from robotlibcore import DynamicCore
@@ -26,9 +27,11 @@ from FlaUILibrary.flaui.interface.valuecontainer import ValueContainer
 from FlaUILibrary.robotframework import robotlog
 from FlaUILibrary.flaui.module.screenshot import Screenshot
 from FlaUILibrary.flaui.util.automationinterfacecontainer import AutomationInterfaceContainer
+from FlaUILibrary.flaui.util.locatorstore import LocatorStore
 
 
 # pylint: enable=invalid-name
+# pylint: disable=too-many-instance-attributes
 class FlaUILibrary(DynamicCore):
     """
     FlaUILibrary is a Robot Framework library for automating Windows GUI.
@@ -134,16 +137,33 @@ class FlaUILibrary(DynamicCore):
                  screenshot_dir=None,
                  timeout=1000,
                  screenshot_mode='FILE',
-                 screenshot_suffix='jpg'):
+                 screenshot_suffix='jpg',
+                 performance_statistics_file=None,
+                 locator_statistics_report=None,
+                 locator_store=None,
+                 fake_tree=None):
         """
         FlaUiLibrary can be imported by following optional arguments:
 
-        ``uia`` Microsoft UI-Automation framework to use. UIA2 or UIA3
+        ``uia`` Microsoft UI-Automation framework to use. UIA2 or UIA3, FAKE to use the element tree from ``fake_tree``
         ``screenshot_on_failure`` indicator to disable or enable screenshot feature.
         ``screenshot_dir`` is the directory where screenshots are saved.
         ``timeout`` maximum amount of waiting time in ms for an element find action. Default value is 1000ms.
         ``screenshot_mode`` screenshot mode how to persist screenshots as FILE or BASE64
         ``screenshot_suffix`` screenshot file type and suffix for screenshots saved as FILE
+        ``performance_statistics_file`` JSON file name to store action timing statistics at the end of each suite,
+        see `Get FlaUI Performance Statistics`. Relative paths are stored in the output directory of the Robot run.
+        ``locator_statistics_report`` file name without suffix to store a ranked CSV and JSON report from XPath lookup
+        times at the end of the run, see `Get FlaUI Locator Statistics`. Stored in the output directory of the Robot
+        run.
+        ``locator_store`` JSON file to remember the resolved element path from each XPath for the next runs.
+        Elements are searched by the remembered path first and by the XPath if the path does not match anymore.
+        Only XPaths whose steps contain control types, AutomationId, Name, ClassName or HelpText predicates are
+        remembered, so the element and its ancestors can be verified against each step.
+        Relative paths are stored in the output directory of the Robot run.
+        ``fake_tree`` XML or JSON file with a synthetic element tree for uia=FAKE to run keywords without UI Automation,
+        e.g. for benchmarks. Tags are control types and attributes are properties like
+        <Desktop><Window Name="App"><Button Name="OK"/></Window></Desktop>.
 
         If the given directory does not already exist, it will be created when the first screenshot is taken.
         If the argument is not given, the default location for screenshots is the output directory of the Robot run,
@@ -159,10 +179,14 @@ class FlaUILibrary(DynamicCore):
         except ValueError:
             timeout = 1000
 
-        if uia not in ("UIA2", "UIA3"):
+        if uia not in ("UIA2", "UIA3") and not (uia == "FAKE" and fake_tree):
             uia = "UIA3"
 
-        self.container = AutomationInterfaceContainer(uia, timeout)
+        self.locator_store = LocatorStore(os.path.join(robotlog.get_log_directory(), locator_store)) \
+            if locator_store else None
+        self.container = AutomationInterfaceContainer(uia, timeout, self.locator_store, fake_tree)
+        self.performance_statistics_file = performance_statistics_file
+        self.locator_statistics_report = locator_statistics_report
 
         self.keyword_modules = {
             FlaUILibrary.KeywordModules.APPLICATION: ApplicationKeywords(self.container),
@@ -196,5 +220,27 @@ class FlaUILibrary(DynamicCore):
         DynamicCore.__init__(self, self.libraries)
 
     def _start_test(self, name, attrs):  # pylint: disable=unused-argument
-        self.container.create_or_get_module().action(Screenshot.Action.SET_NAME,
-                                                     Screenshot.create_value_container(name=name))
+        self.container.set_module_setting(Screenshot.Action.SET_NAME, Screenshot.create_value_container(name=name))
+
+    def _end_test(self, name, attrs):  # pylint: disable=unused-argument
+        self._flush_screenshots()
+
+    def _end_suite(self, name, attrs):  # pylint: disable=unused-argument
+        if self.performance_statistics_file:
+            self.container.create_or_get_module().write_performance_statistics(
+                os.path.join(robotlog.get_log_directory(), self.performance_statistics_file))
+
+    def _close(self):
+        self._flush_screenshots()
+
+        if self.locator_statistics_report:
+            self.container.create_or_get_module().write_locator_statistics(
+                os.path.join(robotlog.get_log_directory(), self.locator_statistics_report))
+
+        if self.locator_store:
+            self.locator_store.save()
+
+    def _flush_screenshots(self):
+        module = self.container.get_created_module()
+        if module is not None:
+            module.action(Screenshot.Action.FLUSH)
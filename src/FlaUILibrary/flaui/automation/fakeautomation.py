@@ -0,0 +1,670 @@
+import json
+import os
+import xml.etree.ElementTree as ElementTree
+from typing import Any, Callable, Dict, List, Optional
+
+
+class FakeValue:
+    """
+    Property value in the same shape as FlaUI AutomationProperty.
+    """
+
+    def __init__(self, value: Any):
+        self.Value = value  # pylint: disable=invalid-name
+        self.ValueOrDefault = value  # pylint: disable=invalid-name
+        self.IsSupported = value is not None  # pylint: disable=invalid-name
+
+
+class FakeControlType:
+    """
+    Control type which prints its name like the FlaUI ControlType enumeration.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def ToString(self) -> str:  # pylint: disable=invalid-name
+        """
+        Returns the control type name like Button.
+        """
+        return self._name
+
+    def __str__(self) -> str:
+        return self._name
+
+    def __eq__(self, other) -> bool:
+        return str(other) == self._name
+
+    def __hash__(self) -> int:
+        return hash(self._name)
+
+
+class FakeRectangle:
+    """
+    Bounding rectangle from a fake element.
+    """
+
+    def __init__(self, x: int = 0, y: int = 0, width: int = 0, height: int = 0):
+        # pylint: disable=invalid-name
+        self.X = x
+        self.Y = y
+        self.Width = width
+        self.Height = height
+        self.Left = x
+        self.Top = y
+        self.Right = x + width
+        self.Bottom = y + height
+        self.IsEmpty = width == 0 or height == 0
+
+
+class FakePattern:
+    """
+    Pattern from a fake element which is supported if the element declares its state attribute.
+    Pattern methods change the element state.
+    """
+
+    def __init__(self, element: "FakeElement", is_supported: bool):
+        self._element = element
+        self.IsSupported = is_supported  # pylint: disable=invalid-name
+        self.Pattern = self  # pylint: disable=invalid-name
+
+    def Invoke(self) -> None:  # pylint: disable=invalid-name
+        """
+        Invokes the element, counted by attribute InvokeCount.
+        """
+        self._element.set_property("InvokeCount", str(int(self._element.get_property("InvokeCount") or 0) + 1))
+
+    def Toggle(self) -> None:  # pylint: disable=invalid-name
+        """
+        Toggles between On and Off.
+        """
+        self._element.set_property("ToggleState", "Off" if self._element.get_property("ToggleState") == "On" else "On")
+
+    def SetValue(self, value: str) -> None:  # pylint: disable=invalid-name
+        """
+        Sets attribute Value.
+        """
+        self._element.set_property("Value", value)
+
+    def Expand(self) -> None:  # pylint: disable=invalid-name
+        """
+        Sets attribute ExpandCollapseState to Expanded.
+        """
+        self._element.set_property("ExpandCollapseState", "Expanded")
+
+    def Collapse(self) -> None:  # pylint: disable=invalid-name
+        """
+        Sets attribute ExpandCollapseState to Collapsed.
+        """
+        self._element.set_property("ExpandCollapseState", "Collapsed")
+
+    def Select(self) -> None:  # pylint: disable=invalid-name
+        """
+        Sets attribute IsSelected to true.
+        """
+        self._element.set_property("IsSelected", "true")
+
+    def __getattr__(self, name: str) -> Any:
+        return FakeValue(self._element.get_typed_property(name))
+
+
+class FakePatterns:
+    """
+    Pattern collection from a fake element like FlaUI FrameworkAutomationElementBase.Patterns.
+    """
+
+    # Attributes which declare a pattern as supported
+    _STATE_ATTRIBUTES = {
+        "Invoke": None,
+        "Toggle": "ToggleState",
+        "Value": "Value",
+        "ExpandCollapse": "ExpandCollapseState",
+        "SelectionItem": "IsSelected",
+    }
+
+    def __init__(self, element: "FakeElement"):
+        self._element = element
+
+    def __getattr__(self, name: str) -> FakePattern:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        attribute = self._STATE_ATTRIBUTES.get(name, name)
+        is_supported = self._element.get_property(attribute) is not None if attribute else \
+            self._element.control_type in ("Button", "MenuItem", "Hyperlink", "SplitButton")
+        return FakePattern(self._element, is_supported)
+
+
+class FakeProperties:
+    """
+    Property collection from a fake element like FlaUI FrameworkAutomationElementBase.Properties.
+    """
+
+    def __init__(self, element: "FakeElement"):
+        self._element = element
+
+    def __getattr__(self, name: str) -> FakeValue:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        if name == "RuntimeId":
+            return FakeValue(list(self._element.runtime_id))
+
+        if name == "ControlType":
+            return FakeValue(self._element.ControlType)
+
+        return FakeValue(self._element.get_typed_property(name))
+
+
+class FakeEventHandler:
+    """
+    Registered event handler which is removed by Dispose like FlaUI event handler objects.
+    """
+
+    def __init__(self, handlers: List[Callable[..., None]], callback: Callable[..., None]):
+        self._handlers = handlers
+        self._callback = callback
+        handlers.append(callback)
+
+    def Dispose(self) -> None:  # pylint: disable=invalid-name
+        """
+        Removes the event handler.
+        """
+        if self._callback in self._handlers:
+            self._handlers.remove(self._callback)
+
+
+class FakeElement:
+    """
+    Automation element from a synthetic user interface tree.
+
+    Provides the subset from the FlaUI AutomationElement interface which is used by the library modules, so
+    the Python layer can be executed without UI Automation. The control type is the XML tag and properties
+    are XML attributes like Name, AutomationId, ClassName, IsEnabled or BoundingRectangle='x,y,width,height'.
+    XPath lookups are evaluated by ElementTree, which supports child and descendant steps, positions and
+    attribute predicates.
+    """
+
+    # pylint: disable=invalid-name
+
+    def __init__(self, automation: "FakeAutomation", node: ElementTree.Element, runtime_id: tuple):
+        self._automation = automation
+        self._node = node
+        self.runtime_id = runtime_id
+        self.Properties = FakeProperties(self)
+        self.Patterns = FakePatterns(self)
+        self.FrameworkAutomationElement = self
+        self.Automation = automation
+
+    @property
+    def control_type(self) -> str:
+        """
+        Control type name from XML tag.
+        """
+        return self._node.tag
+
+    @property
+    def ControlType(self) -> FakeControlType:
+        """
+        Control type like FlaUI ControlType enumeration.
+        """
+        return FakeControlType(self._node.tag)
+
+    @property
+    def Name(self) -> str:
+        """
+        Name property.
+        """
+        return self.get_property("Name") or ""
+
+    @property
+    def AutomationId(self) -> str:
+        """
+        AutomationId property.
+        """
+        return self.get_property("AutomationId") or ""
+
+    @property
+    def ClassName(self) -> str:
+        """
+        ClassName property.
+        """
+        return self.get_property("ClassName") or ""
+
+    @property
+    def HelpText(self) -> str:
+        """
+        HelpText property.
+        """
+        return self.get_property("HelpText") or ""
+
+    @property
+    def IsEnabled(self) -> bool:
+        """
+        IsEnabled property, true if not declared.
+        """
+        return self.get_property("IsEnabled") != "false"
+
+    @property
+    def IsOffscreen(self) -> bool:
+        """
+        IsOffscreen property, false if not declared.
+        """
+        return self.get_property("IsOffscreen") == "true"
+
+    @property
+    def BoundingRectangle(self) -> FakeRectangle:
+        """
+        Bounding rectangle from attribute BoundingRectangle='x,y,width,height'.
+        """
+        value = self.get_property("BoundingRectangle")
+        return FakeRectangle(*[int(part) for part in value.split(",")]) if value else FakeRectangle()
+
+    @property
+    def Parent(self) -> Optional["FakeElement"]:
+        """
+        Parent element or None for desktop.
+        """
+        return self._automation.get_parent(self)
+
+    def get_property(self, name: str) -> Optional[str]:
+        """
+        Returns the raw attribute value or None if not declared.
+
+        Args:
+            name (str): Property name.
+        """
+        return self._node.get(name)
+
+    def get_typed_property(self, name: str) -> Any:
+        """
+        Returns the attribute value with true and false converted to bool.
+
+        Args:
+            name (str): Property name.
+        """
+        value = self.get_property(name)
+        return {"true": True, "false": False}.get(value, value)
+
+    def set_property(self, name: str, value: str) -> None:
+        """
+        Changes an attribute and notifies property changed event handlers.
+
+        Args:
+            name (str): Property name.
+            value (str): New value.
+        """
+        self._node.set(name, value)
+        self._automation.notify_property_changed(self, name, value)
+
+    def FindFirstByXPath(self, xpath: str) -> Optional["FakeElement"]:
+        """
+        Finds the first element by XPath relative to this element.
+        """
+        elements = self.FindAllByXPath(xpath)
+        return elements[0] if elements else None
+
+    def FindAllByXPath(self, xpath: str) -> List["FakeElement"]:
+        """
+        Finds all elements by XPath relative to this element.
+        Unsupported XPath syntax returns no elements like an XPath which does not match.
+        """
+        try:
+            nodes = self._node.findall(FakeAutomation.to_element_tree_path(xpath))
+        except (SyntaxError, KeyError):
+            return []
+
+        return [self._automation.get_element(node) for node in nodes]
+
+    def FindAllChildren(self) -> List["FakeElement"]:
+        """
+        Returns all child elements.
+        """
+        return [self._automation.get_element(node) for node in self._node]
+
+    def FindFirstChild(self) -> Optional["FakeElement"]:
+        """
+        Returns the first child element.
+        """
+        children = self.FindAllChildren()
+        return children[0] if children else None
+
+    def FindFirst(self, _scope: Any, _condition: Any) -> Optional["FakeElement"]:
+        """
+        Native conditions can not be evaluated on fake elements, UIAFake disables native condition searches.
+        """
+        raise NotImplementedError("Fake elements do not support UI Automation conditions")
+
+    def Focus(self) -> None:
+        """
+        Focuses the element.
+        """
+        self._automation.focused_element = self
+
+    def Click(self, _move_mouse: bool = False) -> None:
+        """
+        Clicks the element, counted by attribute ClickCount.
+        """
+        self.set_property("ClickCount", str(int(self.get_property("ClickCount") or 0) + 1))
+
+    def GetClickablePoint(self) -> FakeRectangle:
+        """
+        Returns the center from the bounding rectangle as point.
+        """
+        rectangle = self.BoundingRectangle
+        return FakeRectangle(rectangle.X + rectangle.Width // 2, rectangle.Y + rectangle.Height // 2)
+
+    def RegisterStructureChangedEvent(self, _scope: Any, callback: Callable[..., None]) -> FakeEventHandler:
+        """
+        Registers a structure changed event handler.
+        """
+        return FakeEventHandler(self._automation.structure_handlers, callback)
+
+    def RegisterPropertyChangedEvent(self, _scope: Any, callback: Callable[..., None], *_ids: Any) -> FakeEventHandler:
+        """
+        Registers a property changed event handler.
+        """
+        return FakeEventHandler(self._automation.property_handlers, callback)
+
+    def GetUpdatedCache(self) -> "FakeElement":
+        """
+        Fake elements always return current values, so the cache is the element itself.
+        """
+        return self
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, FakeElement) and other.runtime_id == self.runtime_id
+
+    def __hash__(self) -> int:
+        return hash(self.runtime_id)
+
+    def __repr__(self) -> str:
+        return f"FakeElement({self._node.tag}, {dict(self._node.attrib)})"
+
+
+class FakeXPathLookup:  # pylint: disable=invalid-name
+    """
+    XPath lookups for fake elements in the same shape as SafeXPath from pythonnetwrapper.
+    """
+
+    @staticmethod
+    def FindFirstByXPath(element: FakeElement, xpath: str) -> Optional[FakeElement]:
+        """
+        Finds the first element by XPath relative to element.
+        """
+        return element.FindFirstByXPath(xpath)
+
+    @staticmethod
+    def FindAllByXPath(element: FakeElement, xpath: str) -> List[FakeElement]:
+        """
+        Finds all elements by XPath relative to element.
+        """
+        return element.FindAllByXPath(xpath)
+
+
+class FakeTreeWalker:
+    """
+    Tree walker over fake elements.
+    """
+
+    def __init__(self, automation: "FakeAutomation"):
+        self._automation = automation
+
+    def GetParent(self, element: FakeElement) -> Optional[FakeElement]:  # pylint: disable=invalid-name
+        """
+        Returns the parent element or None for desktop.
+        """
+        return self._automation.get_parent(element)
+
+
+class FakeTreeWalkerFactory:
+    """
+    Tree walker factory from fake automation.
+    """
+
+    def __init__(self, automation: "FakeAutomation"):
+        self._walker = FakeTreeWalker(automation)
+
+    def GetControlViewWalker(self) -> FakeTreeWalker:  # pylint: disable=invalid-name
+        """
+        Returns the tree walker.
+        """
+        return self._walker
+
+    def GetRawViewWalker(self) -> FakeTreeWalker:  # pylint: disable=invalid-name
+        """
+        Returns the tree walker.
+        """
+        return self._walker
+
+
+class FakePropertyLibrary:
+    """
+    Property identifiers from fake automation are the property names.
+    """
+
+    def __init__(self):
+        self.Element = self  # pylint: disable=invalid-name
+
+    def __getattr__(self, name: str) -> str:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return name
+
+
+class FakeAutomation:
+    """
+    Automation object over a synthetic element tree in the same shape as FlaUI UIA3Automation.
+
+    Trees are loaded from XML where each tag is a control type and attributes are properties:
+    | <Desktop><Window Name="App"><Button Name="OK" AutomationId="Ok"/></Window></Desktop> |
+    Or from JSON with ControlType, properties and Children:
+    | {"ControlType": "Desktop", "Children": [{"ControlType": "Window", "Name": "App"}]} |
+    """
+
+    # pylint: disable=invalid-name
+
+    def __init__(self, root: ElementTree.Element):
+        """
+        Creates a fake automation.
+
+        Args:
+            root (Element): ElementTree root which represents the desktop.
+        """
+        self._root = root
+        self._elements: Dict[int, FakeElement] = {}
+        self._parents: Dict[int, ElementTree.Element] = {}
+        self._next_runtime_id = 0
+        self.focused_element = None
+        self.structure_handlers: List[Callable[..., None]] = []
+        self.property_handlers: List[Callable[..., None]] = []
+        self.TreeWalkerFactory = FakeTreeWalkerFactory(self)
+        self.PropertyLibrary = FakePropertyLibrary()
+        self._index_parents(root)
+
+    @staticmethod
+    def from_file(filepath: str) -> "FakeAutomation":
+        """
+        Loads a fake automation from an XML or JSON file, chosen by file suffix.
+
+        Args:
+            filepath (str): Path to .xml or .json file.
+        """
+        if os.path.splitext(filepath)[1].lower() == ".json":
+            with open(filepath, "r", encoding="utf-8") as file:
+                return FakeAutomation.from_dict(json.load(file))
+
+        return FakeAutomation(ElementTree.parse(filepath).getroot())
+
+    @staticmethod
+    def from_string(xml: str) -> "FakeAutomation":
+        """
+        Creates a fake automation from an XML string.
+
+        Args:
+            xml (str): XML tree with desktop as root element.
+        """
+        return FakeAutomation(ElementTree.fromstring(xml))
+
+    @staticmethod
+    def from_dict(tree: Dict[str, Any]) -> "FakeAutomation":
+        """
+        Creates a fake automation from a dictionary with ControlType, properties and Children.
+
+        Args:
+            tree (Dict): Desktop element.
+        """
+        def create_node(values: Dict[str, Any]) -> ElementTree.Element:
+            node = ElementTree.Element(values.get("ControlType", "Custom"),
+                                       {key: FakeAutomation._to_attribute(value) for (key, value) in values.items()
+                                        if key not in ("ControlType", "Children")})
+            node.extend(create_node(child) for child in values.get("Children", []))
+            return node
+
+        return FakeAutomation(create_node(tree))
+
+    def GetDesktop(self) -> FakeElement:
+        """
+        Returns the root element.
+        """
+        return self.get_element(self._root)
+
+    def FocusedElement(self) -> Optional[FakeElement]:
+        """
+        Returns the focused element.
+        """
+        return self.focused_element
+
+    def Dispose(self) -> None:
+        """
+        Nothing to release for fake automation.
+        """
+
+    def get_element(self, node: ElementTree.Element) -> FakeElement:
+        """
+        Returns the element from a tree node, the same node always returns the same element.
+
+        Args:
+            node (Element): ElementTree node.
+        """
+        element = self._elements.get(id(node))
+        if element is None:
+            self._next_runtime_id += 1
+            element = FakeElement(self, node, (42, self._next_runtime_id))
+            self._elements[id(node)] = element
+
+        return element
+
+    def get_parent(self, element: FakeElement) -> Optional[FakeElement]:
+        """
+        Returns the parent element or None for desktop.
+
+        Args:
+            element (FakeElement): Child element.
+        """
+        parent = self._parents.get(id(element._node))  # pylint: disable=protected-access
+        return self.get_element(parent) if parent is not None else None
+
+    def add_element(self, parent: FakeElement, xml: str) -> FakeElement:
+        """
+        Adds an element from XML below a parent and notifies structure changed event handlers.
+
+        Args:
+            parent (FakeElement): Parent element.
+            xml (str): XML from new element.
+        """
+        node = ElementTree.fromstring(xml)
+        parent._node.append(node)  # pylint: disable=protected-access
+        self._parents[id(node)] = parent._node  # pylint: disable=protected-access
+        self._index_parents(node)
+        element = self.get_element(node)
+        self._notify(self.structure_handlers, element, None, None)
+        return element
+
+    def remove_element(self, element: FakeElement) -> None:
+        """
+        Removes an element and notifies structure changed event handlers.
+
+        Args:
+            element (FakeElement): Element to remove.
+        """
+        parent = self._parents.pop(id(element._node), None)  # pylint: disable=protected-access
+        if parent is not None:
+            parent.remove(element._node)  # pylint: disable=protected-access
+            self._notify(self.structure_handlers, self.get_element(parent), None, None)
+
+    def notify_property_changed(self, element: FakeElement, name: str, value: Any) -> None:
+        """
+        Notifies property changed event handlers.
+
+        Args:
+            element (FakeElement): Changed element.
+            name (str): Property name.
+            value (Object): New value.
+        """
+        self._notify(self.property_handlers, element, name, value)
+
+    @staticmethod
+    def to_element_tree_path(xpath: str) -> str:
+        """
+        Converts a FlaUI XPath relative to a search root to an ElementTree path.
+        Leading / selects children and // descendants from the search root. Predicates combined by 'and'
+        are converted to consecutive predicates.
+
+        Args:
+            xpath (str): XPath like //Button[@Name='OK' and @AutomationId='Ok'].
+        """
+        path = "." + xpath if xpath.startswith("/") else xpath
+        result = ""
+        quote = None
+        depth = 0
+        index = 0
+
+        while index < len(path):
+            char = path[index]
+            if quote:
+                if char == quote:
+                    quote = None
+            elif char in ("'", '"'):
+                quote = char
+            elif char == "[":
+                depth += 1
+            elif char == "]":
+                depth -= 1
+            elif depth > 0 and path.startswith(" and ", index):
+                result += "]["
+                index += len(" and ")
+                continue
+            result += char
+            index += 1
+
+        return result
+
+    def _index_parents(self, node: ElementTree.Element) -> None:
+        """
+        Stores the parent from each node below node.
+        """
+        for child in node:
+            self._parents[id(child)] = node
+            self._index_parents(child)
+
+    @staticmethod
+    def _notify(handlers: List[Callable[..., None]], *args: Any) -> None:
+        """
+        Calls all registered event handlers.
+        """
+        for handler in list(handlers):
+            handler(*args)
+
+    @staticmethod
+    def _to_attribute(value: Any) -> str:
+        """
+        Converts a JSON value to an XML attribute string.
+        """
+        if isinstance(value, bool):
+            return "true" if value else "false"
+
+        if isinstance(value, (list, tuple)):
+            return ",".join(str(part) for part in value)
+
+        return str(value)
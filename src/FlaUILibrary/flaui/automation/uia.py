@@ -1,8 +1,9 @@
 from abc import ABC
-from typing import Any
+from typing import Any, Callable, Dict, List, Optional
 from enum import Enum
 from FlaUI.Core.AutomationElements import AutomationElementExtensions  # pylint: disable=import-error
 from FlaUILibrary.flaui.enum.interfacetype import InterfaceType
+from FlaUILibrary.flaui.interface.moduleinterface import ModuleInterface
 from FlaUILibrary.flaui.interface.valuecontainer import ValueContainer
 from FlaUILibrary.flaui.interface.windowsautomationinterface import WindowsAutomationInterface
 from FlaUILibrary.flaui.exception.flauierror import FlaUiError
@@ -23,17 +24,42 @@ from FlaUILibrary.flaui.module.textbox import Textbox
 from FlaUILibrary.flaui.module.tooglebutton import ToggleButton
 from FlaUILibrary.flaui.module.tab import Tab
 from FlaUILibrary.flaui.module.window import Window
+from FlaUILibrary.flaui.util.locatorstatistics import LocatorStatistics
+from FlaUILibrary.flaui.util.locatorstore import LocatorStore
+from FlaUILibrary.flaui.util.performancestatistics import PerformanceStatistics
+from FlaUILibrary.pythonnetwrapper import SafeXPath
 
 class UIA(WindowsAutomationInterface, ABC):
     """
     Generic window automation module for a centralized communication handling between robot keywords.
     """
 
-    def __init__(self):
+    # Actions which walk the element tree, their time is recorded as element resolution phase.
+    ELEMENT_RESOLUTION_ACTIONS = frozenset([
+        Element.Action.GET_ELEMENT,
+        Element.Action.GET_ELEMENT_BY_XPATH,
+        Element.Action.FIND_ONE_ELEMENT,
+        Element.Action.FIND_ALL_ELEMENTS,
+        Element.Action.ELEMENT_SHOULD_EXIST,
+        Element.Action.ELEMENT_SHOULD_NOT_EXIST,
+        Element.Action.WAIT_UNTIL_ELEMENT_EXIST,
+        Element.Action.WAIT_UNTIL_ELEMENT_DOES_NOT_EXIST,
+    ])
+
+    def __init__(self, locator_store: Optional[LocatorStore] = None):
         """
         Creates default UIA window automation module.
+
+        Args:
+            locator_store (LocatorStore): Optional persistent store from concrete XPaths resolved by previous runs.
         """
         self._actions = {}
+        self._modules: Dict[type, ModuleInterface] = {}
+        self._module_factories: Dict[type, Callable[[], ModuleInterface]] = {}
+        self._unsupported_action = lambda _: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported)
+        self._statistics = PerformanceStatistics()
+        self._locator_statistics = LocatorStatistics()
+        self._locator_store = locator_store
 
     def action(self, action: Enum, values: ValueContainer = None, msg: str = None):
         """
@@ -49,55 +75,164 @@ class UIA(WindowsAutomationInterface, ABC):
             FlaUiError: If execute action throws a Flaui error.
             FlaUiError: If action is not supported.
         """
-        try:
-            if action in self._actions:
-                return self._actions[action].execute_action(action, values)
+        if action in self.ELEMENT_RESOLUTION_ACTIONS:
+            phase = PerformanceStatistics.ELEMENT_RESOLUTION
+        else:
+            phase = PerformanceStatistics.ACTION
+            if not isinstance(action, Tree.Action):
+                self._invalidate_tree_snapshots()
 
-            raise FlaUiError(FlaUiError.ActionNotSupported)
+        try:
+            with self._statistics.measure(action.value, phase):
+                return self._actions.get(action, self._unsupported_action)(values)
 
         except FlaUiError as error:
-            self._actions[Screenshot.Action.CAPTURE].execute_action(Screenshot.Action.CAPTURE,
-                                                                    Screenshot.create_value_container())
+            with self._statistics.measure_screenshot(action.value):
+                self._actions[Screenshot.Action.CAPTURE](Screenshot.create_value_container())
 
             raise FlaUiError(msg) if msg is not None else error
 
-    def register_action(self, automation: Any, retry_timeout_in_milliseconds: int):
+    def _invalidate_tree_snapshots(self) -> None:
+        """
+        Marks snapshots from tree controls as outdated before an action from another module is performed,
+        because the action could change the user interface, e.g. expand a tree item by mouse or keyboard input.
+        Element resolution actions are read-only and keep the snapshots.
+        """
+        tree = self._modules.get(Tree)
+        if tree is not None:
+            tree.execute_action(Tree.Action.INVALIDATE_SNAPSHOTS, None)
+
+    def register_action(self,
+                        automation: Any,
+                        retry_timeout_in_milliseconds: int,
+                        xpath_lookup: Any = SafeXPath,
+                        native_conditions: bool = True):
         """
         Register all supported core actions.
+        Modules are created on first usage from one of their actions. Afterwards action handlers from the module
+        are resolved once, so dispatching an action is a single lookup.
 
         Args:
             automation (Object)             : Windows user automation object from uia2 or uia3 interface.
             retry_timeout_in_milliseconds (Number):
               Timeout in milliseconds for automatic retry if element could not be found.
+            xpath_lookup (Object)           : XPath lookups for elements from automation, see Element.
+            native_conditions (Boolean)     : False if elements from automation do not support native conditions.
+        """
+        self._module_factories = {
+            Application: Application,
+            Debug: Debug,
+            Element: lambda: Element(automation=automation,
+                                     retry_timeout_in_milliseconds=retry_timeout_in_milliseconds,
+                                     locator_statistics=self._locator_statistics,
+                                     application_provider=lambda: self._load_module(Application).execute_action(
+                                         Application.Action.GET_ACTIVE_APPLICATION, None),
+                                     locator_store=self._locator_store,
+                                     xpath_lookup=xpath_lookup,
+                                     native_conditions=native_conditions),
+            Keyboard: Keyboard,
+            Selector: Selector,
+            Grid: Grid,
+            Mouse: lambda: Mouse(uia=self),
+            Textbox: Textbox,
+            Tree: Tree,
+            Checkbox: Checkbox,
+            Tab: Tab,
+            Window: Window,
+            Combobox: Combobox,
+            Property: Property,
+            ToggleButton: ToggleButton,
+            Button: Button,
+            Screenshot: lambda: Screenshot(automation=automation)
+        }
+
+        for module_class in self._module_factories:
+            for value in module_class.Action:
+                self._actions[value] = self._create_module_loader(module_class, value)
+
+    def _create_module_loader(self, module_class: type, action: Enum) -> Callable[[Any], Any]:
+        """
+        Creates a handler which creates the module on first usage and performs the action afterwards.
+
+        Args:
+            module_class (Type): Module class from action.
+            action (Action)    : Action to perform after module creation.
+        """
+        def load_module_and_execute(values: Any) -> Any:
+            self._load_module(module_class)
+            return self._actions[action](values)
+
+        return load_module_and_execute
+
+    def _load_module(self, module_class: type) -> ModuleInterface:
+        """
+        Returns module by class and creates it on first usage.
+        Action handlers from the created module replace the module loaders from all its actions.
+
+        Args:
+            module_class (Type): Module class to create.
+        """
+        module = self._modules.get(module_class)
+        if module is None:
+            module = self._module_factories[module_class]()
+            self._modules[module_class] = module
+
+            handlers = module.get_action_handlers()
+            for value in module_class.Action:
+                self._actions[value] = handlers.get(value, self._unsupported_action)
+
+        return module
+
+    def get_performance_statistics(self) -> Dict[str, Any]:
+        """
+        Returns timing statistics from all performed actions split into element resolution, retries,
+        action and failure screenshot phases. See PerformanceStatistics.get_statistics for the format.
+        """
+        return self._statistics.get_statistics()
+
+    def reset_performance_statistics(self) -> None:
+        """
+        Removes all collected timing statistics.
+        """
+        self._statistics.reset()
+
+    def write_performance_statistics(self, filepath: str) -> None:
+        """
+        Writes timing statistics from all performed actions as JSON file.
+
+        Args:
+            filepath (String): Destination file path.
+        """
+        self._statistics.write_json(filepath)
+
+    def get_locator_statistics(self) -> List[Dict[str, Any]]:
+        """
+        Returns lookup statistics from each XPath ranked by total lookup time.
+        See LocatorStatistics.get_report for the format.
+        """
+        return self._locator_statistics.get_report()
+
+    def reset_locator_statistics(self) -> None:
+        """
+        Removes all collected lookup statistics.
+        """
+        self._locator_statistics.reset()
+
+    def write_locator_statistics(self, filepath: str) -> None:
+        """
+        Writes ranked lookup statistics from each XPath as CSV and JSON file.
+
+        Args:
+            filepath (String): Destination file path without suffix, .csv and .json will be appended.
         """
-        modules = [
-            Application(),
-            Debug(),
-            Element(automation=automation, retry_timeout_in_milliseconds=retry_timeout_in_milliseconds),
-            Keyboard(),
-            Selector(),
-            Grid(),
-            Mouse(uia=self),
-            Textbox(),
-            Tree(),
-            Checkbox(),
-            Tab(),
-            Window(),
-            Combobox(),
-            Property(),
-            ToggleButton(),
-            Button(),
-            Screenshot()
-        ]
-
-        for module in modules:
-            for value in module.Action:
-                self._actions[value] = module
+        self._locator_statistics.write_csv(filepath + ".csv")
+        self._locator_statistics.write_json(filepath + ".json")
 
     def get_element(self,
                     identifier: str,
                     ui_type:InterfaceType = None,
-                    msg: str = None):
+                    msg: str = None,
+                    root: str = None):
         """
         Get element from identifier.
 
@@ -105,9 +240,10 @@ class UIA(WindowsAutomationInterface, ABC):
             identifier (String)          : XPath identifier to find element
             ui_type (Enum)               : Object enum to cast element
             msg (String)                 : Custom error message
+            root (String)                : Optional name from registered search root, by default active search root
         """
         element = self.action(Element.Action.GET_ELEMENT,
-                              Element.Container(xpath=identifier, retries=None, name=None),
+                              Element.Container(xpath=identifier, retries=None, name=None, root=root),
                               msg)
 
         if not ui_type:
@@ -1,19 +1,27 @@
-from FlaUI.UIA2 import UIA2Automation  # pylint: disable=import-error
+from typing import Optional
+from FlaUILibrary.pythonnetwrapper import load_assemblies
 from FlaUILibrary.flaui.automation.uia import UIA
+from FlaUILibrary.flaui.util.locatorstore import LocatorStore
 
 
 class UIA2(UIA):
     """UIA2 window automation module for a centralized communication handling between robot keywords and Flaui. """
 
-    def __init__(self, retry_timeout_in_milliseconds: int):
+    def __init__(self, retry_timeout_in_milliseconds: int, locator_store: Optional[LocatorStore] = None):
         """
         Creates UIA2 window automation module.
 
         Args:
             retry_timeout_in_milliseconds (Number):
               Timeout in milliseconds for automatic retry if element could not be found.
+            locator_store (LocatorStore): Optional persistent store from concrete XPaths resolved by previous runs.
         """
-        super().__init__()
+        super().__init__(locator_store)
+
+        # Assemblies are loaded on first usage, so only the automation in use pays the loading time
+        load_assemblies("UIA2")
+        from FlaUI.UIA2 import UIA2Automation  # pylint: disable=import-error,import-outside-toplevel
+
         self._uia2 = UIA2Automation()
         super().register_action(self._uia2, retry_timeout_in_milliseconds)  # pylint: disable=maybe-no-member
 
@@ -1,19 +1,27 @@
-from FlaUI.UIA3 import UIA3Automation  # pylint: disable=import-error
+from typing import Optional
+from FlaUILibrary.pythonnetwrapper import load_assemblies
 from FlaUILibrary.flaui.automation.uia import UIA
+from FlaUILibrary.flaui.util.locatorstore import LocatorStore
 
 
 class UIA3(UIA):
     """UIA3 window automation module for a centralized communication handling between robot keywords and Flaui. """
 
-    def __init__(self, retry_timeout_in_milliseconds: int):
+    def __init__(self, retry_timeout_in_milliseconds: int, locator_store: Optional[LocatorStore] = None):
         """
         Creates UIA3 window automation module.
 
         Args:
             retry_timeout_in_milliseconds (Number):
               Timeout in milliseconds for automatic retry if element could not be found.
+            locator_store (LocatorStore): Optional persistent store from concrete XPaths resolved by previous runs.
         """
-        super().__init__()
+        super().__init__(locator_store)
+
+        # Assemblies are loaded on first usage, so only the automation in use pays the loading time
+        load_assemblies("UIA3")
+        from FlaUI.UIA3 import UIA3Automation  # pylint: disable=import-error,import-outside-toplevel
+
         self._uia3 = UIA3Automation()
         super().register_action(self._uia3, retry_timeout_in_milliseconds)  # pylint: disable=maybe-no-member
 
@@ -0,0 +1,41 @@
+from typing import Optional
+from FlaUILibrary.flaui.automation.fakeautomation import FakeAutomation, FakeXPathLookup
+from FlaUILibrary.flaui.automation.uia import UIA
+from FlaUILibrary.flaui.util.locatorstore import LocatorStore
+
+
+class UIAFake(UIA):
+    """
+    Fake window automation module over a synthetic element tree without UI Automation.
+    Used to measure and test the Python layer from modules and keywords, see FakeAutomation for the tree format.
+    """
+
+    def __init__(self,
+                 retry_timeout_in_milliseconds: int,
+                 fake_tree_file: str,
+                 locator_store: Optional[LocatorStore] = None):
+        """
+        Creates fake window automation module.
+
+        Args:
+            retry_timeout_in_milliseconds (Number):
+              Timeout in milliseconds for automatic retry if element could not be found.
+            fake_tree_file (String): XML or JSON file with the element tree.
+            locator_store (LocatorStore): Optional persistent store from concrete XPaths resolved by previous runs.
+        """
+        super().__init__(locator_store)
+        self._fake = FakeAutomation.from_file(fake_tree_file)
+        super().register_action(self._fake, retry_timeout_in_milliseconds,  # pylint: disable=maybe-no-member
+                                xpath_lookup=FakeXPathLookup, native_conditions=False)
+
+    def get_fake_automation(self) -> FakeAutomation:
+        """
+        Returns the fake automation to change the element tree.
+        """
+        return self._fake
+
+    def identifier(self):
+        """
+        Returns identifier which windows automation interface is in usage.
+        """
+        return "FAKE"
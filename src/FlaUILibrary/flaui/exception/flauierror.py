@@ -34,6 +34,8 @@ class FlaUiError(AttributeError):
     WindowResizeFailed = "Window resize failed: {}"
     WrongElementType = "'{}' could not be cast as '{}'"
     XPathNotFound = "Element from XPath '{}' could not be found"
+    SearchRootNotRegistered = "Search root '{}' is not registered"
+    SearchRootNotFound = "Search root '{}' from XPath '{}' could not be found"
     ControlDoesNotContainItem = "Control does not contain item '{}'"
     ControlContainsItem = "Control contains item '{}'"
     ItemNotSelected = "Item '{}' is not selected"
@@ -45,13 +47,18 @@ class FlaUiError(AttributeError):
     ArgumentShouldBeList = "The given argument should be an array"
     ArgumentShouldNotBeList = "The given argument should not be an array"
     PropertyNotSupported = "Property from element is not supported"
+    PropertyNameNotSupported = "Property '{}' is not supported"
     PropertyNotEqual = "Property value '{}' not equal to expected value '{}'"
     InvalidPropertyArgument = "Set Property can not be executed by Get Property From Element"
     PatternNotSupported = "Supports '{}' Pattern only, method cannot be used with invalid Pattern"
     InvalidSeparator = "Try to set invalid separator"
     GridIsSingleSelect = "The Grid only supports single select. Change the muliselect argument to false"
+    GridRowNotFound = "Row with values {} could not be found in grid"
     RelativePathsOnlyAllowed = "Only relative paths are allowed"
     NotSupportedFileSuffix = "Not supported file suffix"
+    ScreenshotCaptureTargetNotSupported = "Screenshot capture target '{}' is not supported"
+    ScreenshotRegionInvalid = "Screenshot region needs x, y and a positive width and height"
+    ScreenshotJpegQualityInvalid = "JPEG quality '{}' must be between 1 and 100"
     IdentifierOrCoordinatesRequired = "An element identifier or x and y coordinates must be provided"
     BothCoordinatesRequired = "Both x and y coordinates must be provided"
 
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any
+from typing import Any, Callable, Dict
+from FlaUILibrary.flaui.exception.flauierror import FlaUiError
 from FlaUILibrary.flaui.interface.valuecontainer import ValueContainer
 
 
@@ -8,15 +9,47 @@ class ModuleInterface(ABC):
     """
     Interface class to implement all FlaUI wrapper modules from Python to C#.
     Module package contains all component implementations from FlaUI usage.
+
+    Each module provides a dispatch table from action to handler which is created once per module instance,
+    so executing an action is a single dictionary lookup and call.
     """
 
     @abstractmethod
+    def create_action_handlers(self) -> Dict[Enum, Callable[[ValueContainer], Any]]:
+        """
+        Creates handlers from all supported actions.
+
+        Returns:
+            Dictionary from action enumeration to callable which receives the value container from action.
+        """
+        raise NotImplementedError('Subclass must override create_action_handlers method')
+
+    def get_action_handlers(self) -> Dict[Enum, Callable[[ValueContainer], Any]]:
+        """
+        Returns the dispatch table from module. Table is created on first usage and reused afterwards.
+        """
+        handlers = getattr(self, "_action_handlers", None)
+
+        if handlers is None:
+            handlers = self.create_action_handlers()
+            self._action_handlers = handlers  # pylint: disable=attribute-defined-outside-init
+
+        return handlers
+
     def execute_action(self, action: Enum, values: ValueContainer) -> Any:
         """
         Executes a defined action method.
 
+        Raises:
+            FlaUiError: If action is not supported.
+
         Args:
             action: Enumeration from supported actions.
             values: Value container object which stores arguments from action.
         """
-        raise NotImplementedError('Subclass must override execute_action method')
+        handler = self.get_action_handlers().get(action)
+
+        if handler is None:
+            FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported)
+
+        return handler(values)
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional, Any
+from typing import Optional, Any, Dict, Callable
 import FlaUI.Core  # pylint: disable=import-error
 from System.ComponentModel import Win32Exception  # pylint: disable=import-error
 from FlaUILibrary.flaui.util.converter import Converter
@@ -58,6 +58,7 @@ class Application(ModuleInterface):
         WAIT_WHILE_APPLICATION_HANDLE_IS_MISSING_BY_PID = "APPLICATION_WAIT_WHILE_HANDLE_IS_MISSING_BY_PID"
         WAIT_WHILE_APPLICATION_IS_BUSY_BY_NAME = "APPLICATION_WAIT_WHILE_IS_BUSY_BY_NAME"
         WAIT_WHILE_APPLICATION_IS_BUSY_BY_PID = "APPLICATION_WAIT_WHILE_IS_BUSY_BY_PID"
+        GET_ACTIVE_APPLICATION = "APPLICATION_GET_ACTIVE"
 
     def __init__(self):
         """
@@ -85,44 +86,37 @@ class Application(ModuleInterface):
                                      timeout=Converter.cast_to_int(timeout, msg),
                                      args=Converter.cast_to_string(args))
 
-    def execute_action(self, action: Action, values: Container) -> Any:
+    def create_action_handlers(self) -> Dict[Enum, Callable[[Container], Any]]:
         """
-        Execute all supported actions from application module wrapper by FlaUI.
-
-        Raises:
-            FlaUiError: If action is not supported.
-
-        Args:
-            action: Method action to use.
-            values: See supported action definitions for value usage and value container definition.
+        Creates handlers from all supported actions. Each handler receives the value container from action.
+        Called once by the module interface, see ModuleInterface.get_action_handlers.
         """
 
-        # pylint: disable=unnecessary-lambda
-        switcher = {
+        return {
             self.Action.ATTACH_APPLICATION_BY_NAME:
-                lambda: self._attach_application_by_name(values),
+                self._attach_application_by_name,
             self.Action.ATTACH_APPLICATION_BY_PID:
-                lambda: self._attach_application_by_pid(values),
+                self._attach_application_by_pid,
             self.Action.LAUNCH_APPLICATION:
-                lambda: self._launch_application(values),
+                self._launch_application,
             self.Action.LAUNCH_APPLICATION_WITH_ARGS:
-                lambda: self._launch_application_with_args(values),
+                self._launch_application_with_args,
             self.Action.EXIT_APPLICATION:
-                lambda: self._exit_application_by_pid(values),
+                self._exit_application_by_pid,
             self.Action.CLOSE_APPLICATION_BY_NAME:
-                lambda: self._exit_application_by_name(values),
+                self._exit_application_by_name,
             self.Action.WAIT_WHILE_APPLICATION_HANDLE_IS_MISSING_BY_PID:
-                lambda: self._wait_while_main_handle_is_missing_by_pid(values),
+                self._wait_while_main_handle_is_missing_by_pid,
             self.Action.WAIT_WHILE_APPLICATION_HANDLE_IS_MISSING_BY_NAME:
-                lambda: self._wait_while_main_handle_is_missing_by_name(values),
+                self._wait_while_main_handle_is_missing_by_name,
             self.Action.WAIT_WHILE_APPLICATION_IS_BUSY_BY_NAME:
-                lambda: self._wait_while_busy_by_name(values),
+                self._wait_while_busy_by_name,
             self.Action.WAIT_WHILE_APPLICATION_IS_BUSY_BY_PID:
-                lambda: self._wait_while_busy_by_pid(values),
+                self._wait_while_busy_by_pid,
+            self.Action.GET_ACTIVE_APPLICATION:
+                lambda _: self._get_active_application(),
         }
 
-        return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
-
     def _attach_application_by_name(self, container: Container) -> int:
         """
         Attach to a running process by name and register the attached application.
@@ -281,6 +275,15 @@ class Application(ModuleInterface):
 
         raise FlaUiError(FlaUiError.ApplicationNotAttached) from None
 
+    def _get_active_application(self) -> Optional[Any]:
+        """
+        Return the most recently attached or launched application.
+
+        Returns:
+            Application | None: FlaUI application instance or None if no application is attached.
+        """
+        return self._applications[-1].application if self._applications else None
+
     def _wait_while_main_handle_is_missing_by_pid(self, container: Container) -> bool:
         """
         Wait until the main window handle for the application identified by pid is available.
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional, Any
+from typing import Optional, Any, Dict, Callable
 from FlaUI.Core.Exceptions import PatternNotSupportedException  # pylint: disable=import-error
 from FlaUILibrary.flaui.exception.flauierror import FlaUiError
 from FlaUILibrary.flaui.interface.moduleinterface import ModuleInterface
@@ -39,25 +39,15 @@ class Button(ModuleInterface):
         """
         return Button.Container(xpath=xpath, element=element)
 
-    def execute_action(self, action: Action, values: Container) -> Any:
+    def create_action_handlers(self) -> Dict[Enum, Callable[[Container], Any]]:
         """
-        If action is not supported an ActionNotSupported error will be raised.
-
-        Raises:
-            FlaUiError: If action is not supported.
-
-        Args:
-            action: Action to use.
-            values: See supported action definitions for value usage and value container definition.
+        Creates handlers from all supported actions. Each handler receives the value container from action.
+        Called once by the module interface, see ModuleInterface.get_action_handlers.
         """
 
-        # pylint: disable=unnecessary-lambda
-        switcher = {
-            self.Action.INVOKE_BUTTON: lambda: self._invoke(values),
+        return {
+            self.Action.INVOKE_BUTTON: self._invoke,
         }
-        # pylint: enable=unnecessary-lambda
-
-        return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
 
     @staticmethod
     def _invoke(container: Container) -> None:
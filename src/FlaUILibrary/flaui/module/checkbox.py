@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional, Any
+from typing import Optional, Any, Dict, Callable
 from FlaUILibrary.flaui.exception.flauierror import FlaUiError
 from FlaUILibrary.flaui.interface.moduleinterface import ModuleInterface
 from FlaUILibrary.flaui.interface.valuecontainer import ValueContainer
@@ -38,27 +38,19 @@ class Checkbox(ModuleInterface):
         return Checkbox.Container(element=element,
                                   state=Converter.cast_to_bool(state))
 
-    def execute_action(self, action: Action, values: Container) -> Any:
+    def create_action_handlers(self) -> Dict[Enum, Callable[[Container], Any]]:
         """
-        If action is not supported an ActionNotSupported error will be raised.
-
-        Raises:
-            FlaUiError: If action is not supported.
-
-        Args:
-            action: Action to use.
-            values: See action definitions for value usage.
+        Creates handlers from all supported actions. Each handler receives the value container from action.
+        Called once by the module interface, see ModuleInterface.get_action_handlers.
         """
 
-        switcher = {
+        return {
             self.Action.GET_CHECKBOX_BUTTON_STATE:
-                lambda: self._is_checked(values),
+                self._is_checked,
             self.Action.SET_CHECKBOX_BUTTON_STATE:
-                lambda: self._set_state(values)
+                self._set_state
         }
 
-        return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
-
     @staticmethod
     def _is_checked(container: Container) -> bool:
         """
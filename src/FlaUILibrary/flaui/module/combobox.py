@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional, Any
+from typing import Optional, Any, Dict, Callable
 from FlaUILibrary.flaui.exception.flauierror import FlaUiError
 from FlaUILibrary.flaui.interface.moduleinterface import ModuleInterface
 from FlaUILibrary.flaui.interface.valuecontainer import ValueContainer
@@ -38,28 +38,19 @@ class Combobox(ModuleInterface):
         """
         return Combobox.Container(element=None if not element else element)
 
-    def execute_action(self, action: Action, values: Container) -> Any:
+    def create_action_handlers(self) -> Dict[Enum, Callable[[Container], Any]]:
         """
-        If action is not supported an ActionNotSupported error will be raised.
-
-        Raises:
-            FlaUiError: If action is not supported.
-
-        Args:
-            action: Action to use.
-            values: See supported action definitions for value usage and value container definition.
+        Creates handlers from all supported actions. Each handler receives the value container from action.
+        Called once by the module interface, see ModuleInterface.get_action_handlers.
         """
 
-        # pylint: disable=unnecessary-lambda
-        switcher = {
+        return {
             self.Action.EXPAND_COMBOBOX:
-                lambda: self._expand(values),
+                self._expand,
             self.Action.COLLAPSE_COMBOBOX:
-                lambda: self._collapse(values),
+                self._collapse,
         }
 
-        return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
-
     @staticmethod
     def _expand(container: Container) -> None:
         """
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional, Any
+from typing import Optional, Any, Dict, Callable
 from FlaUILibrary.flaui.exception.flauierror import FlaUiError
 from FlaUILibrary.flaui.interface.moduleinterface import ModuleInterface
 from FlaUILibrary.flaui.interface.valuecontainer import ValueContainer
@@ -34,25 +34,17 @@ class Debug(ModuleInterface):
         """
         return Debug.Container(element=element)
 
-    def execute_action(self, action: Action, values: Container = None) -> Any:
+    def create_action_handlers(self) -> Dict[Enum, Callable[[Container], Any]]:
         """
-        If action is not supported an ActionNotSupported error will be raised.
-
-        Raises:
-            FlaUiError: If action is not supported.
-
-        Args:
-            action (Action): Action to use.
-            values (Object): See supported action definitions for value usage.
+        Creates handlers from all supported actions. Each handler receives the value container from action.
+        Called once by the module interface, see ModuleInterface.get_action_handlers.
         """
 
-        switcher = {
+        return {
             self.Action.GET_CHILDS_FROM_ELEMENT:
-                lambda: Debug._get_childs_from_element(values)
+                Debug._get_childs_from_element
         }
 
-        return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
-
     @staticmethod
     def _get_childs_from_element(container: Container) -> str:
         """
@@ -1,12 +1,15 @@
-import time
 from enum import Enum
-from typing import Optional, Any, Union, List
+from typing import Optional, Any, Union, List, Tuple, Callable, Dict
 from System import Exception as CSharpException  # pylint: disable=import-error
 from System import InvalidOperationException # pylint: disable=import-error
 from System import AccessViolationException  # pylint: disable=import-error
+from System import TimeSpan  # pylint: disable=import-error
 from System.Reflection import TargetInvocationException  # pylint: disable=import-error
 from System.Runtime.InteropServices import COMException # pylint: disable=import-error
 from FlaUI.Core import Debug as FlaUIDebug  # pylint: disable=import-error
+from FlaUI.Core import CacheRequest  # pylint: disable=import-error
+from FlaUI.Core.Conditions import PropertyCondition  # pylint: disable=import-error
+from FlaUI.Core.Definitions import ControlType, TreeScope  # pylint: disable=import-error
 from FlaUI.Core.Exceptions import PropertyNotSupportedException # pylint: disable=import-error
 from FlaUI.Core.Exceptions import ElementNotAvailableException # pylint: disable=import-error
 from FlaUILibrary.pythonnetwrapper import SafeXPath
@@ -15,6 +18,14 @@ from FlaUILibrary.flaui.exception.flauierror import FlaUiError
 from FlaUILibrary.flaui.interface.moduleinterface import ModuleInterface
 from FlaUILibrary.flaui.interface.valuecontainer import ValueContainer
 from FlaUILibrary.flaui.util.automationelement import AutomationElement
+from FlaUILibrary.flaui.util.backoff import Backoff
+from FlaUILibrary.flaui.util.eventwaiter import EventWaiter
+from FlaUILibrary.flaui.util.locatorcache import LocatorCache
+from FlaUILibrary.flaui.util.locatorstatistics import LocatorStatistics
+from FlaUILibrary.flaui.util.locatorstore import LocatorStore
+from FlaUILibrary.flaui.util.xpathanalyzer import XPathAnalyzer
+from FlaUILibrary.flaui.util.xpathbuilder import XPathBuilder
+from FlaUILibrary.flaui.util.xpathtranslator import ConditionStep, XPathTranslator
 
 
 class Element(ModuleInterface):
@@ -32,6 +43,30 @@ class Element(ModuleInterface):
         use_exception: Optional[bool]
         retries: Optional[int]
         retry_timeout_in_milliseconds: Optional[int]
+        timeout_in_milliseconds: Optional[int]
+        root: Optional[str]
+        enabled: Optional[bool]
+
+    class SearchRootContainer:
+        """
+        Search root container to store a named anchor element for relative XPath lookups.
+        """
+        xpath: str
+        element: Any
+        runtime_id: Optional[Tuple[int, ...]]
+
+        def __init__(self, xpath: str, element: Any, runtime_id: Optional[Tuple[int, ...]]):
+            """
+            Search root container class to store anchor elements.
+
+            Args:
+                xpath (str): Absolute XPath from desktop to resolve the anchor element again
+                element (Object): Resolved anchor element
+                runtime_id (Tuple): Runtime id from anchor element to verify if element is still valid
+            """
+            self.xpath = xpath
+            self.element = element
+            self.runtime_id = runtime_id
 
     class Action(Enum):
         """
@@ -43,6 +78,10 @@ class Element(ModuleInterface):
         GET_ELEMENT_RECTANGLE_BOUNDING = "ELEMENT_GET_RECTANGLE_BOUNDING"
         GET_ELEMENT_RETRY_TIMEOUT = "ELEMENT_GET_RETRY_TIMEOUT"
         SET_ELEMENT_RETRY_TIMEOUT = "ELEMENT_SET_RETRY_TIMEOUT"
+        SET_SEARCH_ROOT = "ELEMENT_SET_SEARCH_ROOT"
+        USE_SEARCH_ROOT = "ELEMENT_USE_SEARCH_ROOT"
+        RESET_SEARCH_ROOT = "ELEMENT_RESET_SEARCH_ROOT"
+        SET_XPATH_OPTIMIZATION = "ELEMENT_SET_XPATH_OPTIMIZATION"
         FOCUS_ELEMENT = "ELEMENT_FOCUS"
         FIND_ONE_ELEMENT = "ELEMENT_FIND_ONE"
         FIND_ALL_ELEMENTS = "ELEMENT_FIND_ALL"
@@ -70,17 +109,51 @@ class Element(ModuleInterface):
         CSharpException,
     )
 
-    def __init__(self, automation: Any, retry_timeout_in_milliseconds: int):
+    _LOCATOR_CACHE_SIZE = 128
+    _RETRY_INITIAL_DELAY_IN_MS = 10
+    _RETRY_MAX_DELAY_IN_MS = 250
+    _XPATH_LOOKUP_ATTEMPTS = 3
+    _XPATH_LOOKUP_INITIAL_DELAY_IN_MS = 50
+    _XPATH_LOOKUP_MAX_DELAY_IN_MS = 200
+    DEFAULT_SEARCH_ROOT = "default"
+
+    def __init__(self,
+                 automation: Any,
+                 retry_timeout_in_milliseconds: int,
+                 locator_statistics: Optional[LocatorStatistics] = None,
+                 application_provider: Optional[Callable[[], Any]] = None,
+                 locator_store: Optional[LocatorStore] = None,
+                 xpath_lookup: Any = SafeXPath,
+                 native_conditions: bool = True):
         """
         Element module wrapper for FlaUI usage.
 
         Args:
             automation (Object): UIA3/UIA2 automation object from FlaUI.
             retry_timeout_in_milliseconds (Integer): Timeout handler for element wait if not found.
+            locator_statistics (LocatorStatistics): Statistics to record lookup times from each XPath.
+            application_provider (Callable): Returns the attached application whose main window anchors
+                                             optimized XPath lookups or None if no application is attached.
+            locator_store (LocatorStore): Optional persistent store from concrete XPaths resolved by previous runs.
+            xpath_lookup (Object): Provides FindFirstByXPath and FindAllByXPath for elements from automation,
+                                   SafeXPath by default.
+            native_conditions (bool): False if elements from automation do not support native UI Automation
+                                      conditions, XPaths are never translated to FindFirst searches then.
         """
         self._element = None
         self._automation = automation
         self._retry_timeout_in_milliseconds = retry_timeout_in_milliseconds
+        self._locator_cache = LocatorCache(self._LOCATOR_CACHE_SIZE)
+        self._search_roots = {}
+        self._active_search_root = None
+        self._locator_statistics = locator_statistics if locator_statistics is not None else LocatorStatistics()
+        self._application_provider = application_provider
+        self._xpath_analyzer = XPathAnalyzer()
+        self._xpath_translator = XPathTranslator()
+        self._xpath_optimization = False
+        self._locator_store = locator_store
+        self._xpath_lookup = xpath_lookup
+        self._native_conditions = native_conditions
 
     @staticmethod
     def create_value_container(name=None,
@@ -88,6 +161,9 @@ class Element(ModuleInterface):
                                retries=None,
                                use_exception=None,
                                retry_timeout_in_milliseconds=None,
+                               timeout_in_milliseconds=None,
+                               root=None,
+                               enabled=None,
                                msg=None) -> Container:
         """
         Helper to create container object.
@@ -101,6 +177,9 @@ class Element(ModuleInterface):
             retries (Number): Retry counter to repeat calls as number
             retry_timeout_in_milliseconds (Number): Timeout handler for element wait if not found.
             use_exception (Bool) : Indicator to ignore exception handling by Flaui
+            timeout_in_milliseconds (Number): Timeout in milliseconds for wait actions, replaces retries if set
+            root (String): Name from registered search root to use instead of the active search root
+            enabled (Bool): Indicator to enable or disable a feature like XPath optimization
             msg (String): Optional error message
         """
         return Element.Container(name=Converter.cast_to_string(name),
@@ -108,72 +187,73 @@ class Element(ModuleInterface):
                                  use_exception=Converter.cast_to_bool(use_exception),
                                  retry_timeout_in_milliseconds=Converter.cast_to_int(
                                      retry_timeout_in_milliseconds, msg),
-                                 retries=Converter.cast_to_int(retries, msg))
+                                 retries=Converter.cast_to_int(retries, msg),
+                                 timeout_in_milliseconds=Converter.cast_to_int(timeout_in_milliseconds, msg),
+                                 root=Converter.cast_to_string(root),
+                                 enabled=Converter.cast_to_bool(enabled))
 
-    def execute_action(self, action: Action, values: Container):
+    def create_action_handlers(self) -> Dict[Enum, Callable[[Container], Any]]:
         """
-        If action is not supported an ActionNotSupported error will be raised.
-
-        Raises:
-            FlaUiError: If action is not supported.
-
-        Args:
-            action (Action): Action to use.
-            values (Object): See supported action definitions for value usage.
+        Creates handlers from all supported actions. Each handler receives the value container from action.
+        Called once by the module interface, see ModuleInterface.get_action_handlers.
         """
 
-        # pylint: disable=unnecessary-lambda
-        switcher = {
+        return {
             self.Action.FOCUS_ELEMENT:
-                lambda: self._focus_element(values),
+                self._focus_element,
             self.Action.GET_ELEMENT:
-                lambda: self._get_element(values),
+                self._get_element,
             self.Action.GET_ELEMENT_BY_XPATH:
-                lambda: self._get_element_by_xpath(values),
+                self._get_element_by_xpath,
             self.Action.GET_ELEMENT_NAME:
-                lambda: self._get_name_from_element(values),
+                self._get_name_from_element,
             self.Action.GET_ELEMENT_RECTANGLE_BOUNDING:
-                lambda: self._get_rectangle_bounding_from_element(values),
+                self._get_rectangle_bounding_from_element,
             self.Action.IS_ELEMENT_ENABLED:
-                lambda: self._is_enabled(values),
+                self._is_enabled,
             self.Action.NAME_SHOULD_BE:
-                lambda: self._name_should_be(values),
+                self._name_should_be,
             self.Action.NAME_SHOULD_CONTAINS:
-                lambda: self._name_should_contain(values),
+                self._name_should_contain,
             self.Action.IS_ELEMENT_OFFSCREEN:
-                lambda: self._element_is_offscreen(values),
+                self._element_is_offscreen,
             self.Action.ELEMENT_SHOULD_BE_ENABLED:
-                lambda: self._element_should_be_enabled(values),
+                self._element_should_be_enabled,
             self.Action.ELEMENT_SHOULD_BE_DISABLED:
-                lambda: self._element_should_be_disabled(values),
+                self._element_should_be_disabled,
             self.Action.ELEMENT_SHOULD_BE_OFFSCREEN:
-                lambda: self._element_should_be_offscreen(values),
+                self._element_should_be_offscreen,
             self.Action.ELEMENT_SHOULD_NOT_BE_OFFSCREEN:
-                lambda: self._element_should_not_be_offscreen(values),
+                self._element_should_not_be_offscreen,
             self.Action.ELEMENT_SHOULD_EXIST:
-                lambda: self._element_should_exist(values),
+                self._element_should_exist,
             self.Action.ELEMENT_SHOULD_NOT_EXIST:
-                lambda: self._element_should_not_exist(values),
+                self._element_should_not_exist,
             self.Action.WAIT_UNTIL_ELEMENT_IS_OFFSCREEN:
-                lambda: self._wait_until_element_is_offscreen(values),
+                self._wait_until_element_is_offscreen,
             self.Action.WAIT_UNTIL_ELEMENT_IS_ENABLED:
-                lambda: self._wait_until_element_is_enabled(values),
+                self._wait_until_element_is_enabled,
             self.Action.FIND_ONE_ELEMENT:
-                lambda: self._find_one_element(values),
+                self._find_one_element,
             self.Action.FIND_ALL_ELEMENTS:
-                lambda: self._find_all_elements(values),
+                self._find_all_elements,
             self.Action.WAIT_UNTIL_ELEMENT_EXIST:
-                lambda: self._wait_until_element_exist(values),
+                self._wait_until_element_exist,
             self.Action.WAIT_UNTIL_ELEMENT_DOES_NOT_EXIST:
-                lambda: self._wait_until_element_does_not_exist(values),
+                self._wait_until_element_does_not_exist,
             self.Action.GET_ELEMENT_RETRY_TIMEOUT:
-                lambda: self._get_element_retry_timeout(),
+                lambda _: self._get_element_retry_timeout(),
             self.Action.SET_ELEMENT_RETRY_TIMEOUT:
-                lambda: self._set_element_retry_timeout(values)
+                self._set_element_retry_timeout,
+            self.Action.SET_SEARCH_ROOT:
+                self._set_search_root,
+            self.Action.USE_SEARCH_ROOT:
+                self._use_search_root,
+            self.Action.RESET_SEARCH_ROOT:
+                lambda _: self._reset_search_root(),
+            self.Action.SET_XPATH_OPTIMIZATION:
+                self._set_xpath_optimization,
         }
-        # pylint: enable=unnecessary-lambda
-
-        return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
 
     def _is_enabled(self, container: Container) -> bool:
         """
@@ -257,7 +337,7 @@ class Element(ModuleInterface):
         if name not in element_name:
             raise FlaUiError(FlaUiError.ElementNameDoesNotContainsFromValue.format(element_name, name))
 
-    def _get_element(self, container: Container) -> Any:
+    def _get_element(self, container: Container, use_fast_paths: bool = True) -> Any:
         """
         Return the AutomationElement found by `xpath` in the container.
         Performs a retry using the configured retry timeout if the element is
@@ -265,6 +345,27 @@ class Element(ModuleInterface):
 
         Args:
             container (Container): Must contain `xpath`; may override retry timeout.
+            use_fast_paths (bool): False to search by the generic XPath lookup only, see _invoke_xpath_lookup.
+
+        Returns:
+            AutomationElement: The found element.
+
+        Raises:
+            FlaUiError: If the element cannot be found after retries.
+        """
+        return self._get_element_from_root(container["xpath"], self._get_search_root_name(container),
+                                           use_fast_paths)
+
+    def _get_element_from_root(self, xpath: str, root_name: Optional[str], use_fast_paths: bool = True) -> Any:
+        """
+        Return the AutomationElement found by `xpath` below the given search root.
+        If the element is not found on first attempt the lookup is repeated by
+        exponential backoff until the configured retry timeout is reached.
+
+        Args:
+            xpath (str): XPath to search.
+            root_name (str | None): Name from registered search root or None to search from desktop.
+            use_fast_paths (bool): False to search by the generic XPath lookup only, see _invoke_xpath_lookup.
 
         Returns:
             AutomationElement: The found element.
@@ -272,50 +373,516 @@ class Element(ModuleInterface):
         Raises:
             FlaUiError: If the element cannot be found after retries.
         """
-        retry_timeout_in_ms = self._get_element_retry_timeout()
-        component = self._get_element_by_xpath(container)
+        backoff = Backoff(timeout_in_ms=self._get_element_retry_timeout(),
+                          initial_delay_in_ms=self._RETRY_INITIAL_DELAY_IN_MS,
+                          max_delay_in_ms=self._RETRY_MAX_DELAY_IN_MS)
+
+        def lookup() -> Any:
+            if use_fast_paths:
+                element = self._find_first_by_locator_store(xpath, root_name)
+                if element is not None:
+                    return element
 
-        if not component and retry_timeout_in_ms > 0:
-            time.sleep(retry_timeout_in_ms / 1000)
-            component = self._get_element_by_xpath(container)
+            element = backoff.poll(lambda: self._invoke_xpath_lookup(xpath, find_all=False, root_name=root_name,
+                                                                     use_fast_paths=use_fast_paths))
+            if element:
+                self._store_locator(xpath, root_name, element)
+
+            return element
+
+        component = self._locator_statistics.measure(xpath, lookup)
 
         if component:
             return component
 
-        xpath = container["xpath"]
         raise FlaUiError(FlaUiError.XPathNotFound.format(xpath))
 
-    def _invoke_xpath_lookup(self, xpath: str, find_all: bool) -> Any:
+    def _invoke_xpath_lookup(self, xpath: str, find_all: bool, root_name: Optional[str] = None,
+                             use_fast_paths: bool = True) -> Any:
         """
         Invoke a FlaUI XPath lookup and retry if UI Automation tree walking fails.
 
+        Lookups for the first match try exactly one fast path before, see _find_first_by_fast_path.
+        The generic XPath lookup only follows if the fast path result is not authoritative.
+
         Args:
             xpath (str): XPath to search.
             find_all (bool): True to find all matches, False to find the first match.
+            root_name (str | None): Name from registered search root or None to search from desktop.
+            use_fast_paths (bool): False to skip the fast path, used by checks which expect a missing element
+                                   so each poll costs only one tree search.
 
         Returns:
             AutomationElement | list | None: Found element(s), empty list, or None.
         """
-        desktop = self._automation.GetDesktop()
-        for attempt in range(3):
+        if not find_all and use_fast_paths:
+            (is_resolved, element) = self._find_first_by_fast_path(xpath, root_name)
+            if is_resolved:
+                return element
+
+        def lookup() -> Tuple[bool, Any]:
+            root = self._get_search_root_element(root_name)
             try:
                 if find_all:
-                    elements = SafeXPath.FindAllByXPath(desktop, xpath)
-                    return elements if elements is not None else []
-                return SafeXPath.FindFirstByXPath(desktop, xpath)
+                    elements = self._xpath_lookup.FindAllByXPath(root, xpath)
+                    return True, elements if elements is not None else []
+                return True, self._xpath_lookup.FindFirstByXPath(root, xpath)
             except self._XPATH_LOOKUP_EXCEPTIONS:
-                if attempt == 2:
-                    return [] if find_all else None
-                time.sleep(0.1)
-                desktop = self._automation.GetDesktop()
-        return [] if find_all else None
+                return False, [] if find_all else None
+
+        backoff = Backoff(max_attempts=self._XPATH_LOOKUP_ATTEMPTS,
+                          initial_delay_in_ms=self._XPATH_LOOKUP_INITIAL_DELAY_IN_MS,
+                          max_delay_in_ms=self._XPATH_LOOKUP_MAX_DELAY_IN_MS)
+        (_, result) = backoff.poll(lookup, predicate=lambda value: value[0])
+        return result
+
+    def _find_first_by_fast_path(self, xpath: str, root_name: Optional[str]) -> Tuple[bool, Any]:
+        """
+        Find the first element by one fast path instead of the generic XPath lookup.
+
+        XPaths which are translatable to native conditions are searched by FindFirst, all other XPaths below
+        their longest cached prefix. If XPath optimization is enabled, the fast path searches the XPath anchored
+        at the main window, a miss there is never authoritative for the original XPath.
+
+        Args:
+            xpath (str): XPath to search.
+            root_name (str | None): Name from registered search root or None to search from desktop.
+
+        Returns:
+            Tuple (is_resolved, element): is_resolved is False if the result is not authoritative and a full
+            search from the search root is required.
+        """
+        anchored_xpath = self._get_anchored_xpath(xpath, root_name)
+        search_xpath = anchored_xpath if anchored_xpath is not None else xpath
+
+        steps = self._xpath_translator.translate(search_xpath) if self._native_conditions else None
+        if steps is not None:
+            (is_resolved, element) = self._find_first_by_conditions(steps, root_name)
+        else:
+            (is_resolved, element) = self._find_first_by_cached_prefix(search_xpath, root_name)
+
+        if anchored_xpath is not None:
+            return element is not None, element
+
+        return is_resolved, element
+
+    def _find_first_by_locator_store(self, xpath: str, root_name: Optional[str]) -> Any:
+        """
+        Find the element by the concrete XPath stored from a previous resolution.
+        The element is only used if it and its ancestors still match every step from the XPath,
+        otherwise the entry is removed.
+
+        Args:
+            xpath (str): XPath to search.
+            root_name (str | None): Name from registered search root or None to search from desktop.
+
+        Returns:
+            AutomationElement | None: Found element or None if no valid entry exists.
+        """
+        if self._locator_store is None or root_name is not None:
+            return None
+
+        application = self._get_active_application_name()
+        concrete_xpath = self._locator_store.get(application, xpath)
+        if concrete_xpath is None:
+            return None
+
+        element = self._invoke_xpath_lookup(concrete_xpath, find_all=False)
+        if element and self._matches_xpath(xpath, element):
+            return element
+
+        self._locator_store.remove(application, xpath)
+        return None
+
+    def _store_locator(self, xpath: str, root_name: Optional[str], element: Any) -> None:
+        """
+        Store the concrete XPath from a resolved element for the next run.
+        Only XPaths whose steps can all be verified against the element and its ancestors are stored.
+
+        Args:
+            xpath (str): XPath used for the search.
+            root_name (str | None): Name from registered search root or None if searched from desktop.
+            element (Object): Resolved element.
+        """
+        if self._locator_store is None or root_name is not None or self._get_verifiable_steps(xpath) is None:
+            return
+
+        try:
+            concrete_xpath = FlaUIDebug.GetXPathToElement(element)
+        except self._XPATH_LOOKUP_EXCEPTIONS:
+            return
+
+        if concrete_xpath and concrete_xpath != xpath:
+            self._locator_store.put(self._get_active_application_name(), xpath, concrete_xpath)
+
+    def _get_verifiable_steps(self, xpath: str) -> Optional[List[ConditionStep]]:
+        """
+        Return the translated steps from an XPath if every step can be verified against an element.
+        The last step must contain a control type or property predicates, otherwise any element would match.
+
+        Args:
+            xpath (str): XPath to translate.
+        """
+        steps = self._xpath_translator.translate(xpath)
+        if not steps or (steps[-1].control_type is None and not steps[-1].properties):
+            return None
+
+        return steps
+
+    def _matches_xpath(self, xpath: str, element: Any) -> bool:
+        """
+        Check if an element and its ancestors match all steps from an XPath.
+
+        The last step is matched against the element. Child steps must match the direct parent from the
+        previously matched element, descendant steps any ancestor. A leading child step must match a top level
+        element below the desktop.
+
+        Args:
+            xpath (str): XPath with the expected steps.
+            element (Object): Element to verify.
+        """
+        steps = self._get_verifiable_steps(xpath)
+        if steps is None:
+            return False
+
+        try:
+            walker = self._automation.TreeWalkerFactory.GetControlViewWalker()
+            chain = [element]
+            parent = walker.GetParent(element)
+            while parent is not None:
+                chain.append(parent)
+                parent = walker.GetParent(parent)
+        except self._XPATH_LOOKUP_EXCEPTIONS + (AttributeError,):
+            return False
+
+        # Last element from chain is the desktop which is no part of the XPath
+        chain.pop()
+
+        def matches(step_index: int, chain_index: int) -> bool:
+            step = steps[step_index]
+            if not self._matches_step(step, chain[chain_index]):
+                return False
+
+            if step_index == 0:
+                return step.is_descendant or chain_index == len(chain) - 1
+
+            if step.is_descendant:
+                return any(matches(step_index - 1, index) for index in range(chain_index + 1, len(chain)))
+
+            return chain_index + 1 < len(chain) and matches(step_index - 1, chain_index + 1)
+
+        return bool(chain) and matches(len(steps) - 1, 0)
+
+    def _matches_step(self, step: ConditionStep, element: Any) -> bool:
+        """
+        Check if an element matches control type and property predicates from a translated step.
+
+        Args:
+            step (ConditionStep): Translated step.
+            element (Object): Element to verify.
+        """
+        try:
+            if step.control_type is not None and element.ControlType.ToString() != step.control_type:
+                return False
+
+            return all(str(getattr(element.Properties, name).ValueOrDefault or "") == value
+                       for (name, value) in step.properties)
+        except self._XPATH_LOOKUP_EXCEPTIONS + (AttributeError,):
+            return False
+
+    def _get_active_application_name(self) -> str:
+        """
+        Return the process name from the attached application or an empty string if no application is attached.
+        """
+        application = self._application_provider() if self._application_provider is not None else None
+
+        try:
+            return str(application.Name) if application is not None else ""
+        except self._XPATH_LOOKUP_EXCEPTIONS:
+            return ""
+
+    def _find_first_by_conditions(self, steps: List[ConditionStep], root_name: Optional[str]) -> Tuple[bool, Any]:
+        """
+        Find the first element by native UI Automation FindFirst searches from an XPath which only contains steps
+        with AutomationId, Name, ClassName or HelpText predicates like /Window[@Name='X']//Button[@AutomationId='Y'].
+        The native search avoids the generic FlaUI XPath navigator which reads each visited element step by step.
+
+        Args:
+            steps (List): Steps translated by XPathTranslator.translate.
+            root_name (str | None): Name from registered search root or None to search from desktop.
+
+        Returns:
+            Tuple (is_resolved, element): is_resolved is True if an element was found or if no element matches
+            the first step. Later steps only search below the first match from each step, so a miss there
+            is not authoritative and the generic XPath lookup must be used.
+        """
+        try:
+            element = self._get_search_root_element(root_name)
+            for (index, step) in enumerate(steps):
+                element = element.FindFirst(TreeScope.Descendants if step.is_descendant else TreeScope.Children,
+                                            self._create_condition(step))
+                if element is None:
+                    return index == 0, None
+
+            return True, element
+        except self._XPATH_LOOKUP_EXCEPTIONS + (AttributeError,):
+            return False, None
+
+    def _create_condition(self, step: ConditionStep) -> Any:
+        """
+        Create a property condition from a translated XPath step.
+        Only control elements are matched, like the control view used by XPath lookups.
+
+        Args:
+            step (ConditionStep): Translated XPath step.
+
+        Raises:
+            AttributeError: If the control type from step is unknown.
+        """
+        library = self._automation.PropertyLibrary.Element
+        condition = PropertyCondition(library.IsControlElement, True)
+
+        if step.control_type is not None:
+            condition = condition.And(PropertyCondition(library.ControlType, getattr(ControlType, step.control_type)))
+
+        for (name, value) in step.properties:
+            condition = condition.And(PropertyCondition(getattr(library, name), value))
+
+        return condition
+
+    def _get_anchored_xpath(self, xpath: str, root_name: Optional[str]) -> Optional[str]:
+        """
+        Rewrite an XPath starting with an unbounded descendant step to a search below the main window
+        from the attached application, e.g. //Button[@Name='OK'] to /Window[@Name='App']//Button[@Name='OK'].
+
+        Anchored lookups are only a shortcut, if the element is not found below the main window the
+        original XPath is searched by the generic XPath lookup from the search root.
+
+        Args:
+            xpath (str): XPath to search.
+            root_name (str | None): Name from registered search root or None to search from desktop.
+
+        Returns:
+            str | None: Anchored XPath or None if XPath optimization is disabled or not possible.
+        """
+        if not self._xpath_optimization or root_name is not None or self._application_provider is None:
+            return None
+
+        if not self._xpath_analyzer.analyze(xpath).is_anchorable:
+            return None
+
+        application = self._application_provider()
+        if application is None:
+            return None
+
+        try:
+            window = application.GetMainWindow(self._automation, TimeSpan.Zero)
+            if window is None:
+                return None
+
+            return self._xpath_analyzer.anchor(xpath,
+                                               self._try_get_automation_id_property(window),
+                                               self._try_get_name_property(window))
+        except self._XPATH_LOOKUP_EXCEPTIONS:
+            return None
+
+    def _set_xpath_optimization(self, container: Container) -> None:
+        """
+        Enable or disable the rewrite from unbounded descendant XPaths to searches below the main window.
+
+        Args:
+            container (Container): Must contain `enabled`.
+        """
+        self._xpath_optimization = bool(container["enabled"])
+
+    def _find_first_by_cached_prefix(self, xpath: str, root_name: Optional[str] = None) -> Tuple[bool, Any]:
+        """
+        Find the first element by XPath below the longest cached XPath prefix.
+
+        Only leading child steps like /Window[@Name='App']/Pane are cached. Prefixes which are not cached yet
+        are resolved step by step and stored in the locator cache. The last step is always evaluated to
+        reflect the current state from the user interface.
+
+        Args:
+            xpath (str): XPath to search.
+            root_name (str | None): Name from registered search root or None to search from desktop.
+
+        Returns:
+            Tuple (is_resolved, element): is_resolved is False if the result is not authoritative and a full
+            search from the search root is required.
+        """
+        steps = LocatorCache.split_steps(xpath)
+        if not steps or len(steps) < 2:
+            return False, None
+
+        prefix_length = 0
+        for separator, _ in steps[:-1]:
+            if separator != LocatorCache.CHILD_SEPARATOR:
+                break
+            prefix_length += 1
+
+        if prefix_length == 0:
+            return False, None
+
+        parent = None
+        depth = prefix_length
+        while depth > 0:
+            parent = self._locator_cache.get((root_name, LocatorCache.join_steps(steps[:depth])),
+                                             self._is_cached_element_valid)
+            if parent is not None:
+                break
+            depth -= 1
+
+        try:
+            if parent is None:
+                parent = self._get_search_root_element(root_name)
+
+            for index in range(depth, prefix_length):
+                parent = self._xpath_lookup.FindFirstByXPath(parent, LocatorCache.join_steps(steps[index:index + 1]))
+                if parent is None:
+                    # First step from search root could not be found so no other element can match
+                    return index == 0, None
+
+                runtime_id = Converter.try_get_runtime_id(parent)
+                if runtime_id is not None:
+                    self._locator_cache.put((root_name, LocatorCache.join_steps(steps[:index + 1])), parent, runtime_id)
 
-    def _get_element_by_xpath(self, container: Container) -> Any:
+            element = self._xpath_lookup.FindFirstByXPath(parent, LocatorCache.join_steps(steps[prefix_length:]))
+        except self._XPATH_LOOKUP_EXCEPTIONS:
+            return False, None
+
+        return element is not None, element
+
+    def _get_search_root_name(self, container: Container) -> Optional[str]:
+        """
+        Return the search root name to use for the lookup from the container.
+
+        Args:
+            container (Container): Value container with optional `root` key.
+
+        Returns:
+            str | None: Search root from container, otherwise the active search root or None for desktop.
+        """
+        root_name = container.get("root")
+        return root_name if root_name else self._active_search_root
+
+    def _get_search_root_element(self, root_name: Optional[str]) -> Any:
+        """
+        Return the anchor element from a registered search root.
+        If the stored element is not available anymore it will be resolved again by its XPath from desktop.
+
+        Args:
+            root_name (str | None): Name from registered search root or None for desktop.
+
+        Returns:
+            AutomationElement: Desktop or anchor element.
+
+        Raises:
+            FlaUiError: If search root is not registered or could not be resolved again.
+        """
+        if root_name is None:
+            return self._automation.GetDesktop()
+
+        search_root = self._search_roots.get(root_name)
+        if search_root is None:
+            raise FlaUiError(FlaUiError.SearchRootNotRegistered.format(root_name))
+
+        if search_root.runtime_id is not None and self._is_cached_element_valid(search_root.element,
+                                                                                search_root.runtime_id):
+            return search_root.element
+
+        element = self._invoke_xpath_lookup(search_root.xpath, find_all=False)
+        if element is None:
+            raise FlaUiError(FlaUiError.SearchRootNotFound.format(root_name, search_root.xpath))
+
+        search_root.element = element
+        search_root.runtime_id = Converter.try_get_runtime_id(element)
+        return element
+
+    def _get_xpath_to_element(self, element: Any, root_name: Optional[str]) -> str:
+        """
+        Return the XPath to an element relative to the search root.
+        If the element is not located below the search root the XPath from desktop is returned.
+
+        Args:
+            element (Any): Automation element instance.
+            root_name (str | None): Name from registered search root or None for desktop.
+
+        Returns:
+            str: XPath from search root to element.
+        """
+        xpath = FlaUIDebug.GetXPathToElement(element)
+        if root_name is None:
+            return xpath
+
+        root_xpath = FlaUIDebug.GetXPathToElement(self._get_search_root_element(root_name))
+        if xpath.startswith(root_xpath + LocatorCache.CHILD_SEPARATOR):
+            return xpath[len(root_xpath):]
+
+        return xpath
+
+    def _set_search_root(self, container: Container) -> None:
+        """
+        Register an element by its XPath from desktop as named search root and activate it.
+        All following XPath lookups are evaluated relative to this element.
+
+        Args:
+            container (Container): Must contain `xpath`, optional `name` from search root.
+
+        Raises:
+            FlaUiError: If the element cannot be found.
+        """
+        name = container["name"] or self.DEFAULT_SEARCH_ROOT
+        xpath = container["xpath"]
+        element = self._get_element_from_root(xpath, None)
+
+        self._search_roots[name] = Element.SearchRootContainer(xpath, element, Converter.try_get_runtime_id(element))
+        self._active_search_root = name
+        self._locator_cache.clear()
+
+    def _use_search_root(self, container: Container) -> None:
+        """
+        Activate a registered search root by name.
+
+        Args:
+            container (Container): Optional `name` from search root.
+
+        Raises:
+            FlaUiError: If search root is not registered.
+        """
+        name = container["name"] or self.DEFAULT_SEARCH_ROOT
+        if name not in self._search_roots:
+            raise FlaUiError(FlaUiError.SearchRootNotRegistered.format(name))
+
+        self._active_search_root = name
+
+    def _reset_search_root(self) -> None:
+        """
+        Deactivate the active search root so XPath lookups are evaluated from desktop again.
+        Registered search roots are kept and can be activated again.
+        """
+        self._active_search_root = None
+
+    def _is_cached_element_valid(self, element: Any, runtime_id: Tuple[int, ...]) -> bool:
+        """
+        Check if a cached element is still available and its runtime id is unchanged.
+
+        Args:
+            element (Any): Cached automation element.
+            runtime_id (Tuple): Runtime id from element while it was cached.
+
+        Returns:
+            bool: True if element can still be used, False otherwise.
+        """
+        return Converter.try_get_runtime_id(element) == runtime_id
+
+    def _get_element_by_xpath(self, container: Container, use_fast_paths: bool = True) -> Any:
         """
         Try to locate the first element by XPath using the automation desktop root.
 
         Args:
             container (Container): Must contain `xpath`.
+            use_fast_paths (bool): False to search by the generic XPath lookup only, see _invoke_xpath_lookup.
 
         Returns:
             AutomationElement | None: The element if found, otherwise None.
@@ -326,7 +893,11 @@ class Element(ModuleInterface):
             - AccessViolationException from UI Automation tree walking is handled by
               SafeXPath so virtualized controls cannot crash the Python process.
         """
-        return self._invoke_xpath_lookup(container["xpath"], find_all=False)
+        xpath = container["xpath"]
+        root_name = self._get_search_root_name(container)
+        return self._locator_statistics.measure(
+            xpath, lambda: self._invoke_xpath_lookup(xpath, find_all=False, root_name=root_name,
+                                                     use_fast_paths=use_fast_paths))
 
     def _find_one_element(self, container: Container) -> AutomationElement:
         """
@@ -349,7 +920,7 @@ class Element(ModuleInterface):
                 self._try_get_automation_id_property(element),
                 self._try_get_name_property(element),
                 self._try_get_classname_property(element),
-                FlaUIDebug.GetXPathToElement(element)
+                self._get_xpath_to_element(element, self._get_search_root_name(container))
             )
 
         raise FlaUiError(FlaUiError.XPathNotFound.format(container["xpath"]))
@@ -365,14 +936,86 @@ class Element(ModuleInterface):
         Returns:
             List[AutomationElement]: List of element representations (may be empty).
         """
+        return self._locator_statistics.measure(container["xpath"],
+                                                lambda: self._find_all_elements_by_xpath(container))
+
+    def _find_all_elements_by_xpath(self, container: Container) -> List[AutomationElement]:
+        """
+        Find all elements matching the XPath by one cache request and fall back to a lookup without cache.
+
+        Args:
+            container (Container): Must contain `xpath`.
+
+        Returns:
+            List[AutomationElement]: List of element representations (may be empty).
+        """
+        root_name = self._get_search_root_name(container)
+        root = self._get_search_root_element(root_name)
+
+        try:
+            cache = self._create_find_all_cache_request().Activate()
+            try:
+                cached_root = root.FrameworkAutomationElement.GetUpdatedCache()
+                elements = self._xpath_lookup.FindAllByXPath(cached_root, container["xpath"])
+                xpath_builder = XPathBuilder(self._automation.TreeWalkerFactory.GetControlViewWalker())
+                root_xpath = xpath_builder.get_xpath(cached_root) if root_name is not None else None
+                return self._create_automation_elements(elements if elements is not None else [],
+                                                        root_name,
+                                                        xpath_builder,
+                                                        root_xpath)
+            finally:
+                cache.Dispose()
+        except self._XPATH_LOOKUP_EXCEPTIONS + (AttributeError,):
+            pass
+
+        return self._create_automation_elements(self._get_all_elements_by_xpath(container), root_name)
+
+    def _create_find_all_cache_request(self) -> Any:
+        """
+        Create a cache request for all properties used by XPath lookups and find all results.
+
+        Returns:
+            CacheRequest: Cache request for element scope.
+        """
+        library = self._automation.PropertyLibrary.Element
+        cache_request = CacheRequest()
+        cache_request.TreeScope = TreeScope.Element
+        for property_id in (library.AutomationId, library.Name, library.ClassName, library.HelpText,
+                            library.ControlType, library.RuntimeId):
+            cache_request.Add(property_id)
+
+        return cache_request
+
+    def _create_automation_elements(self,
+                                    elements: Any,
+                                    root_name: Optional[str],
+                                    xpath_builder: Optional[XPathBuilder] = None,
+                                    root_xpath: Optional[str] = None) -> List[AutomationElement]:
+        """
+        Create serializable AutomationElement representations from automation elements.
+
+        Args:
+            elements (List): Automation elements.
+            root_name (str | None): Name from registered search root or None for desktop.
+            xpath_builder (XPathBuilder | None): Builder to reuse ancestor XPaths, None to walk ancestors per element.
+            root_xpath (str | None): XPath from search root built by xpath_builder.
+
+        Returns:
+            List[AutomationElement]: List of element representations.
+        """
         values = []
-        elements = self._get_all_elements_by_xpath(container)
         for element in elements:
+            xpath = xpath_builder.get_xpath(element) if xpath_builder else None
+            if xpath is None or (root_name is not None and root_xpath is None):
+                xpath = self._get_xpath_to_element(element, root_name)
+            elif root_name is not None and xpath.startswith(root_xpath + LocatorCache.CHILD_SEPARATOR):
+                xpath = xpath[len(root_xpath):]
+
             values.append(AutomationElement(
                 self._try_get_automation_id_property(element),
                 self._try_get_name_property(element),
                 self._try_get_classname_property(element),
-                FlaUIDebug.GetXPathToElement(element)
+                xpath
             ))
 
         return values
@@ -387,7 +1030,8 @@ class Element(ModuleInterface):
         Returns:
             list[AutomationElement]: All matched elements (framework-specific collection).
         """
-        return self._invoke_xpath_lookup(container["xpath"], find_all=True)
+        return self._invoke_xpath_lookup(container["xpath"], find_all=True,
+                                         root_name=self._get_search_root_name(container))
 
     def _element_should_exist(self, container: Container) -> bool:
         """
@@ -425,7 +1069,7 @@ class Element(ModuleInterface):
             FlaUiError: If the element exists and `use_exception` is True.
         """
         try:
-            component = self._get_element(container)
+            component = self._get_element(container, use_fast_paths=False)
         except FlaUiError:
             return True
 
@@ -510,112 +1154,162 @@ class Element(ModuleInterface):
 
     def _wait_until_element_is_offscreen(self, container: Container) -> None:
         """
-        Poll until the element becomes offscreen or until the number of retries
-        in the container is exhausted.
+        Wait until the element becomes offscreen or does not exist anymore.
 
         Args:
-            container (Container): Must contain `xpath` and `retries`.
+            container (Container): Must contain `xpath` and `timeout_in_milliseconds` or `retries`.
 
         Raises:
-            FlaUiError: If the element did not become offscreen within retries.
+            FlaUiError: If the element did not become offscreen within timeout.
         """
-        retries = container["retries"]
-        container["retry_timeout_in_milliseconds"] = 0
-        timer = 0
+        def is_offscreen() -> bool:
+            element = self._try_find_element(container)
+            return element is None or self._try_get_bool_property(element, "IsOffscreen")
 
-        while timer < retries:
-            try:
-                if self._element_is_offscreen(container):
-                    self._set_element_retry_timeout(container)
-                    return
-            except FlaUiError:
-                return
+        if not self._wait_until(container, is_offscreen, "IsOffscreen"):
+            raise FlaUiError(FlaUiError.ElementIsOffscreen.format(container["xpath"]))
 
-            time.sleep(1)
-            timer += 1
+    def _wait_until_element_exist(self, container: Container) -> None:
+        """
+        Wait until the element exists.
 
-        raise FlaUiError(FlaUiError.ElementIsOffscreen.format(container["xpath"]))
+        Args:
+            container (Container): Must contain `xpath` and `timeout_in_milliseconds` or `retries`.
 
-    def _wait_until_element_exist(self, container: Container) -> None:
+        Raises:
+            FlaUiError: If the element did not appear within timeout.
+        """
+        if not self._wait_until(container, lambda: self._try_find_element(container) is not None):
+            raise FlaUiError(FlaUiError.ElementNotExists.format(container["xpath"]))
+
+    def _wait_until_element_does_not_exist(self, container: Container) -> None:
         """
-        Poll until the element exists or until the number of retries in the
-        container is exhausted.
+        Wait until the element no longer exists.
 
         Args:
-            container (Container): Must contain `xpath` and `retries`.
+            container (Container): Must contain `xpath` and `timeout_in_milliseconds` or `retries`.
 
         Raises:
-            FlaUiError: If the element did not appear within retries.
+            FlaUiError: If the element still exists after timeout.
         """
-        retries = container["retries"]
-        container["retry_timeout_in_milliseconds"] = 0
-        timer = 0
+        if not self._wait_until(container, lambda: self._try_find_element(container, use_fast_paths=False) is None):
+            raise FlaUiError(FlaUiError.ElementExists.format(container["xpath"]))
 
-        while timer < retries:
+    def _wait_until_element_is_enabled(self, container: Container) -> None:
+        """
+        Wait until the element exists and is enabled.
 
-            try:
-                self._get_element(container)
-                return
-            except FlaUiError:
-                pass
+        Args:
+            container (Container): Must contain `xpath` and `timeout_in_milliseconds` or `retries`.
 
-            time.sleep(1)
-            timer += 1
+        Raises:
+            FlaUiError: If the element did not become enabled within timeout.
+        """
+        def is_enabled() -> bool:
+            element = self._try_find_element(container)
+            return element is not None and self._try_get_bool_property(element, "IsEnabled")
 
-        raise FlaUiError(FlaUiError.ElementNotExists.format(container["xpath"]))
+        if not self._wait_until(container, is_enabled, "IsEnabled"):
+            raise FlaUiError(FlaUiError.ElementNotEnabled.format(container["xpath"]))
 
-    def _wait_until_element_does_not_exist(self, container: Container) -> None:
+    def _wait_until(self, container: Container, condition: Callable[[], bool], *property_names: str) -> bool:
         """
-        Poll until the element no longer exists or until the number of retries
-        in the container is exhausted.
+        Wait until condition is fulfilled. Condition is evaluated again on UI Automation structure changed
+        events and property changed events from given properties below the search root or main window,
+        see _get_wait_root.
 
         Args:
-            container (Container): Must contain `xpath` and `retries`.
+            container (Container): Must contain `timeout_in_milliseconds` or `retries`.
+            condition (Callable): Condition to evaluate.
+            property_names (str): Names from properties of the automation property library to observe.
 
-        Raises:
-            FlaUiError: If the element still exists after retries.
+        Returns:
+            bool: True if condition was fulfilled, False if timeout was reached.
         """
-        retries = container["retries"]
-        container["retry_timeout_in_milliseconds"] = 0
-        timer = 0
+        property_library = self._automation.PropertyLibrary.Element
+        property_ids = [getattr(property_library, name) for name in property_names]
 
-        while timer < retries:
+        return EventWaiter(self._get_wait_root(container), property_ids).wait(condition,
+                                                                              self._get_wait_timeout(container))
+
+    def _get_wait_root(self, container: Container) -> Any:
+        """
+        Return the element whose subtree is observed for changes while waiting.
+        The desktop is never observed because changes from any application would wake up the wait and
+        registering events on the whole desktop is expensive.
+
+        Args:
+            container (Container): Container with optional `root`.
+
+        Returns:
+            AutomationElement | None: Search root, main window from the attached application or None to poll only.
+        """
+        root_name = self._get_search_root_name(container)
+        if root_name is not None:
             try:
-                self._get_element(container)
+                return self._get_search_root_element(root_name)
             except FlaUiError:
-                return
+                return None
 
-            time.sleep(1)
-            timer += 1
+        application = self._application_provider() if self._application_provider is not None else None
+        if application is None:
+            return None
 
-        raise FlaUiError(FlaUiError.ElementExists.format(container["xpath"]))
+        try:
+            return application.GetMainWindow(self._automation, TimeSpan.Zero)
+        except self._XPATH_LOOKUP_EXCEPTIONS:
+            return None
 
-    def _wait_until_element_is_enabled(self, container: Container) -> None:
+    @staticmethod
+    def _get_wait_timeout(container: Container) -> int:
         """
-        Poll until the element becomes enabled or until the number of retries
-        in the container is exhausted.
+        Return the wait timeout in milliseconds from container.
+        Retries are supported for backward compatibility and are handled as seconds.
 
         Args:
-            container (Container): Must contain `xpath` and `retries`.
+            container (Container): Must contain `timeout_in_milliseconds` or `retries`.
 
-        Raises:
-            FlaUiError: If the element did not become enabled within retries.
+        Returns:
+            int: Timeout in milliseconds.
         """
-        retries = container["retries"]
-        container["retry_timeout_in_milliseconds"] = 0
-        timer = 0
+        timeout_in_ms = container.get("timeout_in_milliseconds")
+        if timeout_in_ms is not None:
+            return timeout_in_ms
 
-        while timer < retries:
-            try:
-                self._element_should_be_enabled(container)
-                return
-            except FlaUiError:
-                pass
+        return (container.get("retries") or 0) * 1000
 
-            time.sleep(1)
-            timer += 1
+    def _try_find_element(self, container: Container, use_fast_paths: bool = True) -> Any:
+        """
+        Find the element by XPath once without retry timeout.
 
-        raise FlaUiError(FlaUiError.ElementNotEnabled.format(container["xpath"]))
+        Args:
+            container (Container): Must contain `xpath`.
+            use_fast_paths (bool): False to search by the generic XPath lookup only, see _invoke_xpath_lookup.
+
+        Returns:
+            AutomationElement | None: The element if found, otherwise None.
+        """
+        try:
+            return self._get_element_by_xpath(container, use_fast_paths)
+        except FlaUiError:
+            return None
+
+    @classmethod
+    def _try_get_bool_property(cls, element: Any, name: str) -> bool:
+        """
+        Safely retrieve a boolean property like IsEnabled from an AutomationElement.
+
+        Args:
+            element (Any): Automation element instance.
+            name (str): Property name.
+
+        Returns:
+            bool: Property value, or False if the element is not available anymore.
+        """
+        try:
+            return bool(getattr(element, name))
+        except (PropertyNotSupportedException,) + cls._XPATH_LOOKUP_EXCEPTIONS:
+            return False
 
     def _focus_element(self, container: Container) -> None:
         """
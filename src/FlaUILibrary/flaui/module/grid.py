@@ -1,10 +1,11 @@
 from enum import Enum
-from typing import Optional, Any, List
+from typing import Optional, Any, List, Dict, Callable
 from System import ArgumentOutOfRangeException  # pylint: disable=import-error
 from System import NullReferenceException  # pylint: disable=import-error
 from System import InvalidOperationException  # pylint: disable=import-error
-from System import Exception as CSharpException  # pylint: disable=import-error
 from FlaUILibrary.flaui.util.converter import Converter
+from FlaUILibrary.flaui.util.gridindex import GridIndex
+from FlaUILibrary.flaui.util.gridrows import GridRows
 from FlaUILibrary.flaui.exception.flauierror import FlaUiError
 from FlaUILibrary.flaui.interface.moduleinterface import ModuleInterface
 from FlaUILibrary.flaui.interface.valuecontainer import ValueContainer
@@ -24,6 +25,12 @@ class Grid(ModuleInterface):
         index: Optional[int]
         name: Optional[str]
         multiselect: Optional[bool]
+        start_row: Optional[int]
+        end_row: Optional[int]
+        columns: Optional[List[int]]
+        values: Optional[List[str]]
+        enabled: Optional[bool]
+        virtualized: Optional[bool]
 
     class Action(Enum):
         """
@@ -36,12 +43,28 @@ class Grid(ModuleInterface):
         GET_ALL_DATA = "GRID_GET_ALL_DATA"
         GET_HEADER = "GRID_GET_HEADER"
         GET_COLUMN_COUNT = "GRID_GET_COLUMN_COUNT"
+        SHOULD_CONTAIN_ROW = "GRID_SHOULD_CONTAIN_ROW"
+        GET_ROW_WHERE = "GRID_GET_ROW_WHERE"
+        SET_ROW_INDEX = "GRID_SET_ROW_INDEX"
+
+    def __init__(self):
+        """
+        Creates grid module, row lookups by cell value are searched by scanning all rows by default.
+        """
+        self._row_index = GridIndex()
+        self._use_row_index = False
 
     @staticmethod
     def create_value_container(element=None,
                                index=None,
                                name=None,
                                multiselect=None,
+                               start_row=None,
+                               end_row=None,
+                               columns=None,
+                               values=None,
+                               enabled=None,
+                               virtualized=None,
                                msg=None) -> Container:
         """
         Helper to create container object.
@@ -54,45 +77,56 @@ class Grid(ModuleInterface):
             index (Number): Index value to select from grid data
             name (String): Name from grid element
             multiselect (Boolean): If grid supports multiselect
+            start_row (Number): Index from first row to read
+            end_row (Number): Index after last row to read
+            columns (List): Indices from columns to read
+            values (List): Expected cell values from a row
+            enabled (Boolean): Enable or disable a feature like the row index
+            virtualized (Boolean): Realize rows page by page even if all rows seem to be realized
             msg (String): Optional error message
         """
         return Grid.Container(element=element,
                               index=Converter.cast_to_int(index, msg),
                               multiselect=Converter.cast_to_bool(multiselect),
-                              name=Converter.cast_to_string(name))
-
-    def execute_action(self, action: Action, values: Container) -> Any:
+                              name=Converter.cast_to_string(name),
+                              start_row=Converter.cast_to_int(start_row, msg),
+                              end_row=Converter.cast_to_int(end_row, msg),
+                              columns=[Converter.cast_to_int(column, msg) for column in columns]
+                              if columns is not None else None,
+                              values=[Converter.cast_to_string(value) for value in values]
+                              if values is not None else None,
+                              enabled=Converter.cast_to_bool(enabled),
+                              virtualized=Converter.cast_to_bool(virtualized))
+
+    def create_action_handlers(self) -> Dict[Enum, Callable[[Container], Any]]:
         """
-        If action is not supported an ActionNotSupported error will be raised.
-
-        Raises:
-            FlaUiError: If action is not supported.
-
-        Args:
-            action (Action): Action to use.
-            values (Object): Specific value for action if needed.
-
+        Creates handlers from all supported actions. Each handler receives the value container from action.
+        Called once by the module interface, see ModuleInterface.get_action_handlers.
         """
 
-        switcher = {
+        return {
             self.Action.GET_ROW_COUNT:
-                lambda: self._get_row_count(values),
+                self._get_row_count,
             self.Action.GET_COLUMN_COUNT:
-                lambda: self._get_column_count(values),
+                self._get_column_count,
             self.Action.SELECT_ROW_BY_INDEX:
-                lambda: self._select_row_by_index(values),
+                self._select_row_by_index,
             self.Action.SELECT_ROW_BY_NAME:
-                lambda: self._select_row_by_name(values),
+                self._select_row_by_name,
             self.Action.GET_SELECTED_ROWS:
-                lambda: self._get_selected_rows(values),
+                self._get_selected_rows,
             self.Action.GET_ALL_DATA:
-                lambda: self._get_all_data(values),
+                self._get_all_data,
             self.Action.GET_HEADER:
-                lambda: self._get_header(values),
+                self._get_header,
+            self.Action.SHOULD_CONTAIN_ROW:
+                self._should_contain_row,
+            self.Action.GET_ROW_WHERE:
+                self._get_row_where,
+            self.Action.SET_ROW_INDEX:
+                self._set_row_index,
         }
 
-        return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
-
     @staticmethod
     def _get_row_count(container: Container) -> int:
         """
@@ -125,10 +159,16 @@ class Grid(ModuleInterface):
     def _get_all_data(container: Container) -> List[List[str]]:
         """
         Return all header and row cell values from the grid as nested lists.
+        Realized rows are read in bulk, rows are only realized page by page if the grid reports more rows than
+        are realized or if requested, see GridRows.iterate_virtualized.
 
         Args:
             container (Grid.Container): Container holding:
                 - container['element']: Grid/ListView control instance.
+                - container['start_row']: Optional row index from first row to read.
+                - container['end_row']: Optional row index after last row to read.
+                - container['columns']: Optional indices from columns to read.
+                - container['virtualized']: Optional; if True, rows are always realized page by page.
 
         Returns:
             List[List[str]]: First element is the header row (column texts),
@@ -136,25 +176,72 @@ class Grid(ModuleInterface):
                              Empty lists or placeholder rows are excluded.
         """
         control = container["element"]
-        values = []
-        data = []
+        values = [Grid._get_header(container)]
+        values.extend(GridRows.iterate_virtualized(control, container["start_row"], container["end_row"],
+                                                   container["columns"], bool(container["virtualized"])))
 
-        for column in control.Header.Columns:
-            data.append(column.Text)
+        return values
 
-        values.append(data)
+    def _should_contain_row(self, container: Container) -> None:
+        """
+        Verify that the grid contains a row with the expected cell values.
+        Rows are read in bulk, page by page only for virtualized grids, and reading stops at the first matching row.
+        If the row index is enabled, rows are searched by the indexed value from the first compared column first.
 
-        for row in control.Rows:
-            data = []
-            for cell in row.Cells:
-                value = Grid._cell_value(cell)
-                if "NewItemPlaceholder" not in value:
-                    data.append(value)
+        Args:
+            container (Grid.Container): Container holding:
+                - container['element']: Grid/ListView control instance.
+                - container['values']: Expected cell values from the row.
+                - container['columns']: Optional indices from columns to compare, by default the leading columns.
+                - container['start_row']: Optional index from first row to search.
+                - container['end_row']: Optional index after last row to search.
 
-            if data:
-                values.append(data)
+        Raises:
+            FlaUiError: If no row contains the expected values.
+        """
+        control = container["element"]
+        expected = container["values"] or []
+        columns = container["columns"] if container["columns"] is not None else list(range(len(expected)))
 
-        return values
+        if self._use_row_index and expected and columns:
+            for (row_index, values) in self._row_index.find_rows(control, columns[0], expected[0]) or []:
+                if Grid._is_in_range(row_index, container["start_row"], container["end_row"]) and \
+                        Grid._select_values(values, columns) == expected:
+                    return
+
+        for row in GridRows.iterate_virtualized(control, container["start_row"], container["end_row"], columns):
+            if row == expected:
+                return
+
+        raise FlaUiError(FlaUiError.GridRowNotFound.format(expected))
+
+    @staticmethod
+    def _get_row_where(container: Container) -> List[str]:
+        """
+        Return cell values from the first row whose cell in the given column equals the expected value.
+        Rows are read in bulk, page by page only for virtualized grids, and reading stops at the first
+        matching row.
+
+        Args:
+            container (Grid.Container): Container holding:
+                - container['element']: Grid/ListView control instance.
+                - container['index']: Integer column index to compare.
+                - container['name']: Expected cell text in the specified column.
+
+        Returns:
+            List[str]: Cell values from the matching row.
+
+        Raises:
+            FlaUiError: If no row contains the expected value in the specified column.
+        """
+        index = container["index"]
+        name = container["name"]
+
+        for row in GridRows.iterate_virtualized(container["element"]):
+            if 0 <= index < len(row) and row[index] == name:
+                return row
+
+        raise FlaUiError(FlaUiError.ListviewItemNotFound.format(name, index))
 
     @staticmethod
     def _get_header(container: Container) -> List[str]:
@@ -174,6 +261,10 @@ class Grid(ModuleInterface):
         for column in control.Header.Columns:
             data.append(column.Text)
 
+        columns = container.get("columns")
+        if columns is not None:
+            return [data[column] for column in columns if 0 <= column < len(data)]
+
         return data
 
     @staticmethod
@@ -195,28 +286,11 @@ class Grid(ModuleInterface):
         for row in control.SelectedItems:
             values += "| "
             for cell in row.Cells:
-                values += Grid._cell_value(cell) + " | "
+                values += GridRows.cell_value(cell) + " | "
             values += "\n"
 
         return values
 
-    @staticmethod
-    def _cell_value(cell: Any) -> str:
-        """
-        Return a cell's display value as text.
-
-        UIA2 DataGrid template cells can report None or raise when ValuePattern
-        is missing. Treat those as an empty string so grid keywords stay stable.
-        """
-        try:
-            value = cell.Value
-        except (AttributeError, InvalidOperationException, NullReferenceException, CSharpException):
-            return ""
-
-        if value is None:
-            return ""
-        return str(value)
-
     @staticmethod
     def _select_row_by_index(container: Container) -> None:
         """
@@ -253,10 +327,10 @@ class Grid(ModuleInterface):
         except NullReferenceException:
             raise FlaUiError(FlaUiError.ArrayOutOfBoundException.format(index)) from None
 
-    @staticmethod
-    def _select_row_by_name(container: Container) -> None:
+    def _select_row_by_name(self, container: Container) -> None:
         """
         Select a row by providing a column index and expected cell text for that column.
+        If the row index is enabled, the row is searched by the indexed value from the column.
 
         Args:
             container (Grid.Container): Container holding:
@@ -274,6 +348,16 @@ class Grid(ModuleInterface):
         name = container["name"]
         multiselect = container["multiselect"]
 
+        if self._use_row_index and index >= 0:
+            rows = self._row_index.find_rows(control, index, name)
+            if rows is not None:
+                if not rows:
+                    raise FlaUiError(FlaUiError.ListviewItemNotFound.format(name, index))
+                Grid._select_row_by_index(Grid.create_value_container(element=control,
+                                                                      index=rows[0][0],
+                                                                      multiselect=multiselect))
+                return
+
         try:
             if control.RowCount > 0:
                 if multiselect:
@@ -289,3 +373,29 @@ class Grid(ModuleInterface):
             raise FlaUiError(FlaUiError.ListviewItemNotFound.format(name, index)) from None
         except NullReferenceException:
             raise FlaUiError(FlaUiError.ListviewItemNotFound.format(name, index)) from None
+
+    def _set_row_index(self, container: Container) -> None:
+        """
+        Enable or disable the index from cell values to rows, indexed grids are removed if disabled.
+
+        Args:
+            container (Grid.Container): Container holding:
+                - container['enabled']: Boolean; if True, row lookups by cell value use the row index.
+        """
+        self._use_row_index = bool(container["enabled"])
+        if not self._use_row_index:
+            self._row_index.clear()
+
+    @staticmethod
+    def _is_in_range(row_index: int, start_row: Optional[int], end_row: Optional[int]) -> bool:
+        """
+        Return True if a row index is between start row and end row, end row is excluded.
+        """
+        return (start_row is None or row_index >= start_row) and (end_row is None or row_index < end_row)
+
+    @staticmethod
+    def _select_values(values: List[str], columns: List[int]) -> List[str]:
+        """
+        Return cell values from given column indices, columns which do not exist in a row are ignored.
+        """
+        return [values[column] for column in columns if 0 <= column < len(values)]
@@ -1,6 +1,6 @@
 import time
 from enum import Enum
-from typing import Optional, Any
+from typing import Optional, Any, Dict, Callable
 from FlaUI.Core.Input import Keyboard as FlaUIKeyboard  # pylint: disable=import-error
 from FlaUILibrary.flaui.util.converter import Converter
 from FlaUILibrary.flaui.util.keyboardinputconverter import KeyboardInputConverter
@@ -54,27 +54,19 @@ class Keyboard(ModuleInterface):
                                   press_only=press_only,
                                   release_only=release_only)
 
-    def execute_action(self, action: Action, values: Container) -> Any:
+    def create_action_handlers(self) -> Dict[Enum, Callable[[Container], Any]]:
         """
-        If action is not supported an ActionNotSupported error will be raised.
-
-        Raises:
-            FlaUiError: If action is not supported.
-
-        Args:
-            action (Action): Action to use.
-            values (Object): See action definitions for value usage.
+        Creates handlers from all supported actions. Each handler receives the value container from action.
+        Called once by the module interface, see ModuleInterface.get_action_handlers.
         """
 
-        switcher = {
+        return {
         self.Action.KEYS_COMBINATIONS:
-            lambda: self._type_keys_combinations(values),
+            self._type_keys_combinations,
         self.Action.KEY_COMBINATION:
-            lambda: self._type_key_combination(values)
+            self._type_key_combination
         }
 
-        return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
-
     @staticmethod
     def _type_keys(keys: Any) -> None:
         """
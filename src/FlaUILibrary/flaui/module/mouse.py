@@ -1,6 +1,6 @@
 from __future__ import annotations
 from enum import Enum
-from typing import Optional, Any
+from typing import Optional, Any, Dict, Callable
 import time
 import FlaUI.Core.Input  # pylint: disable=import-error
 from FlaUI.Core.Input import Mouse as FlaUIMouse # pylint: disable=import-error
@@ -11,6 +11,7 @@ from FlaUILibrary.flaui.exception.flauierror import FlaUiError
 from FlaUILibrary.flaui.interface.moduleinterface import ModuleInterface
 from FlaUILibrary.flaui.interface.valuecontainer import ValueContainer
 from FlaUILibrary.flaui.module.element import Element
+from FlaUILibrary.flaui.util.backoff import Backoff
 from FlaUILibrary.flaui.util.converter import Converter
 from FlaUILibrary.flaui.util.point import Point
 
@@ -131,67 +132,59 @@ class Mouse(ModuleInterface):
                                second_x=Converter.cast_to_int(second_x),
                                second_y=Converter.cast_to_int(second_y))
 
-    def execute_action(self, action: Action, values: Container) -> Any:
+    def create_action_handlers(self) -> Dict[Enum, Callable[[Container], Any]]:
         """
-        If action is not supported an ActionNotSupported error will be raised.
-
-        Raises:
-            FlaUiError: If action is not supported.
-
-        Args:
-            action (Action): Action to use.
-            values (Object): See supported action definitions for value usage.
+        Creates handlers from all supported actions. Each handler receives the value container from action.
+        Called once by the module interface, see ModuleInterface.get_action_handlers.
         """
 
-        switcher = {
+        return {
             self.Action.LEFT_CLICK:
-                lambda: self._click(values),
+                self._click,
             self.Action.LEFT_CLICK_OPEN:
-                lambda: self._click_open(Mouse._click, values),
+                lambda values: self._click_open(Mouse._click, values),
             self.Action.RIGHT_CLICK_OPEN:
-                lambda: self._click_open(Mouse._right_click, values),
+                lambda values: self._click_open(Mouse._right_click, values),
             self.Action.DOUBLE_CLICK_OPEN:
-                lambda: self._click_open(Mouse._double_click, values),
+                lambda values: self._click_open(Mouse._double_click, values),
             self.Action.MIDDLE_CLICK_OPEN:
-                lambda: self._click_open(Mouse._middle_click, values),
+                lambda values: self._click_open(Mouse._middle_click, values),
             self.Action.LEFT_CLICK_HOLD_OPEN:
-                lambda: self._click_open(Mouse._click_hold, values),
+                lambda values: self._click_open(Mouse._click_hold, values),
             self.Action.LEFT_CLICK_CLOSE:
-                lambda: self._click_close(Mouse._click, values),
+                lambda values: self._click_close(Mouse._click, values),
             self.Action.RIGHT_CLICK_CLOSE:
-                lambda: self._click_close(Mouse._right_click, values),
+                lambda values: self._click_close(Mouse._right_click, values),
             self.Action.DOUBLE_CLICK_CLOSE:
-                lambda: self._click_close(Mouse._double_click, values),
+                lambda values: self._click_close(Mouse._double_click, values),
             self.Action.MIDDLE_CLICK_CLOSE:
-                lambda: self._click_close(Mouse._middle_click, values),
+                lambda values: self._click_close(Mouse._middle_click, values),
             self.Action.LEFT_CLICK_HOLD_CLOSE:
-                lambda: self._click_close(Mouse._click_hold, values),
+                lambda values: self._click_close(Mouse._click_hold, values),
             self.Action.RIGHT_CLICK:
-                lambda: self._right_click(values),
+                self._right_click,
             self.Action.MIDDLE_CLICK:
-                lambda: self._middle_click(values),
+                self._middle_click,
             self.Action.DOUBLE_CLICK:
-                lambda: self._double_click(values),
+                self._double_click,
             self.Action.LEFT_CLICK_HOLD:
-                lambda: self._click_hold(values),
+                self._click_hold,
             self.Action.RIGHT_CLICK_HOLD:
-                lambda: self._right_click_hold(values),
+                self._right_click_hold,
             self.Action.DOUBLE_CLICK_HOLD:
-                lambda: self._double_click_hold(values),
+                self._double_click_hold,
             self.Action.MIDDLE_CLICK_HOLD:
-                lambda: self._middle_click_hold(values),
+                self._middle_click_hold,
             self.Action.MOVE_TO:
-                lambda: self._move_to(values),
+                self._move_to,
             self.Action.DRAG_AND_DROP:
-                lambda: self._drag_and_drop(values),
+                self._drag_and_drop,
             self.Action.SCROLL_UP:
-                lambda: self._scroll(values),
+                self._scroll,
             self.Action.SCROLL_DOWN:
-                lambda: self._scroll(values)
+                self._scroll
         }
 
-        return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
-
     @staticmethod
     def _resolve_point(container: Container,
                        element_key: str = "element",
@@ -283,7 +276,7 @@ class Mouse(ModuleInterface):
           - focus_element_xpath_before (str|None): optional focus element before clicking
           - focus_element_xpath_after (str|None): optional focus element after open
           - max_repeat (int): retry count
-          - timeout_in_ms (int): wait between retries (milliseconds)
+          - timeout_in_ms (int): maximum wait for the goal element after each click (milliseconds)
           - hold_time_in_ms (int): hold time forwarded to the click action
           - ignore_if (bool): skip if open element already present
         Returns:
@@ -325,20 +318,15 @@ class Mouse(ModuleInterface):
                     ))
 
                 if _click_element_found:
-                    element_container = Element.create_value_container(xpath=open_element_xpath)
-                    open_element = self._uia.action(action=Element.Action.GET_ELEMENT_BY_XPATH,
-                                                    values=element_container)
-
-                    if open_element:
+                    if self._poll_element(open_element_xpath, True, timeout_between_repeats):
                         _open_element_found = True
                         if focus_element_xpath_after_open:
                             element_container = Element.create_value_container(xpath=focus_element_xpath_after_open,
                                                                        retry_timeout_in_milliseconds=0)
                             self._uia.action(action=Element.Action.FOCUS_ELEMENT, values=element_container)
                         return True
-
-                if timeout_between_repeats > 0:
-                    time.sleep(float(timeout_between_repeats) / 1000)
+                else:
+                    self._poll_element(click_element_xpath, True, timeout_between_repeats)
 
             if not _click_element_found and not _open_element_found:
                 raise FlaUiError(FlaUiError.ElementNotExists.format(click_element_xpath))
@@ -356,7 +344,7 @@ class Mouse(ModuleInterface):
           - focus_element_xpath_before (str|None): optional focus element before clicking
           - focus_element_xpath_after (str|None): optional focus element after close
           - max_repeat (int): retry count
-          - timeout_in_ms (int): wait between retries (milliseconds)
+          - timeout_in_ms (int): maximum wait for the goal element after each click (milliseconds)
           - hold_time_in_ms (int): hold time forwarded to the click action
           - ignore_if (bool): skip if close element already absent
         Returns:
@@ -396,20 +384,15 @@ class Mouse(ModuleInterface):
                     ))
 
                 if _click_element_found:
-                    element_container = Element.create_value_container(xpath=close_element_xpath)
-                    close_element = self._uia.action(action=Element.Action.GET_ELEMENT_BY_XPATH,
-                                                     values=element_container)
-
-                    if not close_element and _click_element_found:
+                    if self._poll_element(close_element_xpath, False, timeout_between_repeats):
                         if focus_element_xpath_after_close:
                             element_container = Element.create_value_container(
                                 xpath=focus_element_xpath_after_close,
                                 retry_timeout_in_milliseconds=0)
                             self._uia.action(action=Element.Action.FOCUS_ELEMENT, values=element_container)
                         return True
-
-                if timeout_between_repeats > 0:
-                    time.sleep(float(timeout_between_repeats) / 1000)
+                else:
+                    self._poll_element(click_element_xpath, True, timeout_between_repeats)
 
             if not _click_element_found:
                 raise FlaUiError(FlaUiError.ElementNotExists.format(click_element_xpath))
@@ -417,6 +400,26 @@ class Mouse(ModuleInterface):
         except NoClickablePointException:
             raise FlaUiError(FlaUiError.ElementNotClickable) from None
 
+    def _poll_element(self, xpath: str, should_exist: bool, timeout_in_ms: int) -> bool:
+        """
+        Polls by exponential backoff until the element exists or does not exist anymore.
+
+        Args:
+            xpath (str): XPath from element to poll.
+            should_exist (bool): True to wait until element exists, False to wait until element is absent.
+            timeout_in_ms (int): Maximum time to poll in milliseconds. Zero checks only once.
+
+        Returns:
+            bool: True if expected state was reached within timeout.
+        """
+        element_container = Element.create_value_container(xpath=xpath)
+
+        def has_expected_state() -> bool:
+            element = self._uia.action(action=Element.Action.GET_ELEMENT_BY_XPATH, values=element_container)
+            return bool(element) == should_exist
+
+        return Backoff(timeout_in_ms=timeout_in_ms or 0).poll(has_expected_state)
+
     @staticmethod
     def _click(container: Container) -> None:
         """
@@ -1,9 +1,13 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Any, Tuple
-from FlaUI.UIA2.Identifiers import TextAttributes as AttributesUia2  # pylint: disable=import-error
-from FlaUI.UIA3.Identifiers import TextAttributes as AttributesUia3  # pylint: disable=import-error
+from typing import Optional, Any, Tuple, List, Dict, Callable
+from System import Array  # pylint: disable=import-error
+from System import Exception as CSharpException  # pylint: disable=import-error
 from FlaUI.Core.Definitions import WindowVisualState as NetWidowVisualState  # pylint: disable=import-error
+from FlaUI.Core.Definitions import TreeScope  # pylint: disable=import-error
+from FlaUI.Core import CacheRequest  # pylint: disable=import-error
+from FlaUI.Core.Identifiers import PropertyId  # pylint: disable=import-error
+from FlaUILibrary.pythonnetwrapper import load_assemblies
 from FlaUILibrary.flaui.util.converter import Converter
 from FlaUILibrary.flaui.util.legacy_iaccessible import LegacyIAccessibleProperties
 from FlaUILibrary.flaui.interface.moduleinterface import ModuleInterface
@@ -32,6 +36,7 @@ class Property(ModuleInterface):
         element: Optional[Any]
         uia: str
         visual_state: Optional["Property.WindowVisualState"]
+        property_names: Optional[List[str]]
 
     class Action(Enum):
         """
@@ -80,11 +85,29 @@ class Property(ModuleInterface):
         LEGACY_IACCESSIBLE_CHILD_ID = "PROPERTY_LEGACY_IACCESSIBLE_CHILD_ID"
         LEGACY_IACCESSIBLE_IS_EXPANDED = "PROPERTY_LEGACY_IACCESSIBLE_IS_EXPANDED"
         LEGACY_IACCESSIBLE_IS_COLLAPSED = "PROPERTY_LEGACY_IACCESSIBLE_IS_COLLAPSED"
+        PROPERTIES = "PROPERTY_PROPERTIES"
+
+    # Property names from control patterns as (pattern property library, property name)
+    _PATTERN_PROPERTIES = {
+        "Value": ("Value", "Value"),
+        "IsReadOnly": ("Value", "IsReadOnly"),
+        "ToggleState": ("Toggle", "ToggleState"),
+        "ExpandCollapseState": ("ExpandCollapse", "ExpandCollapseState"),
+        "IsSelected": ("SelectionItem", "IsSelected"),
+        "RangeValue": ("RangeValue", "Value"),
+        "RangeMinimum": ("RangeValue", "Minimum"),
+        "RangeMaximum": ("RangeValue", "Maximum"),
+        "WindowVisualState": ("Window", "WindowVisualState"),
+        "WindowInteractionState": ("Window", "WindowInteractionState"),
+        "CanMaximize": ("Window", "CanMaximize"),
+        "CanMinimize": ("Window", "CanMinimize"),
+    }
 
     @staticmethod
     def create_value_container(element: Any = None,
                                uia: str = None,
-                               visual_state: WindowVisualState = WindowVisualState.NORMAL) -> Container:
+                               visual_state: WindowVisualState = WindowVisualState.NORMAL,
+                               property_names: List[str] = None) -> Container:
         """
         Helper to create container object.
 
@@ -92,114 +115,110 @@ class Property(ModuleInterface):
             element (Object): Element to grab property.
             uia (string): User interface identifier
             visual_state (WindowVisualState): Window visual state enum value.
+            property_names (List): Names from automation properties to read.
         """
         return Property.Container(element=element,
                                   uia=uia,
-                                  visual_state=visual_state)
+                                  visual_state=visual_state,
+                                  property_names=property_names)
 
-    def execute_action(self, action: Action, values: Container) -> Any:
+    def create_action_handlers(self) -> Dict[Enum, Callable[[Container], Any]]:
         """
-        If action is not supported an ActionNotSupported error will be raised.
-
-        Raises:
-            FlaUiError: If action is not supported.
-
-        Args:
-            action (Action): Action to use.
-            values (Object): See action definitions for value usage.
+        Creates handlers from all supported actions. Each handler receives the value container from action.
+        Called once by the module interface, see ModuleInterface.get_action_handlers.
         """
 
-        switcher = {
+        return {
             self.Action.FOREGROUND_COLOR:
-                lambda: self._get_foreground_color(values),
+                self._get_foreground_color,
             self.Action.BACKGROUND_COLOR:
-                lambda: self._get_background_color(values),
+                self._get_background_color,
             self.Action.FONT_SIZE:
-                lambda: self._get_font_size(values),
+                self._get_font_size,
             self.Action.FONT_NAME:
-                lambda: self._get_font_name(values),
+                self._get_font_name,
             self.Action.FONT_WEIGHT:
-                lambda: self._get_font_weight(values),
+                self._get_font_weight,
             self.Action.CULTURE:
-                lambda: self._get_culture(values),
+                self._get_culture,
             self.Action.IS_HIDDEN:
-                lambda: self._is_hidden(values),
+                self._is_hidden,
             self.Action.WINDOW_VISUAL_STATE:
-                lambda: self._get_window_visual_state(values),
+                self._get_window_visual_state,
             self.Action.WINDOW_INTERACTION_STATE:
-                lambda: self._get_window_interaction_state(values),
+                self._get_window_interaction_state,
             self.Action.TOGGLE_STATE:
-                lambda: self._get_toggle_state(values),
+                self._get_toggle_state,
             self.Action.MAXIMIZE_WINDOW:
-                lambda: self._set_window_visual_state(values),
+                self._set_window_visual_state,
             self.Action.MINIMIZE_WINDOW:
-                lambda: self._set_window_visual_state(values),
+                self._set_window_visual_state,
             self.Action.NORMALIZE_WINDOW:
-                lambda: self._set_window_visual_state(values),
+                self._set_window_visual_state,
             self.Action.CAN_WINDOW_MAXIMIZE:
-                lambda: self._can_window_maximize(values),
+                self._can_window_maximize,
             self.Action.CAN_WINDOW_MINIMIZE:
-                lambda: self._can_window_minimize(values),
+                self._can_window_minimize,
             self.Action.IS_READ_ONLY:
-                lambda: self._is_read_only(values),
+                self._is_read_only,
             self.Action.IS_WINDOW_PATTERN_SUPPORTED:
-                lambda: self._is_window_pattern_supported(values),
+                self._is_window_pattern_supported,
             self.Action.IS_TEXT_PATTERN_SUPPORTED:
-                lambda: self._is_text_pattern_supported(values),
+                self._is_text_pattern_supported,
             self.Action.IS_TOGGLE_PATTERN_SUPPORTED:
-                lambda: self._is_toggle_pattern_supported(values),
+                self._is_toggle_pattern_supported,
             self.Action.IS_VALUE_PATTERN_SUPPORTED:
-                lambda: self._is_value_pattern_supported(values),
+                self._is_value_pattern_supported,
             self.Action.IS_RANGEVALUE_PATTERN_SUPPORTED:
-                lambda: self._is_rangevalue_pattern_supported(values),
+                self._is_rangevalue_pattern_supported,
             self.Action.VALUE:
-                lambda: self._get_value_from_value_pattern(values),
+                self._get_value_from_value_pattern,
             self.Action.RANGEVALUE:
-                lambda: self._get_value_from_rangevalue_pattern(values),
+                self._get_value_from_rangevalue_pattern,
             self.Action.RANGEMINIMUM:
-                lambda: self._get_minimum_from_rangevalue_pattern(values),
+                self._get_minimum_from_rangevalue_pattern,
             self.Action.RANGEMAXIMUM:
-                lambda: self._get_maximum_from_rangevalue_pattern(values),
+                self._get_maximum_from_rangevalue_pattern,
             self.Action.IS_EXPAND_COLLAPSE_PATTERN_SUPPORTED:
-                lambda: self._is_expand_collapse_pattern_supported(values),
+                self._is_expand_collapse_pattern_supported,
             self.Action.EXPAND_COLLAPSE_STATE:
-                lambda: self._get_expand_collapse_pattern_state(values),
+                self._get_expand_collapse_pattern_state,
             self.Action.IS_SELECTION_ITEM_PATTERN_SUPPORTED:
-                lambda: self._is_selection_item_pattern_supported(values),
+                self._is_selection_item_pattern_supported,
             self.Action.IS_SELECTED:
-                lambda: self._is_selected(values),
+                self._is_selected,
             self.Action.STAGE_FOR_COMBOBOX_SELECTIONITEM:
-                lambda: self._stage_for_combobox_selectionitem(values),
+                self._stage_for_combobox_selectionitem,
             self.Action.HELP_TEXT:
-                lambda: self._get_help_text(values),
+                self._get_help_text,
             self.Action.IS_LEGACY_IACCESSIBLE_PATTERN_SUPPORTED:
-                lambda: LegacyIAccessibleProperties.is_supported(values["element"]),
+                lambda values: LegacyIAccessibleProperties.is_supported(values["element"]),
             self.Action.LEGACY_IACCESSIBLE_STATE:
-                lambda: LegacyIAccessibleProperties.get_state(values["element"]),
+                lambda values: LegacyIAccessibleProperties.get_state(values["element"]),
             self.Action.LEGACY_IACCESSIBLE_ROLE:
-                lambda: LegacyIAccessibleProperties.get_role(values["element"]),
+                lambda values: LegacyIAccessibleProperties.get_role(values["element"]),
             self.Action.LEGACY_IACCESSIBLE_NAME:
-                lambda: LegacyIAccessibleProperties.get_name(values["element"]),
+                lambda values: LegacyIAccessibleProperties.get_name(values["element"]),
             self.Action.LEGACY_IACCESSIBLE_VALUE:
-                lambda: LegacyIAccessibleProperties.get_value(values["element"]),
+                lambda values: LegacyIAccessibleProperties.get_value(values["element"]),
             self.Action.LEGACY_IACCESSIBLE_DEFAULT_ACTION:
-                lambda: LegacyIAccessibleProperties.get_default_action(values["element"]),
+                lambda values: LegacyIAccessibleProperties.get_default_action(values["element"]),
             self.Action.LEGACY_IACCESSIBLE_DESCRIPTION:
-                lambda: LegacyIAccessibleProperties.get_description(values["element"]),
+                lambda values: LegacyIAccessibleProperties.get_description(values["element"]),
             self.Action.LEGACY_IACCESSIBLE_HELP:
-                lambda: LegacyIAccessibleProperties.get_help(values["element"]),
+                lambda values: LegacyIAccessibleProperties.get_help(values["element"]),
             self.Action.LEGACY_IACCESSIBLE_KEYBOARD_SHORTCUT:
-                lambda: LegacyIAccessibleProperties.get_keyboard_shortcut(values["element"]),
+                lambda values: LegacyIAccessibleProperties.get_keyboard_shortcut(values["element"]),
             self.Action.LEGACY_IACCESSIBLE_CHILD_ID:
-                lambda: LegacyIAccessibleProperties.get_child_id(values["element"]),
+                lambda values: LegacyIAccessibleProperties.get_child_id(values["element"]),
             self.Action.LEGACY_IACCESSIBLE_IS_EXPANDED:
-                lambda: LegacyIAccessibleProperties.is_expanded(values["element"]),
+                lambda values: LegacyIAccessibleProperties.is_expanded(values["element"]),
             self.Action.LEGACY_IACCESSIBLE_IS_COLLAPSED:
-                lambda: LegacyIAccessibleProperties.is_collapsed(values["element"]),
+                lambda values: LegacyIAccessibleProperties.is_collapsed(values["element"]),
+            self.Action.PROPERTIES:
+                self._get_properties,
         }
 
-        return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
-
     @staticmethod
     def _get_window_visual_state(container: Container) -> str:
         """
@@ -228,12 +247,9 @@ class Property(ModuleInterface):
         Returns:
             Tuple[int, int, int, int]: Foreground color components.
         """
-        uia = container["uia"]
+        attributes = Property._get_text_attributes(container["uia"])
         pattern = Property._get_text_pattern_from_element(container)
-        if uia == "UIA2":
-            return Property._int_to_rgba(pattern.DocumentRange.GetAttributeValue(AttributesUia2.ForegroundColor))
-
-        return Property._int_to_rgba(pattern.DocumentRange.GetAttributeValue(AttributesUia3.ForegroundColor))
+        return Property._int_to_rgba(pattern.DocumentRange.GetAttributeValue(attributes.ForegroundColor))
 
     @staticmethod
     def _get_background_color(container: Container) -> Tuple[int, int, int, int]:
@@ -248,12 +264,9 @@ class Property(ModuleInterface):
         Returns:
             Tuple[int, int, int, int]: Background color components.
         """
-        uia = container["uia"]
+        attributes = Property._get_text_attributes(container["uia"])
         pattern = Property._get_text_pattern_from_element(container)
-        if uia == "UIA2":
-            return Property._int_to_rgba(pattern.DocumentRange.GetAttributeValue(AttributesUia2.BackgroundColor))
-
-        return Property._int_to_rgba(pattern.DocumentRange.GetAttributeValue(AttributesUia3.BackgroundColor))
+        return Property._int_to_rgba(pattern.DocumentRange.GetAttributeValue(attributes.BackgroundColor))
 
     @staticmethod
     def _get_font_size(container: Container) -> float:
@@ -268,12 +281,9 @@ class Property(ModuleInterface):
         Returns:
             float: Font size as a float.
         """
-        uia = container["uia"]
+        attributes = Property._get_text_attributes(container["uia"])
         pattern = Property._get_text_pattern_from_element(container)
-        if uia == "UIA2":
-            return float(pattern.DocumentRange.GetAttributeValue(AttributesUia2.FontSize))
-
-        return float(pattern.DocumentRange.GetAttributeValue(AttributesUia3.FontSize))
+        return float(pattern.DocumentRange.GetAttributeValue(attributes.FontSize))
 
     @staticmethod
     def _get_font_name(container: Container) -> str:
@@ -288,12 +298,9 @@ class Property(ModuleInterface):
         Returns:
             str: Font family/name string.
         """
-        uia = container["uia"]
+        attributes = Property._get_text_attributes(container["uia"])
         pattern = Property._get_text_pattern_from_element(container)
-        if uia == "UIA2":
-            return str(pattern.DocumentRange.GetAttributeValue(AttributesUia2.FontName))
-
-        return str(pattern.DocumentRange.GetAttributeValue(AttributesUia3.FontName))
+        return str(pattern.DocumentRange.GetAttributeValue(attributes.FontName))
 
     @staticmethod
     def _get_font_weight(container: Container) -> float:
@@ -308,12 +315,9 @@ class Property(ModuleInterface):
         Returns:
             float: Font weight as a float.
         """
-        uia = container["uia"]
+        attributes = Property._get_text_attributes(container["uia"])
         pattern = Property._get_text_pattern_from_element(container)
-        if uia == "UIA2":
-            return float(pattern.DocumentRange.GetAttributeValue(AttributesUia2.FontWeight))
-
-        return float(pattern.DocumentRange.GetAttributeValue(AttributesUia3.FontWeight))
+        return float(pattern.DocumentRange.GetAttributeValue(attributes.FontWeight))
 
     @staticmethod
     def _get_culture(container: Container) -> str:
@@ -337,7 +341,7 @@ class Property(ModuleInterface):
             # See --> https://github.com/FlaUI/FlaUI/issues/554
             raise FlaUiError(FlaUiError.PropertyNotSupported)
 
-        return str(pattern.DocumentRange.GetAttributeValue(AttributesUia3.Culture).ToString())
+        return str(pattern.DocumentRange.GetAttributeValue(Property._get_text_attributes(uia).Culture).ToString())
 
     @staticmethod
     def _is_hidden(container: Container) -> bool:
@@ -352,12 +356,9 @@ class Property(ModuleInterface):
         Returns:
             bool: True if the element is hidden according to the Text pattern.
         """
-        uia = container["uia"]
+        attributes = Property._get_text_attributes(container["uia"])
         pattern = Property._get_text_pattern_from_element(container)
-        if uia == "UIA2":
-            return Converter.cast_to_bool(pattern.DocumentRange.GetAttributeValue(AttributesUia2.IsHidden))
-
-        return Converter.cast_to_bool(pattern.DocumentRange.GetAttributeValue(AttributesUia3.IsHidden))
+        return Converter.cast_to_bool(pattern.DocumentRange.GetAttributeValue(attributes.IsHidden))
 
     @staticmethod
     def _get_toggle_state(container: Container) -> str:
@@ -389,6 +390,28 @@ class Property(ModuleInterface):
         pattern = Property._get_window_pattern_from_element(container)
         return str(pattern.WindowInteractionState.Value.ToString())
 
+    @staticmethod
+    def _get_text_attributes(uia: str) -> Any:
+        """
+        Retrieve the TextAttributes identifiers from UIA2 or UIA3.
+        Imported on first usage, so only the assembly from the automation in use is loaded.
+
+        Args:
+            uia (str): 'UIA2' or 'UIA3' string to select identifiers.
+
+        Returns:
+            Any: TextAttributes class with attribute identifiers.
+        """
+        # pylint: disable=import-error,import-outside-toplevel
+        if uia == "UIA2":
+            load_assemblies("UIA2")
+            from FlaUI.UIA2.Identifiers import TextAttributes
+            return TextAttributes
+
+        load_assemblies("UIA3")
+        from FlaUI.UIA3.Identifiers import TextAttributes
+        return TextAttributes
+
     @staticmethod
     def _get_text_pattern_from_element(container: Container) -> Any:
         """
@@ -893,3 +916,117 @@ class Property(ModuleInterface):
         red = (argb_int >> 16) & 255
         alpha = (argb_int >> 24) & 255
         return red, green, blue, alpha
+
+    @staticmethod
+    def _get_properties(container: Container) -> Dict[str, Any]:
+        """
+        Return multiple automation property values from the element in one round trip.
+
+        All requested properties are fetched by a UIA CacheRequest for the element only.
+        If caching is not available the properties are read one by one from the live element.
+
+        Args:
+            container (Container): Container holding:
+                - container['element']: Element to read properties from.
+                - container['property_names']: Names from properties like Name, IsEnabled, Value or ToggleState.
+
+        Returns:
+            Dict[str, Any]: Property name to value. Value is None if the property is not supported by the element.
+
+        Raises:
+            FlaUiError: If a property name is unknown.
+        """
+        element = container["element"]
+        names = container["property_names"] or []
+        library = element.Automation.PropertyLibrary
+        property_ids = [(name, Property._get_property_id(library, name)) for name in names]
+
+        try:
+            cache_request = CacheRequest()
+            cache_request.TreeScope = TreeScope.Element
+            for _, property_id in property_ids:
+                cache_request.Add(property_id)
+
+            cache = cache_request.Activate()
+            try:
+                cached_element = element.FrameworkAutomationElement.GetUpdatedCache()
+                return Property._read_property_values(cached_element, property_ids)
+            finally:
+                cache.Dispose()
+        except (CSharpException, AttributeError):
+            return Property._read_property_values(element, property_ids)
+
+    @staticmethod
+    def _get_property_id(library: Any, name: str) -> Any:
+        """
+        Resolve a property name to a property id from the automation property library.
+
+        Supported names are element properties like Name or IsEnabled, pattern property aliases like Value or
+        ToggleState and pattern properties with library prefix like Toggle.ToggleState.
+
+        Args:
+            library (Object): Property library from automation object.
+            name (str): Property name.
+
+        Returns:
+            PropertyId: Property id from library.
+
+        Raises:
+            FlaUiError: If property name is unknown.
+        """
+        if name in Property._PATTERN_PROPERTIES:
+            (pattern, property_name) = Property._PATTERN_PROPERTIES[name]
+        elif "." in name:
+            (pattern, property_name) = name.split(".", 1)
+        else:
+            (pattern, property_name) = ("Element", name)
+
+        property_id = getattr(getattr(library, pattern, None), property_name, None)
+        if not isinstance(property_id, PropertyId):
+            raise FlaUiError(FlaUiError.PropertyNameNotSupported.format(name))
+
+        return property_id
+
+    @staticmethod
+    def _read_property_values(element: Any, property_ids: List[Tuple[str, Any]]) -> Dict[str, Any]:
+        """
+        Read property values from an element. If caching is active the values are taken from cache.
+
+        Args:
+            element (Object): Automation element.
+            property_ids (List): List of (name, property id) tuples.
+
+        Returns:
+            Dict[str, Any]: Property name to converted value.
+        """
+        values = {}
+        for name, property_id in property_ids:
+            (is_supported, value) = element.FrameworkAutomationElement.TryGetPropertyValue(property_id)
+            values[name] = Property._convert_property_value(value) if is_supported else None
+
+        return values
+
+    @staticmethod
+    def _convert_property_value(value: Any) -> Any:
+        """
+        Convert a .NET property value to a python value.
+
+        Args:
+            value (Object): Property value.
+
+        Returns:
+            Primitive values unchanged, arrays as list, rectangles as [X, Y, Width, Height], otherwise string.
+        """
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+
+        if isinstance(value, Array):
+            return [Property._convert_property_value(item) for item in value]
+
+        if all(hasattr(value, attribute) for attribute in ("X", "Y", "Width", "Height")):
+            return [Converter.cast_to_int(value.X),
+                    Converter.cast_to_int(value.Y),
+                    Converter.cast_to_int(value.Width),
+                    Converter.cast_to_int(value.Height)]
+
+        return str(value.ToString())
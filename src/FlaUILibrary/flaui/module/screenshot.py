@@ -1,12 +1,19 @@
+import hashlib
 import os
+import queue
+import threading
 import time
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Optional, Dict, Callable, Tuple
 from FlaUI.Core.Capturing import Capture  # pylint: disable=import-error
 from System import Exception as CSharpException  # pylint: disable=import-error
 from System import Convert as CSharpConvert  # pylint: disable=import-error
+from System import Int64  # pylint: disable=import-error
 from System.IO import MemoryStream  # pylint: disable=import-error
-from System.Drawing.Imaging import ImageFormat  # pylint: disable=import-error
+from System.Drawing import Bitmap, Graphics, Rectangle  # pylint: disable=import-error
+from System.Drawing.Drawing2D import InterpolationMode  # pylint: disable=import-error
+from System.Drawing.Imaging import ImageFormat, ImageCodecInfo  # pylint: disable=import-error
+from System.Drawing.Imaging import Encoder, EncoderParameter, EncoderParameters  # pylint: disable=import-error
 from FlaUILibrary.flaui.exception.flauierror import FlaUiError
 from FlaUILibrary.flaui.interface.moduleinterface import ModuleInterface
 from FlaUILibrary.flaui.interface.valuecontainer import ValueContainer
@@ -32,6 +39,18 @@ class Screenshot(ModuleInterface):
         name: Optional[str]
         suffix: Optional[str]
         force: Optional[bool]
+        asynchronous: Optional[bool]
+        max_per_test: Optional[int]
+        min_interval_in_ms: Optional[int]
+        skip_duplicates: Optional[bool]
+        max_size_in_kb: Optional[int]
+        target: Optional[str]
+        x: Optional[int]
+        y: Optional[int]
+        width: Optional[int]
+        height: Optional[int]
+        max_dimension: Optional[int]
+        jpeg_quality: Optional[int]
 
     class Action(Enum):
         """
@@ -47,6 +66,11 @@ class Screenshot(ModuleInterface):
         SET_DIRECTORY = "SCREENSHOT_SET_DIRECTORY"
         SET_NAME = "SCREENSHOT_SET_NAME"
         SET_FILE_SUFFIX = "SCREENSHOT_SET_FILE_SUFFIX"
+        SET_ASYNCHRONOUS_TO = "SCREENSHOT_SET_ASYNCHRONOUS_TO"
+        FLUSH = "SCREENSHOT_FLUSH"
+        SET_LIMITS = "SCREENSHOT_SET_LIMITS"
+        SET_BASE64_SIZE_LIMIT = "SCREENSHOT_SET_BASE64_SIZE_LIMIT"
+        SET_CAPTURE_OPTIONS = "SCREENSHOT_SET_CAPTURE_OPTIONS"
 
     class ScreenshotMode(Enum):
         """
@@ -55,10 +79,39 @@ class Screenshot(ModuleInterface):
         FILE = "File"
         BASE64 = "Base64"
 
-    def __init__(self):
+    class CaptureTarget(Enum):
+        """
+        Supported capture targets if no element is given.
+        """
+        SCREEN = "Screen"
+        MAIN_SCREEN = "MainScreen"
+        WINDOW = "Window"
+        REGION = "Region"
+
+    # Maximum amount of captured images which are waiting to be written by the background writer.
+    # If the queue is full, images are written on the calling thread.
+    ASYNC_QUEUE_SIZE = 16
+
+    # Edge length in pixels from thumbnail which is hashed to detect identical screenshots.
+    HASH_THUMBNAIL_SIZE = 64
+
+    # Default quality from GDI+ JPEG encoder.
+    DEFAULT_JPEG_QUALITY = 75
+
+    # Re-encoding settings if a Base64 screenshot exceeds the size limit.
+    # Images are encoded as JPEG and scaled down by factor until the limit or the minimum edge length is reached.
+    BASE64_SCALE_FACTOR = 0.7
+    BASE64_MIN_EDGE_LENGTH = 160
+
+    def __init__(self, automation: Any = None):
         """
         Creates screenshot module to capture desktop or element images by an error.
+
+        Args:
+            automation (Object): Windows user automation object from uia2 or uia3 interface to find the
+                                 foreground window. If not set, window captures fall back to the screen.
         """
+        self._automation = automation
         self._img_counter = 1
         self._is_enabled = True
         self._directory = None
@@ -67,6 +120,22 @@ class Screenshot(ModuleInterface):
         self._filename = "test_{}_{}_{}.{}"
         self._name = ""
         self._mode = self.ScreenshotMode.FILE
+        self._is_async = True
+        self._write_queue = queue.Queue(maxsize=self.ASYNC_QUEUE_SIZE)
+        self._writer = None
+        self._write_errors = []
+        self._write_errors_lock = threading.Lock()
+        self._max_per_test = None
+        self._min_interval_in_ms = 0
+        self._skip_duplicates = True
+        self._test_captures = {}
+        self._test_capture_count = 0
+        self._last_capture_time = None
+        self._base64_max_size_in_kb = None
+        self._capture_target = self.CaptureTarget.SCREEN
+        self._capture_region = None
+        self._max_dimension = None
+        self._jpeg_quality = self.DEFAULT_JPEG_QUALITY
 
     @staticmethod
     def create_value_container(element=None,
@@ -75,7 +144,19 @@ class Screenshot(ModuleInterface):
                                directory=None,
                                name=None,
                                suffix=None,
-                               force=None) -> Container:
+                               force=None,
+                               asynchronous=None,
+                               max_per_test=None,
+                               min_interval_in_ms=None,
+                               skip_duplicates=None,
+                               max_size_in_kb=None,
+                               target=None,
+                               x=None,
+                               y=None,
+                               width=None,
+                               height=None,
+                               max_dimension=None,
+                               jpeg_quality=None) -> Container:
         """
         Helper to create container object.
 
@@ -87,6 +168,18 @@ class Screenshot(ModuleInterface):
             name (string): Additional name of screenshot. Will be used to capture test name.
             suffix (string): Additional suffix of screenshot filetype.
             force (bool): True to force screenshot capturing even if disabled.
+            asynchronous (bool): True to write failure screenshots in FILE mode by a background thread.
+            max_per_test (int): Maximum amount of failure screenshots per test, None for unlimited.
+            min_interval_in_ms (int): Minimum time between two failure screenshots in milliseconds.
+            skip_duplicates (bool): True to skip failure screenshots identical to a previous one from the same test.
+            max_size_in_kb (int): Maximum size from Base64 encoded screenshots in kilobytes, None for unlimited.
+            target (string): Capture target Screen, MainScreen, Window or Region if no element is given.
+            x (int): Left position from capture region in pixels.
+            y (int): Top position from capture region in pixels.
+            width (int): Width from capture region in pixels.
+            height (int): Height from capture region in pixels.
+            max_dimension (int): Maximum width and height from stored images in pixels, None for unlimited.
+            jpeg_quality (int): Quality from JPEG encoded images between 1 and 100.
         """
         return Screenshot.Container(element=element,
                                     enabled=enabled,
@@ -94,46 +187,58 @@ class Screenshot(ModuleInterface):
                                     directory=directory,
                                     name=name,
                                     suffix=suffix,
-                                    force=Converter.cast_to_bool(force))
-
-    def execute_action(self, action: Action, values: Container) -> Any:
-        """
-        If action is not supported an ActionNotSupported error will be raised.
-
-        Raises:
-            FlaUiError: If action is not supported.
-
-        Args:
-            action (Action): Action to use.
-            values (Object): See action definitions for value usage.
-        """
-
-        # pylint: disable=unnecessary-lambda
-        switcher = {
+                                    force=Converter.cast_to_bool(force),
+                                    asynchronous=Converter.cast_to_bool(asynchronous),
+                                    max_per_test=Converter.cast_to_int(max_per_test),
+                                    min_interval_in_ms=Converter.cast_to_int(min_interval_in_ms),
+                                    skip_duplicates=Converter.cast_to_bool(skip_duplicates),
+                                    max_size_in_kb=Converter.cast_to_int(max_size_in_kb),
+                                    target=Converter.cast_to_string(target),
+                                    x=Converter.cast_to_int(x),
+                                    y=Converter.cast_to_int(y),
+                                    width=Converter.cast_to_int(width),
+                                    height=Converter.cast_to_int(height),
+                                    max_dimension=Converter.cast_to_int(max_dimension),
+                                    jpeg_quality=Converter.cast_to_int(jpeg_quality))
+
+    def create_action_handlers(self) -> Dict[Enum, Callable[[Container], Any]]:
+        """
+        Creates handlers from all supported actions. Each handler receives the value container from action.
+        Called once by the module interface, see ModuleInterface.get_action_handlers.
+        """
+
+        return {
             self.Action.FORCE_CAPTURE:
-                lambda: self._capture(values),
+                self._capture,
             self.Action.CAPTURE:
-                lambda: self._capture(values),
+                lambda values: self._capture(values, on_failure=True),
             self.Action.CAPTURE_ELEMENT:
-                lambda: self._capture(values),
+                self._capture,
             self.Action.IS_ENABLED:
-                lambda: self._is_screenshot_enabled(),
+                lambda _: self._is_screenshot_enabled(),
             self.Action.SET_ENABLED_TO:
-                lambda: self._set_enabled_to(values),
+                self._set_enabled_to,
             self.Action.SET_MODE:
-                lambda: self._set_mode(values),
+                self._set_mode,
             self.Action.GET_MODE:
-                lambda: self._get_mode(),
+                lambda _: self._get_mode(),
             self.Action.SET_DIRECTORY:
-                lambda: self._set_directory(values),
+                self._set_directory,
             self.Action.SET_NAME:
-                lambda: self._set_name(values),
+                self._set_name,
             self.Action.SET_FILE_SUFFIX:
-                lambda: self._set_file_suffix(values)
+                self._set_file_suffix,
+            self.Action.SET_ASYNCHRONOUS_TO:
+                self._set_asynchronous_to,
+            self.Action.FLUSH:
+                lambda _: self._flush(),
+            self.Action.SET_LIMITS:
+                self._set_limits,
+            self.Action.SET_BASE64_SIZE_LIMIT:
+                self._set_base64_size_limit,
+            self.Action.SET_CAPTURE_OPTIONS:
+                self._set_capture_options
         }
-        # pylint: enable=unnecessary-lambda
-
-        return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
 
     def _is_screenshot_enabled(self) -> bool:
         """
@@ -157,6 +262,78 @@ class Screenshot(ModuleInterface):
         """
         name = container['name']
         self._name = self._clean_invalid_windows_syntax(name.replace(" ", "_").lower())
+        self._test_captures = {}
+        self._test_capture_count = 0
+        self._last_capture_time = None
+
+    def _set_limits(self, container: Container) -> None:
+        """
+        Configure limits for screenshots taken on failure within a single test.
+        Limits are reset with each new test by setting the screenshot name.
+
+        Args:
+            container (Screenshot.Container): Container holding:
+                - container['max_per_test']: Maximum amount of screenshots per test or None for unlimited.
+                - container['min_interval_in_ms']: Minimum time between two screenshots or None for no limit.
+                - container['skip_duplicates']: True to skip screenshots identical to a previous one.
+        """
+        max_per_test = container['max_per_test']
+        self._max_per_test = max_per_test if max_per_test is None or max_per_test >= 0 else None
+        self._min_interval_in_ms = max(container['min_interval_in_ms'] or 0, 0)
+        self._skip_duplicates = container['skip_duplicates']
+
+    def _set_base64_size_limit(self, container: Container) -> None:
+        """
+        Configure the maximum size from Base64 encoded screenshots.
+
+        Screenshots exceeding the limit as PNG are encoded as JPEG and scaled down until they fit.
+
+        Args:
+            container (Screenshot.Container): Container holding:
+                - container['max_size_in_kb']: Maximum size in kilobytes or None for unlimited.
+        """
+        max_size_in_kb = container['max_size_in_kb']
+        self._base64_max_size_in_kb = max_size_in_kb if max_size_in_kb is None or max_size_in_kb > 0 else None
+
+    def _set_capture_options(self, container: Container) -> None:
+        """
+        Configure what is captured if no element is given and how captured images are scaled and encoded.
+
+        Args:
+            container (Screenshot.Container): Container holding:
+                - container['target']: Screen, MainScreen, Window or Region (case-insensitive), default Screen.
+                - container['x'], container['y'], container['width'], container['height']: Region for target Region.
+                - container['max_dimension']: Maximum width and height in pixels or None for unlimited.
+                - container['jpeg_quality']: JPEG quality between 1 and 100 or None for default.
+
+        Raises:
+            FlaUiError: If target is not supported, region is invalid or JPEG quality is out of range.
+        """
+        target = container['target'] or self.CaptureTarget.SCREEN.value
+        capture_target = next((member for member in self.CaptureTarget
+                               if target.replace("_", "").lower() == member.value.lower()), None)
+        if capture_target is None:
+            FlaUiError.raise_fla_ui_error(FlaUiError.ScreenshotCaptureTargetNotSupported.format(target))
+
+        capture_region = None
+        if capture_target == self.CaptureTarget.REGION:
+            (x, y, width, height) = (container['x'], container['y'], container['width'], container['height'])
+            if x is None or y is None or not width or not height or width < 0 or height < 0:
+                FlaUiError.raise_fla_ui_error(FlaUiError.ScreenshotRegionInvalid)
+            capture_region = Rectangle(x, y, width, height)
+
+        jpeg_quality = container['jpeg_quality']
+        if jpeg_quality is None:
+            jpeg_quality = self.DEFAULT_JPEG_QUALITY
+        elif not 1 <= jpeg_quality <= 100:
+            FlaUiError.raise_fla_ui_error(FlaUiError.ScreenshotJpegQualityInvalid.format(jpeg_quality))
+
+        max_dimension = container['max_dimension']
+
+        self._capture_target = capture_target
+        self._capture_region = capture_region
+        self._max_dimension = max_dimension if max_dimension is None or max_dimension > 0 else None
+        self._jpeg_quality = jpeg_quality
 
     def _set_directory(self, container: Container) -> None:
         """
@@ -269,13 +446,31 @@ class Screenshot(ModuleInterface):
         enabled = container['enabled']
         self._is_enabled = enabled
 
-    def _capture(self, container: Container) -> Optional[str]:
+    def _set_asynchronous_to(self, container: Container) -> None:
+        """
+        Enable or disable writing failure screenshots by a background thread.
+
+        Only screenshots taken on failure in FILE mode are written asynchronously.
+        Screenshots from keywords are always written before the keyword returns.
+
+        Args:
+            container (Screenshot.Container): Container holding:
+                - container['asynchronous']: Boolean to enable (True) or disable (False).
+        """
+        self._is_async = container['asynchronous']
+
+        if not self._is_async:
+            self._flush()
+
+    def _capture(self, container: Container, on_failure: bool = False) -> Optional[str]:
         """
         Capture a screenshot for the given element or the full screen, depending on
         the configured mode and the provided container values.
 
         Behavior:
             - If module is disabled and not forced, returns None.
+            - On failure, returns None if the per test limits are reached and the previous
+              result if the screen is identical to a previous screenshot from the same test.
             - In FILE mode: saves an image file and returns the file path.
             - In BASE64 mode: returns a Base64 PNG string.
 
@@ -283,6 +478,8 @@ class Screenshot(ModuleInterface):
             container (Screenshot.Container): Container holding:
                 - container['element']: Optional UI element to capture.
                 - container['force']: Optional bool to force capture even if disabled.
+            on_failure (bool): True for screenshots taken on failure, which are limited per test and
+                               written by the background writer in FILE mode if asynchronous mode is enabled.
 
         Returns:
             str | None: File path (FILE), Base64 string (BASE64), or None (not captured).
@@ -296,24 +493,33 @@ class Screenshot(ModuleInterface):
         if not force_screenshot and not self._is_enabled:
             return None
 
+        if on_failure and not self._is_capture_allowed():
+            return None
+
         if self._mode == self.ScreenshotMode.FILE:
-            return self._capture_file(element)
+            return self._capture_file(element, on_failure)
 
         if self._mode == self.ScreenshotMode.BASE64:
-            return self._capture_base64(element)
+            return self._capture_base64(element, on_failure)
 
         raise FlaUiError("Invalid screenshot mode selected. Available modes: "
                          + '\n'.join([str(mode) for mode in self.ScreenshotMode]))
 
-    def _capture_file(self, element: Any) -> str:
+    def _capture_file(self, element: Any, on_failure: bool = False) -> str:
         """
         Capture an image and save it to a file.
 
         The file path is constructed from the configured hostname, name fragment,
         a timestamp, and the configured suffix. The file is logged via robotlog.
 
+        On failure in asynchronous mode only the image is grabbed on the calling thread. Encoding and
+        writing the file is done by the background writer, the log entry is written immediately because
+        robot only accepts log messages from the main thread.
+
         Args:
             element (Any): UI element to capture, or None to capture the full screen.
+            on_failure (bool): True to skip duplicates and to write the file by the background writer
+                               if asynchronous mode is enabled.
 
         Returns:
             str: Absolute path to the saved image file.
@@ -336,15 +542,21 @@ class Screenshot(ModuleInterface):
             os.makedirs(directory)
 
         try:
-            if element:
-                image = Capture.Element(element)
-            else:
-                image = Capture.Screen()
+            image = self._grab_image(element)
+
+            image_hash = self._get_image_hash(image) if on_failure else None
+            if image_hash in self._test_captures:
+                return self._log_duplicate(self._test_captures[image_hash], filepath=True)
 
-            image.ToFile(filepath)
+            if on_failure and self._is_async and self._enqueue_image(image, filepath):
+                # Background writer owns and disposes the image
+                image = None
+            else:
+                self._save_image(image.Bitmap, filepath, self._max_dimension, self._jpeg_quality)
 
             # Log screenshot from temp or persist mode
             robotlog.log_screenshot(filepath)
+            self._register_capture(image_hash, filepath, on_failure)
         except CSharpException as exc:
             raise FlaUiError("Error to save image " + filepath) from exc
         finally:
@@ -355,18 +567,20 @@ class Screenshot(ModuleInterface):
 
         return filepath
 
-    def _capture_base64(self, element: Any) -> str:
+    def _capture_base64(self, element: Any, on_failure: bool = False) -> str:
         """
         Capture an image and return it as a Base64-encoded PNG string.
 
         The captured image is converted to a PNG and encoded using the .NET
         Convert.ToBase64String API. The Base64 string is logged via robotlog.
+        If a size limit is configured and exceeded, the image is encoded as JPEG and scaled down.
 
         Args:
             element (Any): UI element to capture, or None to capture the full screen.
+            on_failure (bool): True to skip duplicates.
 
         Returns:
-            str: Base64-encoded PNG image string.
+            str: Base64-encoded PNG or JPEG image string.
 
         Raises:
             FlaUiError: If conversion to Base64 fails.
@@ -374,18 +588,17 @@ class Screenshot(ModuleInterface):
         image = None
 
         try:
-            if element:
-                image = Capture.Element(element)
-            else:
-                image = Capture.Screen()
+            image = self._grab_image(element)
+
+            image_hash = self._get_image_hash(image) if on_failure else None
+            if image_hash in self._test_captures:
+                return self._log_duplicate(self._test_captures[image_hash], filepath=False)
 
-            stream = MemoryStream()
-            image.Bitmap.Save(stream, ImageFormat.Png)
-            base64 = CSharpConvert.ToBase64String(stream.GetBuffer())
-            stream.Close()
+            (base64, mime_type) = self._encode_base64(image.Bitmap)
 
             # Log screenshot from temp or persist mode
-            robotlog.log_screenshot_base64(base64)
+            robotlog.log_screenshot_base64(base64, mime_type)
+            self._register_capture(image_hash, base64, on_failure)
             return base64
         except CSharpException as exc:
             raise FlaUiError("Error to save as base64 encoded string: " + element) from exc
@@ -395,6 +608,373 @@ class Screenshot(ModuleInterface):
                 # C# --> class CaptureImage : IDisposable
                 image.Dispose()
 
+    def _encode_base64(self, bitmap: Any) -> Tuple[str, str]:
+        """
+        Encode a bitmap as Base64 string within the configured size limit.
+
+        Only the written bytes from the memory stream are encoded, not the unused capacity from its buffer.
+
+        Args:
+            bitmap (Any): Bitmap to encode.
+
+        Returns:
+            Tuple: Base64 string and mime type from encoded image.
+        """
+        # Base64 encodes 3 bytes as 4 characters
+        max_bytes = None if self._base64_max_size_in_kb is None else self._base64_max_size_in_kb * 1024 * 3 // 4
+        (width, height) = self._fit_to_max_dimension(bitmap.Width, bitmap.Height, self._max_dimension)
+        stream = self._encode_scaled_image(bitmap, width, height, ImageFormat.Png)
+        mime_type = "image/png"
+
+        try:
+            while max_bytes is not None and stream.Length > max_bytes:
+                if mime_type == "image/jpeg":
+                    (width, height) = (int(width * self.BASE64_SCALE_FACTOR), int(height * self.BASE64_SCALE_FACTOR))
+                    if min(width, height) < self.BASE64_MIN_EDGE_LENGTH:
+                        break
+
+                stream.Dispose()
+                stream = self._encode_scaled_image(bitmap, width, height, ImageFormat.Jpeg, self._jpeg_quality)
+                mime_type = "image/jpeg"
+
+            return CSharpConvert.ToBase64String(stream.GetBuffer(), 0, int(stream.Length)), mime_type
+        finally:
+            stream.Dispose()
+
+    @staticmethod
+    def _encode_image(bitmap: Any, image_format: Any, encoder: Any = None, parameters: Any = None) -> Any:
+        """
+        Encode a bitmap into a new memory stream.
+
+        Args:
+            bitmap (Any): Bitmap to encode.
+            image_format (Any): Image format if no encoder is given.
+            encoder (Any): Optional image codec info.
+            parameters (Any): Optional encoder parameters for encoder.
+
+        Returns:
+            MemoryStream: Stream which contains the encoded image.
+        """
+        stream = MemoryStream()
+
+        try:
+            if encoder is None:
+                bitmap.Save(stream, image_format)
+            else:
+                bitmap.Save(stream, encoder, parameters)
+        except CSharpException:
+            stream.Dispose()
+            raise
+
+        return stream
+
+    def _encode_scaled_image(self,
+                             bitmap: Any,
+                             width: int,
+                             height: int,
+                             image_format: Any,
+                             jpeg_quality: Optional[int] = None) -> Any:
+        """
+        Encode a bitmap scaled to width and height into a new memory stream.
+
+        Args:
+            bitmap (Any): Bitmap to encode.
+            width (int): Target width in pixels.
+            height (int): Target height in pixels.
+            image_format (Any): Image format like ImageFormat.Png or ImageFormat.Jpeg.
+            jpeg_quality (int): Quality for ImageFormat.Jpeg, by default configured quality.
+        """
+        scaled = None
+        parameters = None
+
+        try:
+            if (width, height) != (bitmap.Width, bitmap.Height):
+                scaled = self._resize_bitmap(bitmap, width, height)
+
+            if image_format == ImageFormat.Jpeg:
+                parameters = self._create_jpeg_parameters(jpeg_quality or self._jpeg_quality)
+                return self._encode_image(bitmap if scaled is None else scaled,
+                                          image_format, self._get_jpeg_encoder(), parameters)
+
+            return self._encode_image(bitmap if scaled is None else scaled, image_format)
+        finally:
+            if parameters is not None:
+                parameters.Dispose()
+            if scaled is not None:
+                scaled.Dispose()
+
+    def _save_image(self, bitmap: Any, filepath: str, max_dimension: Optional[int], jpeg_quality: int) -> None:
+        """
+        Save a bitmap to file, scaled down to the maximum dimension. File format depends on the file suffix.
+
+        Args:
+            bitmap (Any): Bitmap to save.
+            filepath (str): Destination file path with png, jpg or jpeg suffix.
+            max_dimension (int): Maximum width and height in pixels or None for unlimited.
+            jpeg_quality (int): Quality for JPEG files.
+        """
+        (width, height) = self._fit_to_max_dimension(bitmap.Width, bitmap.Height, max_dimension)
+        scaled = None
+        parameters = None
+
+        try:
+            if (width, height) != (bitmap.Width, bitmap.Height):
+                scaled = self._resize_bitmap(bitmap, width, height)
+            image = bitmap if scaled is None else scaled
+
+            if os.path.splitext(filepath)[1].lower() in (".jpg", ".jpeg"):
+                parameters = self._create_jpeg_parameters(jpeg_quality)
+                image.Save(filepath, self._get_jpeg_encoder(), parameters)
+            else:
+                image.Save(filepath, ImageFormat.Png)
+        finally:
+            if parameters is not None:
+                parameters.Dispose()
+            if scaled is not None:
+                scaled.Dispose()
+
+    @staticmethod
+    def _create_jpeg_parameters(jpeg_quality: int) -> Any:
+        """
+        Create encoder parameters for the GDI+ JPEG encoder which must be disposed by the caller.
+
+        Args:
+            jpeg_quality (int): Quality between 1 and 100.
+        """
+        parameters = EncoderParameters(1)
+        parameters.Param[0] = EncoderParameter(Encoder.Quality, Int64(jpeg_quality))
+        return parameters
+
+    @staticmethod
+    def _fit_to_max_dimension(width: int, height: int, max_dimension: Optional[int]) -> Tuple[int, int]:
+        """
+        Return width and height scaled down proportionally so neither exceeds the maximum dimension.
+
+        Args:
+            width (int): Image width in pixels.
+            height (int): Image height in pixels.
+            max_dimension (int): Maximum width and height in pixels or None for unlimited.
+        """
+        if max_dimension is None or max(width, height) <= max_dimension:
+            return width, height
+
+        scale = max_dimension / max(width, height)
+        return max(int(width * scale), 1), max(int(height * scale), 1)
+
+    def _grab_image(self, element: Any) -> Any:
+        """
+        Capture the element or the configured capture target.
+
+        Args:
+            element (Any): UI element to capture, or None to capture the configured target.
+
+        Returns:
+            CaptureImage: Captured image which must be disposed by the caller.
+        """
+        if element:
+            return Capture.Element(element)
+
+        if self._capture_target == self.CaptureTarget.WINDOW:
+            window = self._get_foreground_window()
+            if window is not None:
+                return Capture.Element(window)
+        elif self._capture_target == self.CaptureTarget.REGION:
+            return Capture.Rectangle(self._capture_region)
+        elif self._capture_target == self.CaptureTarget.MAIN_SCREEN:
+            return Capture.MainScreen()
+
+        return Capture.Screen()
+
+    def _get_foreground_window(self) -> Optional[Any]:
+        """
+        Return the top level window which contains the focused element or None if not available.
+        """
+        if self._automation is None:
+            return None
+
+        try:
+            desktop = self._automation.GetDesktop()
+            walker = self._automation.TreeWalkerFactory.GetControlViewWalker()
+            element = self._automation.FocusedElement()
+
+            while element is not None:
+                parent = walker.GetParent(element)
+                if parent is None or parent.Equals(desktop):
+                    return None if element.Equals(desktop) else element
+                element = parent
+        except CSharpException:
+            pass
+
+        return None
+
+    @staticmethod
+    def _get_jpeg_encoder() -> Any:
+        """
+        Return the GDI+ JPEG image codec.
+        """
+        return next(codec for codec in ImageCodecInfo.GetImageEncoders()
+                    if codec.FormatID == ImageFormat.Jpeg.Guid)
+
+    @staticmethod
+    def _resize_bitmap(bitmap: Any, width: int, height: int) -> Any:
+        """
+        Create a scaled copy from a bitmap with an area averaging filter.
+
+        Args:
+            bitmap (Any): Bitmap to scale.
+            width (int): Target width in pixels.
+            height (int): Target height in pixels.
+
+        Returns:
+            Bitmap: Scaled bitmap which must be disposed by the caller.
+        """
+        scaled = Bitmap(width, height)
+
+        try:
+            graphics = Graphics.FromImage(scaled)
+            try:
+                graphics.InterpolationMode = InterpolationMode.HighQualityBilinear
+                graphics.DrawImage(bitmap, 0, 0, width, height)
+            finally:
+                graphics.Dispose()
+        except CSharpException:
+            scaled.Dispose()
+            raise
+
+        return scaled
+
+    def _is_capture_allowed(self) -> bool:
+        """
+        Return whether a screenshot on failure is allowed by the per test budget and minimum interval.
+        """
+        now = time.monotonic()
+
+        if self._max_per_test is not None and self._test_capture_count >= self._max_per_test:
+            return False
+
+        if (self._last_capture_time is not None
+                and (now - self._last_capture_time) * 1000 < self._min_interval_in_ms):
+            return False
+
+        return True
+
+    def _register_capture(self, image_hash: Optional[str], result: str, on_failure: bool) -> None:
+        """
+        Count a stored failure screenshot for the current test and remember its result by image hash.
+
+        Duplicates are not registered, so they neither count against the budget nor delay the next capture.
+        Manual screenshots are remembered for duplicate detection but do not use up the failure budget.
+
+        Args:
+            image_hash (str): Hash from captured image or None if not hashed.
+            result (str): File path or Base64 string from screenshot.
+            on_failure (bool): True if the screenshot was stored on failure, starts the minimum interval.
+        """
+        if on_failure:
+            self._test_capture_count += 1
+            self._last_capture_time = time.monotonic()
+
+        if image_hash is not None:
+            self._test_captures[image_hash] = result
+
+    @staticmethod
+    def _log_duplicate(result: str, filepath: bool) -> str:
+        """
+        Log a reference to an identical screenshot instead of storing the image again.
+
+        Args:
+            result (str): File path or Base64 string from previous identical screenshot.
+            filepath (bool): True if result is a file path.
+
+        Returns:
+            str: Result from previous identical screenshot.
+        """
+        robotlog.log("Screenshot skipped, screen is identical to previous screenshot"
+                     + (" " + result if filepath else ""))
+        return result
+
+    def _get_image_hash(self, image: Any) -> Optional[str]:
+        """
+        Compute a content hash from a captured image to detect identical screenshots.
+
+        The image is scaled down to a small thumbnail with an area averaging filter, so every pixel from
+        the original image contributes to the hash while only a few kilobytes are hashed.
+
+        Args:
+            image (Any): Captured image from FlaUI.
+
+        Returns:
+            str | None: Hash from image or None if duplicates are not skipped or hashing failed.
+        """
+        if not self._skip_duplicates:
+            return None
+
+        thumbnail = None
+        stream = None
+
+        try:
+            thumbnail = self._resize_bitmap(image.Bitmap, self.HASH_THUMBNAIL_SIZE, self.HASH_THUMBNAIL_SIZE)
+            stream = self._encode_image(thumbnail, ImageFormat.Bmp)
+            return hashlib.sha1(bytes(stream.ToArray())).hexdigest()
+        except CSharpException:
+            return None
+        finally:
+            for disposable in (thumbnail, stream):
+                if disposable is not None:
+                    disposable.Dispose()
+
+    def _enqueue_image(self, image: Any, filepath: str) -> bool:
+        """
+        Hand over a captured image to the background writer which writes and disposes it.
+
+        Args:
+            image (Any): Captured image from FlaUI.
+            filepath (str): Destination file path.
+
+        Returns:
+            bool: True if the image was queued, False if the queue is full.
+        """
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(target=self._write_queued_images,
+                                            name="FlaUILibraryScreenshotWriter",
+                                            daemon=True)
+            self._writer.start()
+
+        try:
+            self._write_queue.put_nowait((image, filepath, self._max_dimension, self._jpeg_quality))
+            return True
+        except queue.Full:
+            return False
+
+    def _write_queued_images(self) -> None:
+        """
+        Background writer loop which writes queued images to their files.
+        Errors are collected and reported by the next flush.
+        """
+        while True:
+            (image, filepath, max_dimension, jpeg_quality) = self._write_queue.get()
+            try:
+                self._save_image(image.Bitmap, filepath, max_dimension, jpeg_quality)
+            except CSharpException:
+                with self._write_errors_lock:
+                    self._write_errors.append(filepath)
+            finally:
+                image.Dispose()
+                self._write_queue.task_done()
+
+    def _flush(self) -> None:
+        """
+        Wait until all queued images are written and log a warning for each image which could not be saved.
+        """
+        self._write_queue.join()
+
+        with self._write_errors_lock:
+            errors = self._write_errors
+            self._write_errors = []
+
+        for filepath in errors:
+            robotlog.log_warning("Error to save image " + filepath)
+
     def _get_path(self) -> str:
         """
         Compute the absolute directory path used for storing screenshots.
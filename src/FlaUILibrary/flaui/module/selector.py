@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional, Any, List
+from typing import Optional, Any, List, Dict, Callable
 from System import InvalidOperationException  # pylint: disable=import-error
 from FlaUILibrary.flaui.exception.flauierror import FlaUiError
 from FlaUILibrary.flaui.interface.moduleinterface import ModuleInterface
@@ -55,41 +55,34 @@ class Selector(ModuleInterface):
                                   element=None if not element else element,
                                   index=Converter.cast_to_int(index, msg))
 
-    def execute_action(self, action: Action, values: Container) -> Any:
-        """If action is not supported an ActionNotSupported error will be raised.
-
-        Raises:
-            FlaUiError: If action is not supported.
-
-        Args:
-            action (Action): Action to use.
-            values (Object): See action definitions for value usage.
+    def create_action_handlers(self) -> Dict[Enum, Callable[[Container], Any]]:
+        """
+        Creates handlers from all supported actions. Each handler receives the value container from action.
+        Called once by the module interface, see ModuleInterface.get_action_handlers.
         """
-        switcher = {
+        return {
             self.Action.SELECT_ITEM_BY_INDEX:
-                lambda: self._select_by_index(values),
+                self._select_by_index,
             self.Action.SELECT_ITEM_BY_NAME:
-                lambda: self._select_by_name(values),
+                self._select_by_name,
             self.Action.SHOULD_CONTAIN:
-                lambda: self._should_contain(values),
+                self._should_contain,
             self.Action.SHOULD_NOT_CONTAIN:
-                lambda: self._should_not_contain(values),
+                self._should_not_contain,
             self.Action.SHOULD_HAVE_SELECTED_ITEM:
-                lambda: self._should_have_selected_item(values),
+                self._should_have_selected_item,
             self.Action.GET_ITEMS_COUNT:
-                lambda: self._get_items_count(values),
+                self._get_items_count,
             self.Action.GET_ALL_NAMES_FROM_SELECTION:
-                lambda: self._get_all_selected_names(values),
+                self._get_all_selected_names,
             self.Action.GET_ALL_TEXTS_FROM_SELECTION:
-                lambda: self._get_all_selected_texts(values),
+                self._get_all_selected_texts,
             self.Action.GET_ALL_NAMES:
-                lambda: self._get_all_names(values),
+                self._get_all_names,
             self.Action.GET_ALL_TEXTS:
-                lambda: self._get_all_texts(values)
+                self._get_all_texts
         }
 
-        return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
-
     @staticmethod
     def _select_by_index(container: Container) -> None:
         """
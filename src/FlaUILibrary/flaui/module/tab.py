@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional, Any, List
+from typing import Optional, Any, List, Dict, Callable
 from System import Exception as CSharpException  # pylint: disable=import-error
 from FlaUILibrary.flaui.util.converter import Converter
 from FlaUILibrary.flaui.interface.moduleinterface import ModuleInterface
@@ -39,25 +39,17 @@ class Tab(ModuleInterface):
         return Tab.Container(element=element,
                              name=Converter.cast_to_string(name))
 
-    def execute_action(self, action: Action, values: Container) -> Any:
+    def create_action_handlers(self) -> Dict[Enum, Callable[[Container], Any]]:
         """
-        If action is not supported an ActionNotSupported error will be raised.
-
-        Raises:
-            FlaUiError: If action is not supported.
-
-        Args:
-            action (Action): Action to use.
-            values (Object): See action definitions for value usage.
+        Creates handlers from all supported actions. Each handler receives the value container from action.
+        Called once by the module interface, see ModuleInterface.get_action_handlers.
         """
 
-        switcher = {
-            self.Action.GET_TAB_ITEMS_NAMES: lambda: self._get_tab_items_names(values),
-            self.Action.SELECT_TAB_ITEM_BY_NAME: lambda: self._select_tab_item(values)
+        return {
+            self.Action.GET_TAB_ITEMS_NAMES: self._get_tab_items_names,
+            self.Action.SELECT_TAB_ITEM_BY_NAME: self._select_tab_item
         }
 
-        return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
-
     @staticmethod
     def _get_tab_items_names(container: Container) -> List[str]:
         """
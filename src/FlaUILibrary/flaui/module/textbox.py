@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional, Any
+from typing import Optional, Any, Dict, Callable
 from FlaUILibrary.flaui.interface.moduleinterface import ModuleInterface
 from FlaUILibrary.flaui.interface.valuecontainer import ValueContainer
 from FlaUILibrary.flaui.exception.flauierror import FlaUiError
@@ -41,27 +41,19 @@ class Textbox(ModuleInterface):
         return Textbox.Container(element=element,
                                  value=Converter.cast_to_string(value))
 
-    def execute_action(self, action: Action, values: Container) -> Any:
+    def create_action_handlers(self) -> Dict[Enum, Callable[[Container], Any]]:
         """
-        If action is not supported an ActionNotSupported error will be raised.
-
-        Raises:
-            FlaUiError: If action is not supported.
-
-        Args:
-            action (Action): Action to use.
-            values (Object): See action definitions for value usage.
+        Creates handlers from all supported actions. Each handler receives the value container from action.
+        Called once by the module interface, see ModuleInterface.get_action_handlers.
         """
 
-        switcher = {
+        return {
             self.Action.GET_TEXT_FROM_TEXTBOX:
-                lambda: self._get_textbox_text(values),
+                self._get_textbox_text,
             self.Action.SET_TEXT_TO_TEXTBOX:
-                lambda: self._set_textbox_text(values)
+                self._set_textbox_text
         }
 
-        return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
-
     @staticmethod
     def _set_textbox_text(container: Container) -> None:
         """
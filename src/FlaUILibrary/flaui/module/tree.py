@@ -1,9 +1,13 @@
+from collections import OrderedDict
 from enum import Enum
-from typing import Optional, Any, List
+from typing import Optional, Any, List, Dict, Callable
+from System import Exception as CSharpException  # pylint: disable=import-error
 from FlaUILibrary.flaui.exception.flauierror import FlaUiError
 from FlaUILibrary.flaui.interface.moduleinterface import ModuleInterface
 from FlaUILibrary.flaui.interface.valuecontainer import ValueContainer
+from FlaUILibrary.flaui.util.treeitempathcache import TreeItemPathCache
 from FlaUILibrary.flaui.util.treeitems import TreeItems
+from FlaUILibrary.flaui.util.treesnapshot import TreeSnapshot
 from FlaUILibrary.flaui.util.converter import Converter
 from FlaUILibrary.flaui.enum.treeitemaction import TreeItemAction
 
@@ -12,10 +16,19 @@ class Tree(ModuleInterface):
     """
     Tree control wrapper for FlaUI usage.
     Wrapper module executes methods from Tree.cs implementation.
+
+    Read-only actions are served from a snapshot per tree control, see TreeSnapshot. Actions which expand or
+    collapse tree items mark the snapshot as outdated, actions from other modules like mouse or keyboard input
+    mark all snapshots as outdated by INVALIDATE_SNAPSHOTS. Tree items resolved from location prefixes are cached
+    by TreeItemPathCache.
     """
 
+    _SNAPSHOT_CACHE_SIZE = 8
+
     def __init__(self):
         self._seperator = "->"
+        self._snapshots = OrderedDict()
+        self._tree_item_paths = TreeItemPathCache()
 
     class Container(ValueContainer):
         """
@@ -42,6 +55,7 @@ class Tree(ModuleInterface):
         SELECTED_ITEM_SHOULD_BE = "TREE_SELECTED_ITEM_SHOULD_BE"
         GET_SELECTED_ITEMS_NAME = "TREE_GET_SELECTED_ITEMS_NAME"
         SET_SEPERATOR = "TREE_SET_SEPERATOR"
+        INVALIDATE_SNAPSHOTS = "TREE_INVALIDATE_SNAPSHOTS"
 
     @staticmethod
     def create_value_container(element=None, item=None, seperator=None) -> Container:
@@ -60,48 +74,42 @@ class Tree(ModuleInterface):
                               item=Converter.cast_to_string(item),
                               seperator=Converter.cast_to_string(seperator))
 
-    def execute_action(self, action: Action, values: Container) -> Any:
+    def create_action_handlers(self) -> Dict[Enum, Callable[[Container], Any]]:
         """
-        If action is not supported an ActionNotSupported error will be raised.
-
-        Raises:
-            FlaUiError: If action is not supported.
-
-        Args:
-            action (Action): Action to use.
-            values (Object): See action definitions for value usage.
+        Creates handlers from all supported actions. Each handler receives the value container from action.
+        Called once by the module interface, see ModuleInterface.get_action_handlers.
         """
-        switcher = {
+        return {
             self.Action.GET_ROOT_ITEMS_COUNT:
-                lambda: self._get_root_items_count(values),
+                self._get_root_items_count,
             self.Action.EXPAND_ALL:
-                lambda: self._expand_all_tree_nodes(values),
+                self._expand_all_tree_nodes,
             self.Action.COLLAPSE_ALL:
-                lambda: self._collapse_all(values),
+                self._collapse_all,
             self.Action.GET_VISIBLE_ITEMS_NAMES:
-                lambda: self._get_visible_item_names(values),
+                self._get_visible_item_names,
             self.Action.GET_VISIBLE_ITEMS_COUNT:
-                lambda: self._get_visible_leaf_count(values),
+                self._get_visible_leaf_count,
             self.Action.ITEM_SHOULD_BE_VISIBLE:
-                lambda: self._should_be_visible(values),
+                self._should_be_visible,
             self.Action.SELECT_ITEM_BY_NAME:
-                lambda: self._select_item_by_name(values),
+                self._select_item_by_name,
             self.Action.SELECT_ITEM:
-                lambda: self._select_item(values),
+                self._select_item,
             self.Action.EXPAND_ITEM:
-                lambda: self._expand_item(values),
+                self._expand_item,
             self.Action.COLLAPSE_ITEM:
-                lambda: self._collapse_item(values),
+                self._collapse_item,
             self.Action.SELECTED_ITEM_SHOULD_BE:
-                lambda: self._selected_item_should_be(values),
+                self._selected_item_should_be,
             self.Action.GET_SELECTED_ITEMS_NAME:
-                lambda: self._get_selected_items_name(values),
+                self._get_selected_items_name,
             self.Action.SET_SEPERATOR:
-                lambda: self._set_seperator(values),
+                self._set_seperator,
+            self.Action.INVALIDATE_SNAPSHOTS:
+                self._invalidate_snapshots,
         }
 
-        return switcher.get(action, lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported))()
-
     def _select_item(self, container: Container) -> None:
         """
         Select the tree item specified by a location string.
@@ -116,7 +124,11 @@ class Tree(ModuleInterface):
         """
         element = container["element"]
         item = container["item"]
-        TreeItems.execute_by_location(element.Items, item, self._seperator, TreeItemAction.SELECT)
+        try:
+            TreeItems.execute_by_location(element, item, self._seperator, TreeItemAction.SELECT,
+                                          self._tree_item_paths)
+        finally:
+            self._invalidate_snapshot(element)
 
     def _expand_item(self, container: Container) -> None:
         """
@@ -132,7 +144,11 @@ class Tree(ModuleInterface):
         """
         element = container["element"]
         item = container["item"]
-        TreeItems.execute_by_location(element.Items, item, self._seperator, TreeItemAction.EXPAND)
+        try:
+            TreeItems.execute_by_location(element, item, self._seperator, TreeItemAction.EXPAND,
+                                          self._tree_item_paths)
+        finally:
+            self._invalidate_snapshot(element)
 
     def _collapse_item(self, container: Container) -> None:
         """
@@ -148,7 +164,11 @@ class Tree(ModuleInterface):
         """
         element = container["element"]
         item = container["item"]
-        TreeItems.execute_by_location(element.Items, item, self._seperator, TreeItemAction.COLLAPSE)
+        try:
+            TreeItems.execute_by_location(element, item, self._seperator, TreeItemAction.COLLAPSE,
+                                          self._tree_item_paths)
+        finally:
+            self._invalidate_snapshot(element)
 
     def _set_seperator(self, container: Container) -> None:
         """
@@ -167,8 +187,7 @@ class Tree(ModuleInterface):
 
         self._seperator = seperator
 
-    @staticmethod
-    def _should_be_visible(container: Container) -> None:
+    def _should_be_visible(self, container: Container) -> None:
         """
         Checks if Tree contains a given item by name.
 
@@ -180,10 +199,9 @@ class Tree(ModuleInterface):
        Raises:
             FlaUiError: If element does not exists with searched name.
         """
-        control = container["element"]
         name = container["item"]
 
-        if name not in TreeItems.get_all_names_from_tree_nodes(control.Items):
+        if name not in self._get_visible_item_names(container):
             raise FlaUiError(FlaUiError.ElementNotVisible.format(name))
 
     @staticmethod
@@ -225,8 +243,7 @@ class Tree(ModuleInterface):
         if item != name:
             raise FlaUiError(FlaUiError.ItemNotSelected.format(item))
 
-    @staticmethod
-    def _expand_all_tree_nodes(container: Container) -> None:
+    def _expand_all_tree_nodes(self, container: Container) -> None:
         """
         Expand all tree nodes from an element node.
 
@@ -235,10 +252,12 @@ class Tree(ModuleInterface):
                 - container['element']: FlaUI tree control instance.
         """
         element = container["element"]
-        TreeItems.expand_all_tree_nodes(element.Items)
+        try:
+            TreeItems.expand_all_tree_nodes(element.Items)
+        finally:
+            self._invalidate_snapshot(element)
 
-    @staticmethod
-    def _get_root_items_count(container: Container) -> int:
+    def _get_root_items_count(self, container: Container) -> int:
         """
         Get count from all nodes by a given tree node.
 
@@ -247,10 +266,13 @@ class Tree(ModuleInterface):
                 - container['element']: FlaUI tree control instance.
         """
         element = container["element"]
+        snapshot = self._get_snapshot(element)
+        if snapshot is not None:
+            return len(snapshot.nodes)
+
         return int(element.Items.Length)
 
-    @staticmethod
-    def _collapse_all(container: Container) -> None:
+    def _collapse_all(self, container: Container) -> None:
         """
         Collapse all nodes from a tree items.
 
@@ -259,10 +281,12 @@ class Tree(ModuleInterface):
                 - container['element']: FlaUI tree control instance.
         """
         element = container["element"]
-        TreeItems.collapse(element.Items)
+        try:
+            TreeItems.collapse(element.Items)
+        finally:
+            self._invalidate_snapshot(element)
 
-    @staticmethod
-    def _select_item_by_name(container: Container) -> None:
+    def _select_item_by_name(self, container: Container) -> None:
         """
         Select a visible tree node by its display name.
 
@@ -276,10 +300,19 @@ class Tree(ModuleInterface):
         """
         element = container["element"]
         item = container["item"]
-        TreeItems.select_visible_node_by_name(element.Items, item)
+        snapshot = self._get_snapshot(element)
+        if snapshot is None:
+            TreeItems.select_visible_node_by_name(element.Items, item)
+            return
 
-    @staticmethod
-    def _get_visible_leaf_count(container: Container) -> int:
+        for node in snapshot.visible_nodes():
+            if node.name == item:
+                node.select()
+                return
+
+        raise FlaUiError(FlaUiError.ElementNameNotFound.format(item))
+
+    def _get_visible_leaf_count(self, container: Container) -> int:
         """
         Get the number of visible leaf nodes for the provided tree element.
 
@@ -294,10 +327,13 @@ class Tree(ModuleInterface):
             FlaUiError: If the element is invalid or counting fails.
         """
         element = container["element"]
+        snapshot = self._get_snapshot(element)
+        if snapshot is not None:
+            return sum(1 for _ in snapshot.visible_nodes())
+
         return TreeItems.get_visible_leaf_count(element.Items)
 
-    @staticmethod
-    def _get_visible_item_names(container: Container) -> List[str]:
+    def _get_visible_item_names(self, container: Container) -> List[str]:
         """
         Retrieve the display names of all visible nodes in the given tree element.
 
@@ -312,4 +348,59 @@ class Tree(ModuleInterface):
             FlaUiError: If the element is invalid or retrieval fails.
         """
         element = container["element"]
+        snapshot = self._get_snapshot(element)
+        if snapshot is not None:
+            return [node.name for node in snapshot.visible_nodes()]
+
         return TreeItems.get_all_names_from_tree_nodes(element.Items)
+
+    def _get_snapshot(self, control: Any) -> Optional[TreeSnapshot]:
+        """
+        Return the refreshed snapshot from a tree control, the snapshot is captured on first usage.
+
+        Args:
+            control (Object): FlaUI tree control instance.
+
+        Returns:
+            TreeSnapshot: Snapshot from tree control or None if the tree could not be captured.
+        """
+        runtime_id = Converter.try_get_runtime_id(control)
+        if runtime_id is None:
+            return None
+
+        snapshot = self._snapshots.pop(runtime_id, None)
+        try:
+            if snapshot is None:
+                snapshot = TreeSnapshot(control)
+            else:
+                snapshot.refresh()
+        except (CSharpException, AttributeError, TypeError):
+            if snapshot is not None:
+                snapshot.dispose()
+            return None
+
+        self._snapshots[runtime_id] = snapshot
+        while len(self._snapshots) > self._SNAPSHOT_CACHE_SIZE:
+            self._snapshots.popitem(last=False)[1].dispose()
+
+        return snapshot
+
+    def _invalidate_snapshot(self, control: Any) -> None:
+        """
+        Mark the snapshot from a tree control as outdated after tree items were expanded or collapsed.
+
+        Args:
+            control (Object): FlaUI tree control instance.
+        """
+        snapshot = self._snapshots.get(Converter.try_get_runtime_id(control))
+        if snapshot is not None:
+            snapshot.invalidate()
+
+    def _invalidate_snapshots(self, _container: Container) -> None:
+        """
+        Mark the snapshots from all tree controls as outdated, e.g. after tree items could be expanded or collapsed
+        by mouse or keyboard input. Events from UI Automation are delivered asynchronously and could arrive after
+        the next read.
+        """
+        for snapshot in self._snapshots.values():
+            snapshot.invalidate()
@@ -1,10 +1,10 @@
-import time
 from enum import Enum
-from typing import Optional, Any
+from typing import Optional, Any, Dict, Callable
 from FlaUI.Core.Exceptions import MethodNotSupportedException  # pylint: disable=import-error
 from FlaUILibrary.flaui.interface.moduleinterface import ModuleInterface
 from FlaUILibrary.flaui.interface.valuecontainer import ValueContainer
 from FlaUILibrary.flaui.exception.flauierror import FlaUiError
+from FlaUILibrary.flaui.util.backoff import Backoff
 from FlaUILibrary.flaui.util.converter import Converter
 
 
@@ -29,28 +29,17 @@ class Window(ModuleInterface):
         CLOSE_WINDOW = "WINDOW_CLOSE_WINDOW"
         RESIZE_WINDOW = "WINDOW_RESIZE_WINDOW"
 
-    def execute_action(self, action: Action, values: Container) -> Any:
+    def create_action_handlers(self) -> Dict[Enum, Callable[[Container], Any]]:
         """
-        If action is not supported an ActionNotSupported error will be raised.
-
-        Args:
-            action: Method action to use.
-            values: See supported action definitions for value usage and value container definition.
-
-        Raises:
-            FlaUiError: If action is not supported.
+        Creates handlers from all supported actions. Each handler receives the value container from action.
+        Called once by the module interface, see ModuleInterface.get_action_handlers.
         """
 
-        switcher = {
-            self.Action.CLOSE_WINDOW: lambda: self._close_window(values),
-            self.Action.RESIZE_WINDOW: lambda: self._resize_window(values),
+        return {
+            self.Action.CLOSE_WINDOW: self._close_window,
+            self.Action.RESIZE_WINDOW: self._resize_window,
         }
 
-        return switcher.get(
-            action,
-            lambda: FlaUiError.raise_fla_ui_error(FlaUiError.ActionNotSupported)
-        )()
-
     @staticmethod
     def create_value_container(element=None, width=None, height=None) -> Container:
         """
@@ -122,13 +111,13 @@ class Window(ModuleInterface):
         except Exception as e:
             raise FlaUiError(FlaUiError.WindowResizeFailed.format(e)) from None
 
-        start = time.time()
-        timeout = 5 # seconds
-        while time.time() - start < timeout:
+        def has_target_size() -> bool:
             rect = window.BoundingRectangle
-            if abs(rect.Width - width) < 1 and abs(rect.Height - height) < 1:
-                return
-            time.sleep(0.1)
+            return abs(rect.Width - width) < 1 and abs(rect.Height - height) < 1
+
+        timeout = 5 # seconds
+        if Backoff(timeout_in_ms=timeout * 1000, max_delay_in_ms=100).poll(has_target_size):
+            return
 
         raise FlaUiError(FlaUiError.WindowResizeFailed.format(
             f"Window did not reach target size within {timeout:.1f}s")
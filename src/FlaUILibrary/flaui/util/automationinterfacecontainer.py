@@ -1,48 +1,87 @@
-from typing import Dict
+from enum import Enum
+from typing import Dict, Optional
 from FlaUILibrary.flaui.exception.flauierror import FlaUiError
+from FlaUILibrary.flaui.interface.valuecontainer import ValueContainer
 from FlaUILibrary.flaui.interface.windowsautomationinterface import WindowsAutomationInterface
 from FlaUILibrary.flaui.automation.uia2 import UIA2
 from FlaUILibrary.flaui.automation.uia3 import UIA3
+from FlaUILibrary.flaui.automation.uiafake import UIAFake
+from FlaUILibrary.flaui.util.locatorstore import LocatorStore
 
 class AutomationInterfaceContainer:
     """
     Automation interface container to manage all graphical user interfaces like UIA2 and UIA3.
     """
 
-    def __init__(self, identifier: str, retry_timeout_in_milliseconds: int):
+    def __init__(self,
+                 identifier: str,
+                 retry_timeout_in_milliseconds: int,
+                 locator_store: Optional[LocatorStore] = None,
+                 fake_tree_file: Optional[str] = None):
         """
         Initializes AutomationInterfaceContainer.
 
         Args:
-            identifier (str): UIA2 or UIA3 identifier to use.
+            identifier (str): UIA2, UIA3 or FAKE identifier to use.
             retry_timeout_in_milliseconds (Number):
               Timeout in milliseconds for automatic retry if element could not be found.
+            locator_store (LocatorStore): Optional persistent store from concrete XPaths shared by all modules.
+            fake_tree_file (str): XML or JSON element tree for the FAKE identifier.
         """
         self._identifier = identifier
         self._modules: Dict[str, WindowsAutomationInterface] = {}
         self._retry_timeout_in_milliseconds = retry_timeout_in_milliseconds
+        self._locator_store = locator_store
+        self._fake_tree_file = fake_tree_file
+        self._settings: Dict[Enum, ValueContainer] = {}
 
     def create_or_get_module(self):
         """
         Creates user interface module if not already created otherwise initialized module.
+        All module settings are performed on a new module before it is returned.
         """
         if self._identifier not in self._modules:
-            self._modules[self._identifier] = self._create_module()
+            module = self._create_module()
+            for (action, values) in self._settings.items():
+                module.action(action, values)
+            self._modules[self._identifier] = module
 
         return self._modules[self._identifier]
 
+    def get_created_module(self) -> Optional[WindowsAutomationInterface]:
+        """
+        Returns active user interface module if already created otherwise None.
+        """
+        return self._modules.get(self._identifier)
+
+    def set_module_setting(self, action: Enum, values: ValueContainer):
+        """
+        Stores a setting action like a screenshot directory which is performed on each module after creation.
+        The active module is configured immediately only if it is already created, so settings from library
+        import or test listeners do not create a user interface module.
+
+        Args:
+            action (Action): Module action to perform.
+            values (ValueContainer): Value container for action.
+        """
+        self._settings[action] = values
+
+        module = self.get_created_module()
+        if module is not None:
+            module.action(action, values)
+
     def set_identifier(self, identifier: str):
         """
-        Sets UIA2 or UIA3 identifier to use.
+        Sets UIA2, UIA3 or FAKE identifier to use.
 
         Args:
-            identifier (String): UIA2 or UIA3
+            identifier (String): UIA2, UIA3 or FAKE
         """
         self._identifier = identifier
 
     def get_identifier(self):
         """
-        Gets current active user graphical interface module like UIA2 or UIA3.
+        Gets current active user graphical interface module like UIA2, UIA3 or FAKE.
         """
         return self._identifier
 
@@ -52,9 +91,12 @@ class AutomationInterfaceContainer:
         """
 
         if self._identifier == "UIA2":
-            return UIA2(self._retry_timeout_in_milliseconds)
+            return UIA2(self._retry_timeout_in_milliseconds, self._locator_store)
 
         if self._identifier == "UIA3":
-            return UIA3(self._retry_timeout_in_milliseconds)
+            return UIA3(self._retry_timeout_in_milliseconds, self._locator_store)
+
+        if self._identifier == "FAKE" and self._fake_tree_file:
+            return UIAFake(self._retry_timeout_in_milliseconds, self._fake_tree_file, self._locator_store)
 
         raise FlaUiError("Identifier not supported")
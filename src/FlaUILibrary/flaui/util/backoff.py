@@ -0,0 +1,151 @@
+import random
+import threading
+import time
+from typing import Any, Callable, Optional
+
+
+class BackoffStatistics:
+    """
+    Statistics from a single Backoff.poll call.
+    """
+    attempts: int
+    sleeps: int
+    sleep_time_in_ms: float
+    elapsed_time_in_ms: float
+    succeeded: bool
+
+    def __init__(self):
+        """
+        Creates empty backoff statistics.
+        """
+        self.attempts = 0
+        self.sleeps = 0
+        self.sleep_time_in_ms = 0.0
+        self.elapsed_time_in_ms = 0.0
+        self.succeeded = False
+
+    @property
+    def retries(self) -> int:
+        """
+        Amount of attempts after the first attempt.
+        """
+        return max(self.attempts - 1, 0)
+
+
+_TOTALS = threading.local()
+
+
+class Backoff:
+    """
+    Polling policy with exponential backoff.
+
+    A call is repeated until its result is accepted, the deadline is reached or the maximum amount of attempts
+    was used. The delay between attempts starts at the initial delay, grows by factor up to the maximum delay
+    and is randomized by jitter. Sleeps never exceed the deadline, so the last attempt happens at the deadline.
+    """
+
+    def __init__(self,
+                 timeout_in_ms: Optional[int] = None,
+                 max_attempts: Optional[int] = None,
+                 initial_delay_in_ms: int = 10,
+                 max_delay_in_ms: int = 250,
+                 factor: float = 2.0,
+                 jitter: float = 0.1):
+        """
+        Creates a backoff polling policy.
+
+        Args:
+            timeout_in_ms (int): Deadline in milliseconds from start of poll. None for no deadline.
+            max_attempts (int): Maximum amount of attempts. None for no limit.
+            initial_delay_in_ms (int): Delay after first failed attempt.
+            max_delay_in_ms (int): Cap for the delay between attempts.
+            factor (float): Multiplier for delay after each failed attempt.
+            jitter (float): Relative random deviation from delay, e.g. 0.1 for +/- 10 percent.
+        """
+        self._timeout_in_ms = None if timeout_in_ms is None else max(timeout_in_ms, 0)
+        self._max_attempts = max_attempts
+        self._initial_delay = max(initial_delay_in_ms, 0) / 1000
+        self._max_delay = max(max_delay_in_ms, initial_delay_in_ms, 0) / 1000
+        self._factor = max(factor, 1.0)
+        self._jitter = min(max(jitter, 0.0), 1.0)
+        self.statistics = BackoffStatistics()
+
+    @staticmethod
+    def get_total_sleep_time_in_ms() -> float:
+        """
+        Total time in milliseconds slept by all polls on the current thread.
+        Callers compare two values to attribute waiting time to their own work.
+        """
+        return getattr(_TOTALS, "sleep_time_in_ms", 0.0)
+
+    @staticmethod
+    def get_total_retries() -> int:
+        """
+        Total amount of retries by all polls on the current thread.
+        """
+        return getattr(_TOTALS, "retries", 0)
+
+    def poll(self,
+             func: Callable[[], Any],
+             predicate: Callable[[Any], bool] = bool,
+             sleep: Callable[[float], Any] = time.sleep) -> Any:
+        """
+        Calls func until predicate accepts its result or the policy is exhausted.
+
+        Args:
+            func (Callable): Function to call without arguments.
+            predicate (Callable): Returns True if result from func is accepted. By default, truthy results.
+            sleep (Callable): Sleep function called with seconds. If it returns True the delay is reset
+                              to the initial delay, e.g. threading.Event.wait to wake up on events.
+
+        Returns:
+            Last result from func.
+        """
+        statistics = BackoffStatistics()
+        self.statistics = statistics
+
+        start = time.monotonic()
+        deadline = None if self._timeout_in_ms is None else start + self._timeout_in_ms / 1000
+        delay = self._initial_delay
+
+        try:
+            while True:
+                statistics.attempts += 1
+                result = func()
+
+                if predicate(result):
+                    statistics.succeeded = True
+                    return result
+
+                if self._max_attempts is not None and statistics.attempts >= self._max_attempts:
+                    return result
+
+                wait = self._randomize(delay)
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return result
+                    wait = min(wait, remaining)
+
+                statistics.sleeps += 1
+                sleep_start = time.monotonic()
+                woken = sleep(wait)
+                statistics.sleep_time_in_ms += (time.monotonic() - sleep_start) * 1000
+
+                delay = self._initial_delay if woken else min(delay * self._factor, self._max_delay)
+        finally:
+            statistics.elapsed_time_in_ms = (time.monotonic() - start) * 1000
+            _TOTALS.sleep_time_in_ms = Backoff.get_total_sleep_time_in_ms() + statistics.sleep_time_in_ms
+            _TOTALS.retries = Backoff.get_total_retries() + statistics.retries
+
+    def _randomize(self, delay: float) -> float:
+        """
+        Applies jitter to a delay.
+
+        Args:
+            delay (float): Delay in seconds.
+        """
+        if not self._jitter:
+            return delay
+
+        return delay * random.uniform(1 - self._jitter, 1 + self._jitter)
@@ -1,6 +1,7 @@
 import re
-from typing import Any, Union
+from typing import Any, Optional, Tuple, Union
 from System import TimeSpan  # pylint: disable=import-error
+from System import Exception as CSharpException  # pylint: disable=import-error
 from FlaUILibrary.flaui.util.automationelement import AutomationElement
 from FlaUILibrary.flaui.exception.flauierror import FlaUiError
 
@@ -109,6 +110,22 @@ class Converter:
             return result
         return ""
 
+    @staticmethod
+    def try_get_runtime_id(element: Any) -> Optional[Tuple[int, ...]]:
+        """
+        Helper to convert the runtime id from an automation element to a hashable tuple.
+
+        Args:
+            element (Object): Automation element.
+
+        Returns:
+            Tuple[int, ...] | None: The runtime id, or None if the element is not available anymore.
+        """
+        try:
+            return tuple(int(value) for value in element.Properties.RuntimeId.Value)
+        except (CSharpException, AttributeError, TypeError):
+            return None
+
     @staticmethod
     def _unwrap_property(value: Any) -> Any:
         """
@@ -0,0 +1,136 @@
+import threading
+import time
+from typing import Any, Callable, Iterable, Optional
+from System import Action, Array, Int32, Object  # pylint: disable=import-error
+from System import Exception as CSharpException  # pylint: disable=import-error
+from FlaUI.Core.AutomationElements import AutomationElement  # pylint: disable=import-error
+from FlaUI.Core.Definitions import StructureChangeType, TreeScope  # pylint: disable=import-error
+from FlaUI.Core.Identifiers import PropertyId  # pylint: disable=import-error
+from FlaUILibrary.flaui.util.backoff import Backoff
+
+
+class EventWaiter:
+    """
+    Waits until a condition is fulfilled or a timeout is reached.
+
+    The condition is polled by exponential backoff which starts at a few milliseconds and grows up to a maximum
+    interval. A structure changed or property changed event below the observed element ends the current
+    interval early, but not before a minimum interval which is half from the longest interval. Events never
+    reset the backoff, so a steady stream of events does not evaluate the condition in a tight loop.
+    If no element is observed or events could not be registered, polling is used only.
+    """
+
+    MIN_POLL_INTERVAL_IN_MS = 10
+    MAX_POLL_INTERVAL_IN_MS = 250
+    MIN_EVENT_INTERVAL_RATIO = 0.5
+
+    def __init__(self, element: Optional[Any], property_ids: Iterable[Any] = ()):
+        """
+        Creates an event waiter for an element subtree.
+
+        Args:
+            element (Object): Automation element to observe, e.g. search root or main window element.
+                              None to poll only, e.g. for the desktop whose events are raised by any application.
+            property_ids (List): Property ids from automation property library to observe for changes.
+        """
+        self._element = element
+        self._property_ids = list(property_ids)
+        self._changed = threading.Event()
+        self._handlers = []
+        self._max_interval = 0.0
+
+    def wait(self, condition: Callable[[], bool], timeout_in_ms: int) -> bool:
+        """
+        Waits until condition returns True or timeout is reached.
+
+        Args:
+            condition (Callable): Condition to evaluate, must not raise exceptions.
+            timeout_in_ms (int): Timeout in milliseconds.
+
+        Returns:
+            bool: True if condition was fulfilled, False if timeout was reached.
+        """
+        start = time.monotonic()
+
+        if condition():
+            return True
+
+        def check() -> bool:
+            self._changed.clear()
+            return condition()
+
+        self._max_interval = 0.0
+        self._register()
+        try:
+            remaining_in_ms = max(timeout_in_ms - (time.monotonic() - start) * 1000, 0)
+            backoff = Backoff(timeout_in_ms=remaining_in_ms,
+                              initial_delay_in_ms=self.MIN_POLL_INTERVAL_IN_MS,
+                              max_delay_in_ms=self.MAX_POLL_INTERVAL_IN_MS)
+            return backoff.poll(check, sleep=self._wait_for_change)
+        finally:
+            self._unregister()
+
+    def _wait_for_change(self, timeout: float) -> bool:
+        """
+        Waits until an event was raised or timeout is reached, but at least the minimum interval.
+        Timeouts shortened by the deadline do not shorten the minimum interval.
+        Bursts of events are coalesced by the minimum interval before the condition is evaluated again.
+
+        Args:
+            timeout (float): Timeout in seconds.
+
+        Returns:
+            bool: Always False, events do not reset the backoff delay.
+        """
+        start = time.monotonic()
+        self._max_interval = max(self._max_interval, timeout)
+        if self._changed.wait(timeout):
+            min_interval = max(self._max_interval * self.MIN_EVENT_INTERVAL_RATIO, self.MIN_POLL_INTERVAL_IN_MS / 1000)
+            time.sleep(max(min(min_interval, timeout) - (time.monotonic() - start), 0))
+
+        return False
+
+    def _register(self) -> None:
+        """
+        Registers structure and property changed event handlers.
+        Failures are ignored because polling is used as fallback.
+        """
+        if self._element is None:
+            return
+
+        try:
+            self._handlers.append(self._element.RegisterStructureChangedEvent(
+                TreeScope.Subtree,
+                Action[AutomationElement, StructureChangeType, Array[Int32]](self._on_structure_changed)))
+
+            if self._property_ids:
+                self._handlers.append(self._element.RegisterPropertyChangedEvent(
+                    TreeScope.Subtree,
+                    Action[AutomationElement, PropertyId, Object](self._on_property_changed),
+                    Array[PropertyId](self._property_ids)))
+        except (CSharpException, TypeError):
+            pass
+
+    def _unregister(self) -> None:
+        """
+        Removes all registered event handlers.
+        """
+        for handler in self._handlers:
+            try:
+                handler.Dispose()
+            except CSharpException:
+                pass
+
+        self._handlers = []
+
+    def _on_structure_changed(self, _element: Any, _change_type: Any, _runtime_id: Any) -> None:
+        """
+        Structure changed event callback from UI Automation thread.
+        """
+        self._changed.set()
+
+    def _on_property_changed(self, _element: Any, _property_id: Any, _value: Any) -> None:
+        """
+        Property changed event callback from UI Automation thread.
+        """
+        self._changed.set()
@@ -0,0 +1,171 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from System import Action, Array, Int32  # pylint: disable=import-error
+from System import Exception as CSharpException  # pylint: disable=import-error
+from FlaUI.Core.AutomationElements import AutomationElement  # pylint: disable=import-error
+from FlaUI.Core.Definitions import StructureChangeType, TreeScope  # pylint: disable=import-error
+from FlaUILibrary.flaui.util.converter import Converter
+from FlaUILibrary.flaui.util.gridrows import GridRows
+
+
+class GridIndex:
+    """
+    Index from cell values to row indices per grid and column.
+
+    The index from a grid is built once by a bulk read from all rows and stored by the runtime id from the grid.
+    It is rebuilt if the row count changed, if rows were added or removed by a structure changed event or if a
+    value is not found. Rows found by the index are verified by reading the row again, so cell values edited
+    after the build never return a wrong row.
+    """
+
+    # Structure changes from adding or removing rows, invalidated or reordered children are also raised by
+    # virtualized grids while scrolling and are covered by the row count.
+    _STRUCTURE_CHANGES = (StructureChangeType.ChildAdded, StructureChangeType.ChildRemoved,
+                          StructureChangeType.ChildrenBulkAdded, StructureChangeType.ChildrenBulkRemoved)
+
+    class _Entry:
+        """
+        Indexed values from one grid.
+        """
+
+        def __init__(self, row_count: int, columns: Dict[int, Dict[str, List[int]]]):
+            self.row_count = row_count
+            self.columns = columns
+            self.changed = threading.Event()
+            self.handler = None
+
+    def __init__(self, max_size: int = 16):
+        """
+        Creates an empty grid index.
+
+        Args:
+            max_size (int): Maximum amount of indexed grids before least recently used grids are removed.
+        """
+        self._entries = OrderedDict()
+        self._max_size = max(max_size, 1)
+
+    def find_rows(self, control: Any, column: int, value: str) -> Optional[List[Tuple[int, List[str]]]]:
+        """
+        Returns index and cell values from all rows whose cell in column equals value, each row is verified by
+        reading it again. Index is rebuilt once if it is outdated or the value is not found.
+
+        Args:
+            control (Object): Grid control.
+            column (int): Index from column to compare.
+            value (str): Expected cell value.
+
+        Returns:
+            List of (row index, cell values) tuples or None if the grid could not be indexed.
+        """
+        runtime_id = Converter.try_get_runtime_id(control)
+        if runtime_id is None:
+            return None
+
+        entry = self._get_entry(control, runtime_id)
+        rows = self._find_verified_rows(control, entry, column, value) if entry is not None else []
+
+        if not rows:
+            entry = self._build(control, runtime_id)
+            rows = self._find_verified_rows(control, entry, column, value)
+
+        return rows
+
+    def invalidate(self, control: Any) -> None:
+        """
+        Removes the index from a grid, e.g. after rows were changed by the library.
+
+        Args:
+            control (Object): Grid control.
+        """
+        runtime_id = Converter.try_get_runtime_id(control)
+        if runtime_id in self._entries:
+            GridIndex._unregister(self._entries.pop(runtime_id))
+
+    def clear(self) -> None:
+        """
+        Removes the index from all grids.
+        """
+        for entry in self._entries.values():
+            GridIndex._unregister(entry)
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_entry(self, control: Any, runtime_id: Tuple[int, ...]) -> Optional[_Entry]:
+        """
+        Returns the index from a grid if rows were not added or removed since it was built.
+        """
+        entry = self._entries.get(runtime_id)
+        if entry is None:
+            return None
+
+        if entry.changed.is_set() or entry.row_count != int(control.RowCount):
+            GridIndex._unregister(self._entries.pop(runtime_id))
+            return None
+
+        self._entries.move_to_end(runtime_id)
+        return entry
+
+    def _build(self, control: Any, runtime_id: Tuple[int, ...]) -> _Entry:
+        """
+        Builds the index from a grid by a bulk read from all rows and registers for structure changes.
+        """
+        if runtime_id in self._entries:
+            GridIndex._unregister(self._entries.pop(runtime_id))
+
+        columns = {}
+        for (row_index, values) in GridRows.iterate_virtualized_with_index(control):
+            for (column, value) in enumerate(values):
+                columns.setdefault(column, {}).setdefault(value, []).append(row_index)
+
+        entry = GridIndex._Entry(int(control.RowCount), columns)
+        GridIndex._register(control, entry)
+        self._entries[runtime_id] = entry
+
+        while len(self._entries) > self._max_size:
+            GridIndex._unregister(self._entries.popitem(last=False)[1])
+
+        return entry
+
+    @staticmethod
+    def _find_verified_rows(control: Any, entry: _Entry, column: int, value: str) -> List[Tuple[int, List[str]]]:
+        """
+        Returns index and cell values from indexed rows whose cell in column still equals value.
+        """
+        rows = []
+        for row_index in entry.columns.get(column, {}).get(value, []):
+            values = GridRows.read_row(control, row_index)
+            if values is not None and column < len(values) and values[column] == value:
+                rows.append((row_index, values))
+        return rows
+
+    @staticmethod
+    def _register(control: Any, entry: _Entry) -> None:
+        """
+        Registers a structure changed event handler which invalidates the index if rows were added or removed.
+        Failures are ignored because the row count is compared on each usage.
+        """
+        def on_structure_changed(_element: Any, change_type: Any, _runtime_id: Any) -> None:
+            if change_type in GridIndex._STRUCTURE_CHANGES:
+                entry.changed.set()
+
+        try:
+            entry.handler = control.RegisterStructureChangedEvent(
+                TreeScope.Children,
+                Action[AutomationElement, StructureChangeType, Array[Int32]](on_structure_changed))
+        except (CSharpException, AttributeError, TypeError):
+            entry.handler = None
+
+    @staticmethod
+    def _unregister(entry: _Entry) -> None:
+        """
+        Removes the structure changed event handler from an index.
+        """
+        if entry.handler is not None:
+            try:
+                entry.handler.Dispose()
+            except CSharpException:
+                pass
+            entry.handler = None
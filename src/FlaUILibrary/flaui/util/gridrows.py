@@ -0,0 +1,344 @@
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+from System import NullReferenceException  # pylint: disable=import-error
+from System import InvalidOperationException  # pylint: disable=import-error
+from System import Exception as CSharpException  # pylint: disable=import-error
+from FlaUI.Core import CacheRequest  # pylint: disable=import-error
+from FlaUI.Core.Definitions import ControlType, TreeScope  # pylint: disable=import-error
+
+
+class GridRows:
+    """
+    A helper class to read cell values from grid controls.
+
+    Rows are searched by one UIA call with a cache request pushed down to the row search, which fetches control
+    type, value and row index from all cells in the same call. Reading cell values afterwards does not need a cross
+    process call per cell. Rows are streamed as generator, so callers can stop reading if a row matches.
+
+    Row ranges and yielded row indices refer to the row index from GridItemPattern, also if only a part of the rows
+    is realized. Rows whose cells do not support GridItemPattern are indexed by their position instead.
+    """
+
+    # Placeholder from WPF DataGrid to add new rows
+    PLACEHOLDER = "NewItemPlaceholder"
+
+    @staticmethod
+    def iterate(control: Any,
+                start_row: Optional[int] = None,
+                end_row: Optional[int] = None,
+                columns: Optional[Sequence[int]] = None) -> Iterator[List[str]]:
+        """
+        Yields cell values from each row. Empty rows and placeholder cells are skipped.
+
+        Args:
+            control (Object): Grid control.
+            start_row (Number): Index from first row to read, by default first row.
+            end_row (Number): Index after last row to read, by default all rows.
+            columns (List): Indices from columns to read in given order, by default all columns.
+        """
+        for (_, values) in GridRows.iterate_with_index(control, start_row, end_row, columns):
+            yield values
+
+    @staticmethod
+    def iterate_with_index(control: Any,
+                           start_row: Optional[int] = None,
+                           end_row: Optional[int] = None,
+                           columns: Optional[Sequence[int]] = None) -> Iterator[Tuple[int, List[str]]]:
+        """
+        Yields row index and cell values from each row like iterate.
+
+        Args:
+            control (Object): Grid control.
+            start_row (Number): Index from first row to read, by default first row.
+            end_row (Number): Index after last row to read, by default all rows.
+            columns (List): Indices from columns to read in given order, by default all columns.
+        """
+        try:
+            cache_request = GridRows._create_cache_request(control)
+            rows = GridRows._find_rows(control, cache_request)
+        except (CSharpException, AttributeError, TypeError):
+            yield from GridRows._iterate_without_cache(control, start_row, end_row, columns)
+            return
+
+        yield from GridRows._iterate_realized(control, rows, cache_request, start_row, end_row, columns)
+
+    @staticmethod
+    def iterate_virtualized(control: Any,
+                            start_row: Optional[int] = None,
+                            end_row: Optional[int] = None,
+                            columns: Optional[Sequence[int]] = None,
+                            scroll: bool = False) -> Iterator[List[str]]:
+        """
+        Yields cell values from each row like iterate, including rows which are not realized by a virtualized grid.
+
+        Realized rows are read in bulk as one page. If the grid reports more rows than are realized, the first row
+        is searched by ItemContainerPattern, realized by VirtualizedItemPattern and scrolled into view by
+        ScrollItemPattern, which realizes the first page. The row after each page is realized the same way.
+        Each row is yielded once by its row index from GridItemPattern, rows from overlapping pages are skipped.
+        Grids without ItemContainerPattern or cells without GridItemPattern are read like iterate.
+
+        Args:
+            control (Object): Grid control.
+            start_row (Number): Index from first row to read, by default first row.
+            end_row (Number): Index after last row to read, by default all rows.
+            columns (List): Indices from columns to read in given order, by default all columns.
+            scroll (Boolean): True to realize rows page by page even if all rows seem to be realized,
+                              e.g. if the grid does not report the number of its rows.
+        """
+        for (_, values) in GridRows.iterate_virtualized_with_index(control, start_row, end_row, columns, scroll):
+            yield values
+
+    @staticmethod
+    def iterate_virtualized_with_index(control: Any,
+                                       start_row: Optional[int] = None,
+                                       end_row: Optional[int] = None,
+                                       columns: Optional[Sequence[int]] = None,
+                                       scroll: bool = False) -> Iterator[Tuple[int, List[str]]]:
+        """
+        Yields row index and cell values from each row like iterate_virtualized.
+
+        Args:
+            control (Object): Grid control.
+            start_row (Number): Index from first row to read, by default first row.
+            end_row (Number): Index after last row to read, by default all rows.
+            columns (List): Indices from columns to read in given order, by default all columns.
+            scroll (Boolean): True to realize rows page by page even if all rows seem to be realized.
+        """
+        item_container = GridRows._get_item_container(control)
+        if item_container is None:
+            yield from GridRows.iterate_with_index(control, start_row, end_row, columns)
+            return
+
+        cache_request = GridRows._create_cache_request(control)
+        rows = list(GridRows._find_rows(control, cache_request))
+        if not scroll and not GridRows._has_unrealized_rows(control, rows):
+            yield from GridRows._iterate_realized(control, rows, cache_request, start_row, end_row, columns)
+            return
+
+        start_row = start_row or 0
+        seen = set()
+        next_row = GridRows._scroll_into_view(item_container.FindItemByProperty(None, None, None))
+
+        while next_row is not None:
+            page = [(row,) + GridRows._read_row(control, row, cache_request, columns)
+                    for row in GridRows._find_rows(control, cache_request)]
+
+            if not seen and any(row_index is None for (_, row_index, _) in page):
+                yield from GridRows.iterate_with_index(control, start_row, end_row, columns)
+                return
+
+            last_row = None
+            for (row, row_index, values) in page:
+                if row_index is None or row_index in seen:
+                    continue
+                seen.add(row_index)
+                last_row = row
+                if values and row_index >= start_row and (end_row is None or row_index < end_row):
+                    yield row_index, values
+
+            if last_row is None or (end_row is not None and max(seen) >= end_row - 1):
+                return
+
+            next_row = GridRows._scroll_into_view(item_container.FindItemByProperty(last_row, None, None))
+
+    @staticmethod
+    def _iterate_realized(control: Any,
+                          rows: Any,
+                          cache_request: Any,
+                          start_row: Optional[int],
+                          end_row: Optional[int],
+                          columns: Optional[Sequence[int]]) -> Iterator[Tuple[int, List[str]]]:
+        """
+        Yields row index and cell values from rows found by _find_rows which are in range.
+        Rows are indexed by GridItemPattern and by their position if it is not supported.
+        """
+        for (position, row) in enumerate(rows):
+            (row_index, values) = GridRows._read_row(control, row, cache_request, columns)
+            row_index = position if row_index is None else row_index
+
+            if end_row is not None and row_index >= end_row:
+                return
+            if values and (start_row is None or row_index >= start_row):
+                yield row_index, values
+
+    @staticmethod
+    def _has_unrealized_rows(control: Any, rows: List[Any]) -> bool:
+        """
+        Return True if the grid reports more rows than are realized, False if the row count is not available.
+        """
+        try:
+            return len(rows) < int(control.RowCount)
+        except (CSharpException, AttributeError, TypeError, ValueError):
+            return False
+
+    @staticmethod
+    def _iterate_without_cache(control: Any,
+                               start_row: Optional[int] = None,
+                               end_row: Optional[int] = None,
+                               columns: Optional[Sequence[int]] = None) -> Iterator[Tuple[int, List[str]]]:
+        """
+        Yields row index and cell values from each row by reading each cell from the live element.
+        Used if caching is not available. Arguments are the same as from iterate.
+        """
+        for (row_index, row) in enumerate(GridRows._slice(control.Rows, start_row, end_row), start_row or 0):
+            values = GridRows._filter([GridRows.cell_value(cell) for cell in GridRows._select(row.Cells, columns)])
+            if values:
+                yield row_index, values
+
+    @staticmethod
+    def read_row(control: Any, row_index: int) -> Optional[List[str]]:
+        """
+        Return cell values from one row by its index or None if the row does not exist anymore.
+
+        Args:
+            control (Object): Grid control.
+            row_index (Number): Index from row to read.
+        """
+        try:
+            row = control.GetRowByIndex(row_index)
+            return GridRows._filter([GridRows.cell_value(cell) for cell in row.Cells])
+        except (AttributeError, IndexError, CSharpException):
+            return None
+
+    @staticmethod
+    def cell_value(cell: Any) -> str:
+        """
+        Return a cell's display value as text.
+
+        UIA2 DataGrid template cells can report None or raise when ValuePattern
+        is missing. Treat those as an empty string so grid keywords stay stable.
+        """
+        try:
+            value = cell.Value
+        except (AttributeError, InvalidOperationException, NullReferenceException, CSharpException):
+            return ""
+
+        if value is None:
+            return ""
+        return str(value)
+
+    @staticmethod
+    def _find_rows(control: Any, cache_request: Any) -> Any:
+        """
+        Search all realized rows by one call, cells below each row are fetched by the cache request.
+        """
+        cache = cache_request.Activate()
+        try:
+            # Rows from data grids are data items, rows from list views are list items
+            factory = control.ConditionFactory
+            return control.FindAll(TreeScope.Children,
+                                   factory.ByControlType(ControlType.DataItem).Or(
+                                       factory.ByControlType(ControlType.ListItem)))
+        finally:
+            cache.Dispose()
+
+    @staticmethod
+    def _read_row(control: Any,
+                  row: Any,
+                  cache_request: Any,
+                  columns: Optional[Sequence[int]]) -> Tuple[Optional[int], List[str]]:
+        """
+        Return row index from GridItemPattern and filtered cell values from a row found by _find_rows.
+        Row index is None if cells do not support GridItemPattern.
+        """
+        library = control.Automation.PropertyLibrary
+        # Caching is only active while values from one row are read, so callers can use live
+        # values between two rows.
+        cache = cache_request.Activate()
+        try:
+            cells = [cell for cell in row.CachedChildren if cell.ControlType != ControlType.HeaderItem]
+            row_index = GridRows._cached_row_index(cells, library.GridItem.Row)
+            values = GridRows._filter([GridRows._cached_property(cell, library.Value.Value)
+                                       for cell in GridRows._select(cells, columns)])
+        finally:
+            cache.Dispose()
+
+        return row_index, values
+
+    @staticmethod
+    def _cached_row_index(cells: List[Any], row_id: Any) -> Optional[int]:
+        """
+        Return row index from the first cell which supports GridItemPattern.
+        """
+        for cell in cells:
+            (is_supported, value) = cell.FrameworkAutomationElement.TryGetPropertyValue(row_id)
+            if is_supported and value is not None:
+                return int(value)
+        return None
+
+    @staticmethod
+    def _cached_property(cell: Any, property_id: Any) -> str:
+        """
+        Return a cell's property from cache as text, empty string if the property is not supported.
+        """
+        (is_supported, value) = cell.FrameworkAutomationElement.TryGetPropertyValue(property_id)
+        if not is_supported or value is None:
+            return ""
+        return str(value)
+
+    @staticmethod
+    def _create_cache_request(control: Any) -> Any:
+        """
+        Create a cache request for control type, value and row index from all cells below each found row.
+        """
+        library = control.Automation.PropertyLibrary
+        cache_request = CacheRequest()
+        cache_request.TreeScope = TreeScope.Children
+        cache_request.Add(library.Element.ControlType)
+        cache_request.Add(library.Value.Value)
+        cache_request.Add(library.GridItem.Row)
+        return cache_request
+
+    @staticmethod
+    def _get_item_container(control: Any) -> Any:
+        """
+        Return ItemContainerPattern from a grid or None if it is not supported.
+        """
+        try:
+            return control.Patterns.ItemContainer.PatternOrDefault
+        except (CSharpException, AttributeError):
+            return None
+
+    @staticmethod
+    def _scroll_into_view(row: Any) -> Any:
+        """
+        Realize a virtualized row and scroll it into view, neighbouring rows are realized by the grid.
+        """
+        if row is None:
+            return None
+
+        virtualized_item = row.Patterns.VirtualizedItem.PatternOrDefault
+        if virtualized_item is not None:
+            virtualized_item.Realize()
+
+        scroll_item = row.Patterns.ScrollItem.PatternOrDefault
+        if scroll_item is not None:
+            scroll_item.ScrollIntoView()
+
+        return row
+
+    @staticmethod
+    def _slice(rows: Any, start_row: Optional[int], end_row: Optional[int]) -> Any:
+        """
+        Return rows from start to end index, rows are only copied if a range is given.
+        """
+        if start_row is None and end_row is None:
+            return rows
+        return list(rows)[start_row:end_row]
+
+    @staticmethod
+    def _select(cells: Any, columns: Optional[Sequence[int]]) -> Any:
+        """
+        Return cells from given column indices, columns which do not exist in a row are ignored.
+        """
+        if columns is None:
+            return cells
+
+        cells = list(cells)
+        return [cells[column] for column in columns if 0 <= column < len(cells)]
+
+    @staticmethod
+    def _filter(values: List[str]) -> List[str]:
+        """
+        Remove placeholder cells from new item rows.
+        """
+        return [value for value in values if GridRows.PLACEHOLDER not in value]
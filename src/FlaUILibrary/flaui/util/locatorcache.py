@@ -0,0 +1,153 @@
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+
+class LocatorCache:
+    """
+    Least recently used cache for automation elements resolved from XPath prefixes.
+
+    Each entry stores the resolved element together with a validation token (e.g. runtime id).
+    Entries are validated on every hit and evicted if the validation fails.
+    """
+
+    CHILD_SEPARATOR = "/"
+    DESCENDANT_SEPARATOR = "//"
+
+    def __init__(self, max_size: int = 128):
+        """
+        Creates an empty locator cache.
+
+        Args:
+            max_size (int): Maximum amount of cached entries before least recently used entries are evicted.
+        """
+        self._entries = OrderedDict()
+        self._max_size = max(max_size, 1)
+
+    def get(self, key: Hashable, validator: Callable[[Any, Any], bool]) -> Optional[Any]:
+        """
+        Returns the cached element for key if it is still valid otherwise None.
+
+        Args:
+            key (Hashable): Cache key like an XPath prefix.
+            validator (Callable): Callable which receives element and token and returns True if entry is valid.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        element, token = entry
+        if not validator(element, token):
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return element
+
+    def put(self, key: Hashable, element: Any, token: Any) -> None:
+        """
+        Stores an element by key and evicts least recently used entries if the cache is full.
+
+        Args:
+            key (Hashable): Cache key like an XPath prefix.
+            element (Object): Element to cache.
+            token (Object): Validation token like a runtime id.
+        """
+        self._entries[key] = (element, token)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes all cached entries.
+        """
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def split_steps(xpath: str) -> Optional[List[Tuple[str, str]]]:  # pylint: disable=too-many-branches
+        """
+        Splits an absolute XPath into location steps.
+
+        Separators inside predicates or quoted values are ignored.
+        Unions, grouped expressions or relative paths are not supported and return None.
+
+        Args:
+            xpath (str): Absolute XPath like /Window[@Name='App']/Button[@AutomationId='Ok']
+
+        Returns:
+            List of (separator, step) tuples like [('/', "Window[@Name='App']"), ('/', "Button[...]")] or None.
+        """
+        if not xpath or not xpath.startswith(LocatorCache.CHILD_SEPARATOR):
+            return None
+
+        steps = []
+        separator = ""
+        step = ""
+        quote = None
+        depth = 0
+        index = 0
+
+        while index < len(xpath):
+            char = xpath[index]
+
+            if quote:
+                step += char
+                if char == quote:
+                    quote = None
+            elif char in ("'", '"'):
+                quote = char
+                step += char
+            elif char == "[":
+                depth += 1
+                step += char
+            elif char == "]":
+                depth -= 1
+                step += char
+            elif depth == 0 and char in ("|", "(", ")"):
+                return None
+            elif depth == 0 and char == "/":
+                if separator:
+                    if not LocatorCache._is_supported_step(step):
+                        return None
+                    steps.append((separator, step))
+                step = ""
+                if xpath.startswith(LocatorCache.DESCENDANT_SEPARATOR, index):
+                    separator = LocatorCache.DESCENDANT_SEPARATOR
+                    index += 1
+                else:
+                    separator = LocatorCache.CHILD_SEPARATOR
+            else:
+                step += char
+
+            index += 1
+
+        if quote or depth != 0 or not LocatorCache._is_supported_step(step):
+            return None
+
+        steps.append((separator, step))
+        return steps
+
+    @staticmethod
+    def _is_supported_step(step: str) -> bool:
+        """
+        Returns True if step is a plain element step without axis or self and parent references.
+
+        Args:
+            step (str): Location step like Button[@Name='OK']
+        """
+        name = step.split("[", 1)[0]
+        return bool(name) and not name.startswith(".") and "::" not in name
+
+    @staticmethod
+    def join_steps(steps: List[Tuple[str, str]]) -> str:
+        """
+        Joins location steps created by split_steps to an XPath.
+
+        Args:
+            steps (List): List of (separator, step) tuples.
+        """
+        return "".join(separator + step for separator, step in steps)
@@ -0,0 +1,182 @@
+import csv
+import json
+import math
+import random
+import time
+from typing import Any, Callable, Dict, List
+from FlaUILibrary.flaui.util.backoff import Backoff
+
+
+class LocatorRecord:
+    """
+    Running lookup statistics from one XPath with bounded memory.
+
+    Count, total and max are kept as running values. Percentiles are computed from a reservoir sample with
+    a fixed size, which holds every duration as long as the amount of lookups does not exceed the reservoir.
+    """
+
+    def __init__(self, reservoir_size: int):
+        """
+        Creates an empty record.
+
+        Args:
+            reservoir_size (int): Maximum amount of durations kept to compute percentiles.
+        """
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.retries = 0
+        self.not_found = 0
+        self.samples: List[float] = []
+        self._reservoir_size = reservoir_size
+
+    def add(self, duration_in_ms: float, retries: int, found: bool) -> None:
+        """
+        Adds a lookup to the record.
+
+        Args:
+            duration_in_ms (float): Lookup duration in milliseconds.
+            retries (int): Amount of retries during lookup.
+            found (bool): False if lookup failed.
+        """
+        self.count += 1
+        self.total_ms += duration_in_ms
+        self.max_ms = max(self.max_ms, duration_in_ms)
+        self.retries += retries
+        self.not_found += int(not found)
+
+        if len(self.samples) < self._reservoir_size:
+            self.samples.append(duration_in_ms)
+        else:
+            index = random.randrange(self.count)
+            if index < self._reservoir_size:
+                self.samples[index] = duration_in_ms
+
+
+class LocatorStatistics:
+    """
+    Collects lookup times from each distinct XPath to find slow locators.
+
+    Each lookup records its duration and the amount of retries from backoff polling during the lookup.
+    Reports are ranked by total lookup time, so the locators which dominate the runtime are listed first.
+    Memory per XPath is bounded, the p95 value is exact until more lookups than the reservoir size are recorded
+    and estimated from a uniform sample afterwards.
+    """
+
+    RESERVOIR_SIZE = 1024
+
+    FIELDS = ("rank", "xpath", "count", "not_found", "retries", "total_ms", "mean_ms", "p95_ms", "max_ms")
+
+    def __init__(self, reservoir_size: int = RESERVOIR_SIZE):
+        """
+        Creates empty locator statistics.
+
+        Args:
+            reservoir_size (int): Maximum amount of durations kept per XPath to compute percentiles.
+        """
+        self._reservoir_size = reservoir_size
+        self._records: Dict[str, LocatorRecord] = {}
+
+    def measure(self, xpath: str, lookup: Callable[[], Any]) -> Any:
+        """
+        Calls lookup and records its duration. Lookups returning an empty result or raising an exception are
+        recorded as not found.
+
+        Args:
+            xpath (str): XPath from lookup.
+            lookup (Callable): Lookup to measure.
+
+        Returns:
+            Result from lookup.
+        """
+        start = time.perf_counter()
+        retries_start = Backoff.get_total_retries()
+        result = None
+
+        try:
+            result = lookup()
+            return result
+        finally:
+            self.record(xpath,
+                        (time.perf_counter() - start) * 1000,
+                        Backoff.get_total_retries() - retries_start,
+                        bool(result))
+
+    def record(self, xpath: str, duration_in_ms: float, retries: int = 0, found: bool = True) -> None:
+        """
+        Records a lookup by XPath.
+
+        Args:
+            xpath (str): XPath from lookup.
+            duration_in_ms (float): Lookup duration in milliseconds.
+            retries (int): Amount of retries during lookup.
+            found (bool): False if lookup failed.
+        """
+        record = self._records.get(xpath)
+        if record is None:
+            record = self._records[xpath] = LocatorRecord(self._reservoir_size)
+
+        record.add(duration_in_ms, retries, found)
+
+    def get_report(self) -> List[Dict[str, Any]]:
+        """
+        Returns statistics from each XPath ranked by total lookup time.
+
+        Returns:
+            List from dictionaries with rank, xpath, count, not_found, retries, total_ms, mean_ms, p95_ms and max_ms.
+        """
+        rows = []
+        for (xpath, record) in self._records.items():
+            rows.append({
+                "xpath": xpath,
+                "count": record.count,
+                "not_found": record.not_found,
+                "retries": record.retries,
+                "total_ms": round(record.total_ms, 3),
+                "mean_ms": round(record.total_ms / record.count, 3),
+                "p95_ms": round(self._get_percentile(record.samples, 95), 3),
+                "max_ms": round(record.max_ms, 3),
+            })
+
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return [dict(rank=index, **row) for (index, row) in enumerate(rows, start=1)]
+
+    def reset(self) -> None:
+        """
+        Removes all collected statistics.
+        """
+        self._records = {}
+
+    def write_csv(self, filepath: str) -> None:
+        """
+        Writes ranked report as CSV file.
+
+        Args:
+            filepath (str): Destination file path.
+        """
+        with open(filepath, "w", encoding="utf-8", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=self.FIELDS)
+            writer.writeheader()
+            writer.writerows(self.get_report())
+
+    def write_json(self, filepath: str) -> None:
+        """
+        Writes ranked report as JSON file.
+
+        Args:
+            filepath (str): Destination file path.
+        """
+        with open(filepath, "w", encoding="utf-8") as file:
+            json.dump(self.get_report(), file, indent=2)
+
+    @staticmethod
+    def _get_percentile(values: List[float], percentile: int) -> float:
+        """
+        Returns percentile from values by nearest rank method.
+
+        Args:
+            values (List): Values, must not be empty.
+            percentile (int): Percentile between 1 and 100.
+        """
+        ordered = sorted(values)
+        return ordered[max(math.ceil(percentile / 100 * len(ordered)) - 1, 0)]
@@ -0,0 +1,98 @@
+import json
+import os
+from typing import Dict, Optional
+
+
+class LocatorStore:
+    """
+    Persistent store from concrete XPaths which were resolved by previous test runs.
+
+    Maps an XPath like //Button[@Name='OK'] from an application to the indexed XPath from desktop like
+    /Window[2]/Pane/Button[3] returned by FlaUI Debug.GetXPathToElement. The indexed XPath only walks children,
+    so it can be evaluated much faster than a descendant search on the next run.
+    The file is loaded on first usage and only written if entries were changed.
+    """
+
+    VERSION = 1
+
+    def __init__(self, filepath: str):
+        """
+        Creates a locator store.
+
+        Args:
+            filepath (str): JSON file to load and save entries.
+        """
+        self._filepath = filepath
+        self._applications: Optional[Dict[str, Dict[str, str]]] = None
+        self._changed = False
+
+    def get(self, application: str, xpath: str) -> Optional[str]:
+        """
+        Returns the concrete XPath from last resolution or None if unknown.
+
+        Args:
+            application (str): Application name.
+            xpath (str): XPath used by the test.
+        """
+        return self._get_applications().get(application, {}).get(xpath)
+
+    def put(self, application: str, xpath: str, concrete_xpath: str) -> None:
+        """
+        Stores the concrete XPath from a resolved element.
+
+        Args:
+            application (str): Application name.
+            xpath (str): XPath used by the test.
+            concrete_xpath (str): Indexed XPath from desktop to the resolved element.
+        """
+        locators = self._get_applications().setdefault(application, {})
+        if locators.get(xpath) != concrete_xpath:
+            locators[xpath] = concrete_xpath
+            self._changed = True
+
+    def remove(self, application: str, xpath: str) -> None:
+        """
+        Removes a concrete XPath which does not resolve the expected element anymore.
+
+        Args:
+            application (str): Application name.
+            xpath (str): XPath used by the test.
+        """
+        locators = self._get_applications().get(application, {})
+        if locators.pop(xpath, None) is not None:
+            self._changed = True
+
+    def save(self) -> None:
+        """
+        Writes all entries to the JSON file if entries were changed.
+        """
+        if not self._changed:
+            return
+
+        directory = os.path.dirname(self._filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(self._filepath, "w", encoding="utf-8") as file:
+            json.dump({"version": self.VERSION, "applications": self._get_applications()}, file, indent=2)
+
+        self._changed = False
+
+    def _get_applications(self) -> Dict[str, Dict[str, str]]:
+        """
+        Returns entries by application and loads them from file on first usage.
+        Missing, unreadable or incompatible files start with an empty store.
+        """
+        if self._applications is None:
+            self._applications = {}
+            try:
+                with open(self._filepath, "r", encoding="utf-8") as file:
+                    content = json.load(file)
+                if isinstance(content, dict) and content.get("version") == self.VERSION:
+                    self._applications = {str(application): dict(locators)
+                                          for (application, locators) in content.get("applications", {}).items()
+                                          if isinstance(locators, dict)}
+            except (OSError, ValueError):
+                pass
+
+        return self._applications
@@ -0,0 +1,174 @@
+import json
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+from FlaUILibrary.flaui.util.backoff import Backoff
+
+
+class PerformanceStatistics:
+    """
+    Collects timing statistics from automation actions split into phases.
+
+    Nested actions, e.g. an element lookup from a mouse action, are recorded as own actions and their time is
+    subtracted from the calling action, so phase times are never counted twice. Time slept by backoff polling
+    is recorded as retries phase from the action which polled.
+    """
+
+    ELEMENT_RESOLUTION = "element_resolution"
+    RETRIES = "retries"
+    ACTION = "action"
+    SCREENSHOT = "screenshot"
+    PHASES = (ELEMENT_RESOLUTION, RETRIES, ACTION, SCREENSHOT)
+
+    class _Frame:
+        """
+        Measurement from a running action.
+        """
+
+        def __init__(self):
+            self.start = time.perf_counter()
+            self.sleep_start = Backoff.get_total_sleep_time_in_ms()
+            self.retries_start = Backoff.get_total_retries()
+            self.child_time_in_ms = 0.0
+            self.child_sleep_time_in_ms = 0.0
+            self.child_retries = 0
+
+    def __init__(self):
+        """
+        Creates empty performance statistics.
+        """
+        self._actions = {}
+        self._stack: List[PerformanceStatistics._Frame] = []
+        self._total_time_in_ms = 0.0
+
+    @contextmanager
+    def measure(self, action_name: str, phase: str = ACTION) -> Iterator[None]:
+        """
+        Measures an action.
+
+        Args:
+            action_name (str): Name from action.
+            phase (str): Phase for the time spent in the action itself, e.g. ELEMENT_RESOLUTION or ACTION.
+        """
+        frame = PerformanceStatistics._Frame()
+        self._stack.append(frame)
+        failed = True
+
+        try:
+            yield
+            failed = False
+        finally:
+            self._stack.pop()
+            elapsed_in_ms = (time.perf_counter() - frame.start) * 1000
+            sleep_in_ms = Backoff.get_total_sleep_time_in_ms() - frame.sleep_start
+            retries = Backoff.get_total_retries() - frame.retries_start
+
+            own_sleep_in_ms = max(sleep_in_ms - frame.child_sleep_time_in_ms, 0.0)
+            own_time_in_ms = max(elapsed_in_ms - frame.child_time_in_ms - own_sleep_in_ms, 0.0)
+
+            entry = self._get_entry(action_name)
+            entry["count"] += 1
+            entry["failures"] += int(failed)
+            entry["total_ms"] += elapsed_in_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_in_ms)
+            entry["retries"] += retries - frame.child_retries
+            entry["phases"][phase] += own_time_in_ms
+            entry["phases"][self.RETRIES] += own_sleep_in_ms
+
+            if self._stack:
+                parent = self._stack[-1]
+                parent.child_time_in_ms += elapsed_in_ms
+                parent.child_sleep_time_in_ms += sleep_in_ms
+                parent.child_retries += retries
+            else:
+                self._total_time_in_ms += elapsed_in_ms
+
+    @contextmanager
+    def measure_screenshot(self, action_name: str) -> Iterator[None]:
+        """
+        Measures a failure screenshot from an action.
+
+        Args:
+            action_name (str): Name from failed action.
+        """
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            elapsed_in_ms = (time.perf_counter() - start) * 1000
+            self._get_entry(action_name)["phases"][self.SCREENSHOT] += elapsed_in_ms
+
+            if self._stack:
+                self._stack[-1].child_time_in_ms += elapsed_in_ms
+            else:
+                self._total_time_in_ms += elapsed_in_ms
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Returns collected statistics as dictionary.
+
+        Returns:
+            Dictionary with total time, total time per phase and statistics per action.
+            Actions contain count, failures, retries, total, mean and max time and time per phase in milliseconds.
+        """
+        actions = {}
+        phases = dict.fromkeys(self.PHASES, 0.0)
+
+        for (name, entry) in sorted(self._actions.items(), key=lambda item: item[1]["total_ms"], reverse=True):
+            actions[name] = {
+                "count": entry["count"],
+                "failures": entry["failures"],
+                "retries": entry["retries"],
+                "total_ms": round(entry["total_ms"], 3),
+                "mean_ms": round(entry["total_ms"] / entry["count"], 3) if entry["count"] else 0.0,
+                "max_ms": round(entry["max_ms"], 3),
+                "phases": {phase: round(value, 3) for (phase, value) in entry["phases"].items()},
+            }
+            for (phase, value) in entry["phases"].items():
+                phases[phase] += value
+
+        return {
+            "total_ms": round(self._total_time_in_ms, 3),
+            "phases": {phase: round(value, 3) for (phase, value) in phases.items()},
+            "actions": actions,
+        }
+
+    def reset(self) -> None:
+        """
+        Removes all collected statistics.
+        """
+        self._actions = {}
+        self._total_time_in_ms = 0.0
+
+    def write_json(self, filepath: str) -> None:
+        """
+        Writes collected statistics as JSON file.
+
+        Args:
+            filepath (str): Destination file path.
+        """
+        with open(filepath, "w", encoding="utf-8") as file:
+            json.dump(self.get_statistics(), file, indent=2)
+
+    def _get_entry(self, action_name: str) -> Dict[str, Any]:
+        """
+        Returns statistics entry from action and creates it if not exists.
+
+        Args:
+            action_name (str): Name from action.
+        """
+        entry = self._actions.get(action_name)
+
+        if entry is None:
+            entry = {
+                "count": 0,
+                "failures": 0,
+                "retries": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "phases": dict.fromkeys(self.PHASES, 0.0),
+            }
+            self._actions[action_name] = entry
+
+        return entry
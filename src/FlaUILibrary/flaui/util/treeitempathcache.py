@@ -0,0 +1,115 @@
+from typing import Any, Hashable, List, Optional, Tuple
+from System import Exception as CSharpException  # pylint: disable=import-error
+from FlaUI.Core import CacheRequest  # pylint: disable=import-error
+from FlaUI.Core.Definitions import ControlType, TreeScope  # pylint: disable=import-error
+from FlaUILibrary.flaui.util.converter import Converter
+from FlaUILibrary.flaui.util.locatorcache import LocatorCache
+from FlaUILibrary.flaui.util.treeitemsparser import TreeItemsParser
+
+
+class TreeItemPathCache:
+    """
+    Cache for tree items resolved from location prefixes like N:a->I:1, stored per tree control.
+
+    Each entry is validated on every hit against the tree items below its parent, which are fetched with runtime
+    id and name by one cache request. An entry is only valid if the last location step still resolves to the
+    cached tree item, so I:<n> must still be the item at this position and N:<name> must still be the first item
+    with this name. Entries which resolve to another tree item after items were inserted, removed or renamed
+    are evicted.
+    """
+
+    def __init__(self, max_size: int = 256):
+        """
+        Creates an empty tree item path cache.
+
+        Args:
+            max_size (int): Maximum amount of cached tree items before least recently used items are evicted.
+        """
+        self._entries = LocatorCache(max_size)
+
+    def get(self, tree_id: Hashable, path: Tuple[Tuple[str, str], ...], parent: Any) -> Optional[Any]:
+        """
+        Returns the cached tree item for a location prefix if it is still valid otherwise None.
+
+        Args:
+            tree_id (Hashable): Runtime id from tree control.
+            path (Tuple): Compiled location steps, see TreeItemsParser.get_path.
+            parent (Object): Tree control or tree item from which the last location step is resolved.
+        """
+        return self._entries.get((tree_id, path),
+                                 lambda _treeitem, runtime_id: TreeItemPathCache._is_valid(parent, path[-1],
+                                                                                          runtime_id))
+
+    def put(self, tree_id: Hashable, path: Tuple[Tuple[str, str], ...], treeitem: Any) -> None:
+        """
+        Stores a tree item resolved from a location prefix, tree items without runtime id are not cached.
+
+        Args:
+            tree_id (Hashable): Runtime id from tree control.
+            path (Tuple): Compiled location steps, see TreeItemsParser.get_path.
+            treeitem (Object): Resolved tree item.
+        """
+        runtime_id = Converter.try_get_runtime_id(treeitem)
+        if runtime_id is not None:
+            self._entries.put((tree_id, path), treeitem, runtime_id)
+
+    def clear(self) -> None:
+        """
+        Removes all cached tree items.
+        """
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _is_valid(parent: Any, step: Tuple[str, str], runtime_id: Tuple[int, ...]) -> bool:
+        """
+        Returns True if the location step still resolves to the tree item with the given runtime id.
+        """
+        children = TreeItemPathCache._get_children(parent)
+        if children is None:
+            return False
+
+        (prefix, loc) = step
+        if prefix == TreeItemsParser.IndexSeperator:
+            try:
+                return children[int(loc)][0] == runtime_id
+            except (IndexError, ValueError):
+                return False
+
+        if prefix == TreeItemsParser.NameSeperator:
+            return next((child_id for (child_id, name) in children if name == loc), None) == runtime_id
+
+        return False
+
+    @staticmethod
+    def _get_children(parent: Any) -> Optional[List[Tuple[Optional[Tuple[int, ...]], str]]]:
+        """
+        Returns runtime id and name from all tree items below a parent by one cache request or None if they are
+        not available.
+        """
+        try:
+            library = parent.Automation.PropertyLibrary.Element
+            cache_request = CacheRequest()
+            cache_request.TreeScope = TreeScope.Children
+            for property_id in (library.RuntimeId, library.Name, library.ControlType):
+                cache_request.Add(property_id)
+
+            cache = cache_request.Activate()
+            try:
+                cached_parent = parent.FrameworkAutomationElement.GetUpdatedCache()
+                children = []
+                for child in cached_parent.CachedChildren:
+                    if child.ControlType != ControlType.TreeItem:
+                        continue
+                    (_, runtime_id) = child.FrameworkAutomationElement.TryGetPropertyValue(library.RuntimeId)
+                    (_, name) = child.FrameworkAutomationElement.TryGetPropertyValue(library.Name)
+                    children.append((tuple(int(value) for value in runtime_id) if runtime_id is not None else None,
+                                     str(name or "")))
+            finally:
+                cache.Dispose()
+        except (CSharpException, AttributeError, TypeError):
+            return None
+
+        return children
@@ -1,8 +1,10 @@
-from typing import Any
+from typing import Any, Optional
 from System import InvalidOperationException  # pylint: disable=import-error
 from FlaUI.Core.Definitions import ExpandCollapseState  # pylint: disable=import-error
 from FlaUILibrary.flaui.exception.flauierror import FlaUiError
 from FlaUILibrary.flaui.enum.treeitemaction import TreeItemAction
+from FlaUILibrary.flaui.util.converter import Converter
+from FlaUILibrary.flaui.util.treeitempathcache import TreeItemPathCache
 from FlaUILibrary.flaui.util.treeitemsparser import TreeItemsParser
 
 
@@ -90,26 +92,42 @@ class TreeItems:
             raise FlaUiError(FlaUiError.ElementNameNotFound.format(name))
 
     @staticmethod
-    def execute_by_location(nodes: Any, location: str, seperator: str, action: TreeItemAction):
+    def execute_by_location(control: Any,
+                            location: str,
+                            seperator: str,
+                            action: TreeItemAction,
+                            path_cache: Optional[TreeItemPathCache] = None):
         """
         Executes the given TreeItemAction to the last element from a tree location.
 
+        Tree items resolved from each location prefix are stored in the path cache if given, so following calls
+        with the same prefix do not read the name from each tree item again. Cached tree items are only used if the
+        location step still resolves to them below their parent. Ancestors are only expanded if they are collapsed.
+
         Args:
-            nodes (Object): TreeItems[] from current node
+            control (Object): Tree control
             location (String): Location string to execute operations on nodes.
             seperator (String): Seperator to split up tree items
             action (TreeItemAction) : Action to operate on node.
+            path_cache (TreeItemPathCache): Optional cache from resolved tree items by location prefix.
 
         Raises:
             FlaUiError: If action is not supported.
             FlaUiError: If location syntax is wrong.
             FlaUiError: If node is not expandable.
         """
-        parser = TreeItemsParser(location, seperator)
-        current_nodes = nodes
+        parser = TreeItemsParser.create(location, seperator)
+        tree_id = Converter.try_get_runtime_id(control) if path_cache is not None else None
+        parent = None
 
         for index in range(len(parser.location)):
-            node = parser.get_treeitem(current_nodes, index)
+            owner = control if parent is None else parent
+            node = path_cache.get(tree_id, parser.get_path(index), owner) if tree_id is not None else None
+            if node is None:
+                node = parser.get_treeitem(owner.Items, index)
+                if tree_id is not None:
+                    path_cache.put(tree_id, parser.get_path(index), node)
+
             if parser.is_last_element(index):
                 try:
                     if action == TreeItemAction.EXPAND:
@@ -127,10 +145,25 @@ class TreeItems:
                     raise FlaUiError(FlaUiError.FalseSyntax.format(
                         "self.current_treeitem." + action.value + "()")) from None
             else:
-                if node.ExpandCollapseState == ExpandCollapseState.LeafNode:
-                    raise FlaUiError(FlaUiError.ElementNotExpandable.format(node.Name))
-                node.Expand()
-                current_nodes = node.Items
+                TreeItems._expand_ancestor(node)
+                parent = node
+
+    @staticmethod
+    def _expand_ancestor(node: Any):
+        """
+        Expands a tree item from a location path if it is collapsed.
+
+        Args:
+            node (Object): Tree item from location path which is not the last element.
+
+        Raises:
+            FlaUiError: If node is not expandable.
+        """
+        state = node.ExpandCollapseState
+        if state == ExpandCollapseState.LeafNode:
+            raise FlaUiError(FlaUiError.ElementNotExpandable.format(node.Name))
+        if state not in (ExpandCollapseState.Expanded, ExpandCollapseState.PartiallyExpanded):
+            node.Expand()
 
     @staticmethod
     def _find_visible_node_by_name(nodes: Any, name: str):
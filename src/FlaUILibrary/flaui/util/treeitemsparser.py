@@ -1,4 +1,5 @@
-from typing import Any
+from functools import lru_cache
+from typing import Any, Tuple
 from FlaUILibrary.flaui.exception.flauierror import FlaUiError
 
 
@@ -17,6 +18,16 @@ class TreeItemsParser:
 
     def __init__(self, location, seperator):
         self.location = location.split(seperator)
+        self.steps = tuple(TreeItemsParser._compile_step(loc) for loc in self.location)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def create(location: str, seperator: str) -> "TreeItemsParser":
+        """
+        Returns a parser for a location, parsers are reused for the same location and seperator,
+        so each location string is split and compiled only once.
+        """
+        return TreeItemsParser(location, seperator)
 
     def get_treeitem(self, treeitems: Any, index: Any):
         """
@@ -24,17 +35,15 @@ class TreeItemsParser:
         and returns the corresponding tree item to that name or index.
         if the given name or index is not found a flauierror will be thrown.
         """
-        loc = self.location[index]
+        (prefix, loc) = self.steps[index]
 
-        if loc.startswith(self.IndexSeperator):
-            loc = loc[2:]
+        if prefix == self.IndexSeperator:
             try:
                 return treeitems[int(loc)]
             except IndexError:
                 raise FlaUiError(FlaUiError.ArrayOutOfBoundException.format(int(loc))) from None
 
-        elif loc.startswith(self.NameSeperator):
-            loc = loc[2:]
+        elif prefix == self.NameSeperator:
             for item in treeitems:
                 if item.Name == loc:
                     return item
@@ -42,6 +51,12 @@ class TreeItemsParser:
         else:
             raise FlaUiError(FlaUiError.FalseSyntax.format(loc)) from None
 
+    def get_path(self, index: int) -> Tuple[Tuple[str, str], ...]:
+        """
+        Returns compiled steps from first location until index, independent from the seperator.
+        """
+        return self.steps[:index + 1]
+
     def is_last_element(self, index: Any):
         """
         Returns true if the index corresponds the last element of given location series.
@@ -49,3 +64,13 @@ class TreeItemsParser:
         if index == len(self.location) - 1:
             return True
         return False
+
+    @classmethod
+    def _compile_step(cls, loc: str) -> Tuple[str, str]:
+        """
+        Splits a location into its prefix and name or index, prefix is empty by a false syntax.
+        """
+        for prefix in (cls.IndexSeperator, cls.NameSeperator):
+            if loc.startswith(prefix):
+                return prefix, loc[len(prefix):]
+        return "", loc
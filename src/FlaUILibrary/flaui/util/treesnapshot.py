@@ -0,0 +1,258 @@
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from System import Action, Array, Int32, Object  # pylint: disable=import-error
+from System import Exception as CSharpException  # pylint: disable=import-error
+from FlaUI.Core import CacheRequest  # pylint: disable=import-error
+from FlaUI.Core.AutomationElements import AutomationElement  # pylint: disable=import-error
+from FlaUI.Core.AutomationElements import AutomationElementExtensions  # pylint: disable=import-error
+from FlaUI.Core.Definitions import ControlType, ExpandCollapseState  # pylint: disable=import-error
+from FlaUI.Core.Definitions import StructureChangeType, TreeScope  # pylint: disable=import-error
+from FlaUI.Core.Identifiers import PropertyId  # pylint: disable=import-error
+from FlaUILibrary.flaui.util.converter import Converter
+
+
+class TreeNode:
+    """
+    Tree item from a tree snapshot with name, expand state and children captured by a cache request.
+    """
+
+    def __init__(self, element: Any, name: str, state: Any, runtime_id: Optional[Tuple[int, ...]]):
+        """
+        Creates a tree node.
+
+        Args:
+            element (Object): Cached automation element from tree item, used to perform actions.
+            name (str): Name from tree item.
+            state (ExpandCollapseState): Expand state from tree item.
+            runtime_id (Tuple): Runtime id from tree item or None if it is not available.
+        """
+        self.element = element
+        self.name = name
+        self.state = state
+        self.runtime_id = runtime_id
+        self.children: List["TreeNode"] = []
+
+    @property
+    def is_expanded(self) -> bool:
+        """
+        True if children from node are visible.
+        """
+        return self.state in (ExpandCollapseState.Expanded, ExpandCollapseState.PartiallyExpanded)
+
+    def select(self) -> None:
+        """
+        Selects the tree item from live element.
+        """
+        AutomationElementExtensions.AsTreeItem(self.element).Select()
+
+
+class TreeSnapshot:
+    """
+    Snapshot from all tree items below a tree control.
+
+    Names, expand states and children from all realized tree items are captured by one cache request for the
+    whole subtree. Expand state, name and structure changes are observed by UI Automation events. Refresh
+    captures only the subtrees from changed tree items again, changes below the tree control itself or from
+    unknown elements capture the whole tree. If events could not be registered, each refresh captures the
+    whole tree.
+    """
+
+    def __init__(self, control: Any):
+        """
+        Captures a snapshot from a tree control.
+
+        Args:
+            control (Object): Tree control.
+
+        Raises:
+            CSharpException: If the tree could not be captured.
+        """
+        self._control = control
+        self._library = control.Automation.PropertyLibrary
+        self._cache_request = self._create_cache_request()
+        self._lock = threading.Lock()
+        self._changed_elements = []
+        self._invalid = False
+        self._handlers = []
+        self._nodes_by_id: Dict[Tuple[int, ...], TreeNode] = {}
+        self.nodes = self._capture_children(control)
+        self._observed = self._register()
+
+    def refresh(self) -> None:
+        """
+        Captures subtrees from tree items changed since the last refresh again.
+        """
+        with self._lock:
+            changed_elements = self._changed_elements
+            invalid = self._invalid or not self._observed
+            self._changed_elements = []
+            self._invalid = False
+
+        if not invalid:
+            nodes = [self._find_node(element) for element in changed_elements]
+            if all(node is not None for node in nodes):
+                refreshed = []
+                for node in nodes:
+                    # Nodes below a refreshed node are already captured again
+                    if self._nodes_by_id.get(node.runtime_id) is node and node not in refreshed:
+                        self._refresh_node(node)
+                        refreshed.append(node)
+                return
+
+        self._nodes_by_id = {}
+        self.nodes = self._capture_children(self._control)
+
+    def invalidate(self) -> None:
+        """
+        Marks the whole snapshot as outdated, e.g. after tree items were expanded or collapsed by the library.
+        """
+        with self._lock:
+            self._invalid = True
+
+    def dispose(self) -> None:
+        """
+        Removes all registered event handlers.
+        """
+        for handler in self._handlers:
+            try:
+                handler.Dispose()
+            except CSharpException:
+                pass
+
+        self._handlers = []
+        self._observed = False
+
+    def visible_nodes(self) -> Iterator[TreeNode]:
+        """
+        Yields all visible nodes in tree order, children from collapsed nodes are skipped.
+        """
+        stack = list(reversed(self.nodes))
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.is_expanded:
+                stack.extend(reversed(node.children))
+
+    def _capture_children(self, element: Any) -> List[TreeNode]:
+        """
+        Captures all tree items below an element by one cache request for its subtree.
+        """
+        cache = self._cache_request.Activate()
+        try:
+            cached_element = element.FrameworkAutomationElement.GetUpdatedCache()
+            return self._create_children(cached_element)
+        finally:
+            cache.Dispose()
+
+    def _create_children(self, cached_element: Any) -> List[TreeNode]:
+        """
+        Creates nodes from cached tree item children, must be called while the cache request is active.
+        """
+        nodes = []
+        for child in cached_element.CachedChildren:
+            if child.ControlType != ControlType.TreeItem:
+                continue
+
+            node = TreeNode(child,
+                            str(self._cached_property(child, self._library.Element.Name) or ""),
+                            self._cached_property(child, self._library.ExpandCollapse.ExpandCollapseState),
+                            self._cached_runtime_id(child))
+            node.children = self._create_children(child)
+            if node.runtime_id is not None:
+                self._nodes_by_id[node.runtime_id] = node
+            nodes.append(node)
+
+        return nodes
+
+    def _refresh_node(self, node: TreeNode) -> None:
+        """
+        Captures name, expand state and children from a node again.
+        """
+        self._remove_descendants(node)
+
+        cache = self._cache_request.Activate()
+        try:
+            cached_element = node.element.FrameworkAutomationElement.GetUpdatedCache()
+            node.element = cached_element
+            node.name = str(self._cached_property(cached_element, self._library.Element.Name) or "")
+            node.state = self._cached_property(cached_element, self._library.ExpandCollapse.ExpandCollapseState)
+            node.children = self._create_children(cached_element)
+        finally:
+            cache.Dispose()
+
+    def _remove_descendants(self, node: TreeNode) -> None:
+        """
+        Removes all descendants from a node from the runtime id lookup.
+        """
+        for child in node.children:
+            self._nodes_by_id.pop(child.runtime_id, None)
+            self._remove_descendants(child)
+
+    def _find_node(self, element: Any) -> Optional[TreeNode]:
+        """
+        Returns the node from a changed element or None if the element is not part of the snapshot.
+        """
+        runtime_id = Converter.try_get_runtime_id(element)
+        return self._nodes_by_id.get(runtime_id) if runtime_id is not None else None
+
+    def _cached_runtime_id(self, element: Any) -> Optional[Tuple[int, ...]]:
+        """
+        Returns the cached runtime id from an element or None if it is not available.
+        """
+        value = self._cached_property(element, self._library.Element.RuntimeId)
+        return tuple(int(item) for item in value) if value is not None else None
+
+    @staticmethod
+    def _cached_property(element: Any, property_id: Any) -> Any:
+        """
+        Returns a property value from cache or None if it is not supported.
+        """
+        (is_supported, value) = element.FrameworkAutomationElement.TryGetPropertyValue(property_id)
+        return value if is_supported else None
+
+    def _create_cache_request(self) -> Any:
+        """
+        Creates a cache request for name, expand state, control type and runtime id from a whole subtree.
+        """
+        cache_request = CacheRequest()
+        cache_request.TreeScope = TreeScope.Subtree
+        for property_id in (self._library.Element.Name, self._library.Element.ControlType,
+                            self._library.Element.RuntimeId, self._library.ExpandCollapse.ExpandCollapseState):
+            cache_request.Add(property_id)
+
+        return cache_request
+
+    def _register(self) -> bool:
+        """
+        Registers structure and property changed event handlers below the tree control.
+
+        Returns:
+            True if all event handlers are registered, otherwise the snapshot is captured again by each refresh.
+        """
+        try:
+            self._handlers.append(self._control.RegisterStructureChangedEvent(
+                TreeScope.Subtree,
+                Action[AutomationElement, StructureChangeType, Array[Int32]](self._on_structure_changed)))
+            self._handlers.append(self._control.RegisterPropertyChangedEvent(
+                TreeScope.Subtree,
+                Action[AutomationElement, PropertyId, Object](self._on_property_changed),
+                Array[PropertyId]([self._library.ExpandCollapse.ExpandCollapseState, self._library.Element.Name])))
+        except (CSharpException, TypeError):
+            self.dispose()
+            return False
+
+        return True
+
+    def _on_structure_changed(self, element: Any, _change_type: Any, _runtime_id: Any) -> None:
+        """
+        Structure changed event callback from UI Automation thread.
+        """
+        with self._lock:
+            self._changed_elements.append(element)
+
+    def _on_property_changed(self, element: Any, _property_id: Any, _value: Any) -> None:
+        """
+        Property changed event callback from UI Automation thread.
+        """
+        with self._lock:
+            self._changed_elements.append(element)
@@ -0,0 +1,150 @@
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from FlaUILibrary.flaui.util.locatorcache import LocatorCache
+
+
+class XPathAnalysis:
+    """
+    Result from a static XPath analysis.
+    """
+    xpath: str
+    steps: Optional[List[Tuple[str, str]]]
+    is_unbounded: bool
+    is_anchorable: bool
+
+    def __init__(self, xpath: str, steps: Optional[List[Tuple[str, str]]]):
+        """
+        Creates an analysis result.
+
+        Args:
+            xpath (str): Analyzed XPath.
+            steps (List | None): Location steps from LocatorCache.split_steps or None if not supported.
+        """
+        self.xpath = xpath
+        self.steps = steps
+        self.is_unbounded = bool(steps) and steps[0][0] == LocatorCache.DESCENDANT_SEPARATOR
+        self.is_anchorable = self.is_unbounded and XPathAnalyzer.get_step_name(steps[0][1]) not in \
+            XPathAnalyzer.TOP_LEVEL_STEPS
+
+
+class XPathAnalyzer:
+    """
+    Static XPath analysis without UI Automation.
+
+    Flags locators starting with an unbounded descendant step like //Button[@Name='OK'] which force a walk
+    through the whole desktop tree and rewrites them to a window anchored form like
+    /Window[@Name='App']//Button[@Name='OK']. Analysis results and rewritten locators are cached.
+    """
+
+    # Steps which usually address top level windows and would not be found below another window
+    TOP_LEVEL_STEPS = ("Window",)
+
+    def __init__(self, max_size: int = 256):
+        """
+        Creates an XPath analyzer.
+
+        Args:
+            max_size (int): Maximum amount of cached analysis results and rewritten locators.
+        """
+        self._analyze_cached = lru_cache(maxsize=max_size)(XPathAnalyzer._analyze)
+        self._anchor_cached = lru_cache(maxsize=max_size)(XPathAnalyzer._anchor)
+
+    def analyze(self, xpath: str) -> XPathAnalysis:
+        """
+        Analyzes an XPath.
+
+        Args:
+            xpath (str): XPath to analyze.
+        """
+        return self._analyze_cached(xpath)
+
+    def anchor(self, xpath: str, automation_id: Optional[str], name: Optional[str]) -> Optional[str]:
+        """
+        Rewrites an unbounded descendant XPath to a search below a window.
+
+        Args:
+            xpath (str): XPath to rewrite like //Button[@Name='OK'].
+            automation_id (str | None): AutomationId from anchor window, preferred if not empty.
+            name (str | None): Name from anchor window.
+
+        Returns:
+            str | None: Anchored XPath like /Window[@Name='App']//Button[@Name='OK'] or None if the XPath
+            is not anchorable or the window can not be addressed by a predicate.
+        """
+        if not self.analyze(xpath).is_anchorable:
+            return None
+
+        window_step = self.create_window_step(automation_id, name)
+        if window_step is None:
+            return None
+
+        return self._anchor_cached(window_step, xpath)
+
+    @staticmethod
+    def create_window_step(automation_id: Optional[str], name: Optional[str]) -> Optional[str]:
+        """
+        Creates a window location step by AutomationId or Name.
+
+        Args:
+            automation_id (str | None): AutomationId from window, preferred if not empty.
+            name (str | None): Name from window.
+
+        Returns:
+            str | None: Step like Window[@AutomationId='Main'] or None if no value can be quoted.
+        """
+        for (attribute, value) in (("AutomationId", automation_id), ("Name", name)):
+            literal = XPathAnalyzer.quote(value) if value else None
+            if literal is not None:
+                return f"Window[@{attribute}={literal}]"
+
+        return None
+
+    @staticmethod
+    def quote(value: str) -> Optional[str]:
+        """
+        Quotes a value as XPath string literal.
+
+        Args:
+            value (str): Value to quote.
+
+        Returns:
+            str | None: Quoted value or None if the value contains single and double quotes.
+        """
+        if "'" not in value:
+            return f"'{value}'"
+
+        if '"' not in value:
+            return f'"{value}"'
+
+        return None
+
+    @staticmethod
+    def get_step_name(step: str) -> str:
+        """
+        Returns the element name from a location step without predicates.
+
+        Args:
+            step (str): Location step like Button[@Name='OK'].
+        """
+        return step.split("[", 1)[0]
+
+    @staticmethod
+    def _analyze(xpath: str) -> XPathAnalysis:
+        """
+        Analyzes an XPath without cache.
+
+        Args:
+            xpath (str): XPath to analyze.
+        """
+        return XPathAnalysis(xpath, LocatorCache.split_steps(xpath))
+
+    @staticmethod
+    def _anchor(window_step: str, xpath: str) -> str:
+        """
+        Prepends a window location step to an unbounded descendant XPath without cache.
+
+        Args:
+            window_step (str): Window location step, see create_window_step.
+            xpath (str): XPath to rewrite like //Button[@Name='OK'].
+        """
+        return LocatorCache.CHILD_SEPARATOR + window_step + xpath
@@ -0,0 +1,95 @@
+from typing import Any, Dict, Optional, Tuple
+from FlaUILibrary.flaui.util.converter import Converter
+
+
+class XPathBuilder:
+    """
+    Builds XPaths to automation elements in the same format as FlaUI Debug.GetXPathToElement.
+
+    XPaths from parents and sibling indexes are memorized, so elements sharing the same ancestors
+    only walk the ancestor chain and read the children from each parent once.
+    Should be used with an active cache request which contains ControlType and RuntimeId properties.
+    """
+
+    def __init__(self, tree_walker: Any):
+        """
+        Creates a XPath builder.
+
+        Args:
+            tree_walker (Object): Control view tree walker from automation object.
+        """
+        self._tree_walker = tree_walker
+        self._xpaths = {}
+        self._sibling_indexes = {}
+
+    def get_xpath(self, element: Any) -> Optional[str]:
+        """
+        Return the XPath from desktop to the element.
+
+        Args:
+            element (Object): Automation element.
+
+        Returns:
+            str | None: XPath like /Window/Tab/TabItem[2]/Button or None if the XPath could not be built.
+        """
+        runtime_id = Converter.try_get_runtime_id(element)
+        if runtime_id is None:
+            return None
+
+        if runtime_id in self._xpaths:
+            return self._xpaths[runtime_id]
+
+        parent = self._tree_walker.GetParent(element)
+        if parent is None:
+            xpath = ""
+        else:
+            parent_xpath = self.get_xpath(parent)
+            if parent_xpath is None:
+                return None
+
+            sibling_index = self._get_sibling_index(parent, runtime_id)
+            if sibling_index is None:
+                return None
+
+            (control_type, index, count) = sibling_index
+            xpath = f"{parent_xpath}/{control_type}" + (f"[{index}]" if count > 1 else "")
+
+        self._xpaths[runtime_id] = xpath
+        return xpath
+
+    def _get_sibling_index(self, parent: Any, runtime_id: Tuple[int, ...]) -> Optional[Tuple[str, int, int]]:
+        """
+        Return control type, one based index and amount from children with the same control type.
+
+        Args:
+            parent (Object): Parent element.
+            runtime_id (Tuple): Runtime id from child element.
+
+        Returns:
+            Tuple | None: None if the child is unknown, e.g. it was added after the children were read.
+        """
+        parent_id = Converter.try_get_runtime_id(parent)
+        indexes = self._sibling_indexes.get(parent_id)
+
+        if indexes is None:
+            indexes = self._read_sibling_indexes(parent)
+            self._sibling_indexes[parent_id] = indexes
+
+        return indexes.get(runtime_id)
+
+    def _read_sibling_indexes(self, parent: Any) -> Dict[Tuple[int, ...], Tuple[str, int, int]]:
+        """
+        Read all children from parent and index them by control type.
+
+        Args:
+            parent (Object): Parent element.
+        """
+        children = []
+        counts = {}
+        for child in parent.FindAllChildren():
+            control_type = child.ControlType.ToString()
+            counts[control_type] = counts.get(control_type, 0) + 1
+            children.append((Converter.try_get_runtime_id(child), control_type, counts[control_type]))
+
+        return {runtime_id: (control_type, index, counts[control_type])
+                for runtime_id, control_type, index in children if runtime_id is not None}
@@ -0,0 +1,163 @@
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from FlaUILibrary.flaui.util.locatorcache import LocatorCache
+
+
+class ConditionStep:
+    """
+    Location step which can be searched by native UI Automation property conditions.
+    """
+    is_descendant: bool
+    control_type: Optional[str]
+    properties: Tuple[Tuple[str, str], ...]
+
+    def __init__(self, is_descendant: bool, control_type: Optional[str], properties: Tuple[Tuple[str, str], ...]):
+        """
+        Creates a condition step.
+
+        Args:
+            is_descendant (bool): True to search all descendants, False to search only children.
+            control_type (str | None): Name from ControlType enumeration like Button or None to match any element.
+            properties (Tuple): Pairs from property name like AutomationId and expected value.
+        """
+        self.is_descendant = is_descendant
+        self.control_type = control_type
+        self.properties = properties
+
+
+class XPathTranslator:
+    """
+    Translates simple XPaths to location steps for native UI Automation FindFirst searches.
+
+    Supported are child and descendant steps with a control type or * and predicates which compare
+    AutomationId, Name, ClassName or HelpText with a string literal, combined by 'and' or multiple brackets,
+    e.g. /Window[@Name='App']//Button[@AutomationId='Ok' and @ClassName='Button'].
+    Positions, functions, 'or' and other axes are not supported and return None, so the caller can fall back
+    to the generic XPath lookup. Translations are cached.
+    """
+
+    PROPERTIES = ("AutomationId", "Name", "ClassName", "HelpText")
+
+    _STEP_NAME = re.compile(r"^(\*|[A-Za-z]+)$")
+    _COMPARISON = re.compile(r"""^\s*@(?P<name>[A-Za-z]+)\s*=\s*(?:'(?P<single>[^']*)'|"(?P<double>[^"]*)")\s*$""")
+
+    def __init__(self, max_size: int = 256):
+        """
+        Creates an XPath translator.
+
+        Args:
+            max_size (int): Maximum amount of cached translations.
+        """
+        self._translate_cached = lru_cache(maxsize=max_size)(self._translate)
+
+    def translate(self, xpath: str) -> Optional[List[ConditionStep]]:
+        """
+        Translates an XPath to condition steps.
+
+        Args:
+            xpath (str): XPath like /Window[@Name='App']//Button[@AutomationId='Ok'].
+
+        Returns:
+            List | None: Condition steps or None if the XPath can not be translated.
+        """
+        steps = self._translate_cached(xpath)
+        return list(steps) if steps else None
+
+    @classmethod
+    def _translate(cls, xpath: str) -> Optional[Tuple[ConditionStep, ...]]:
+        """
+        Translates an XPath to condition steps without cache.
+
+        Args:
+            xpath (str): XPath to translate.
+        """
+        steps = LocatorCache.split_steps(xpath)
+        if not steps:
+            return None
+
+        condition_steps = []
+        for (separator, step) in steps:
+            condition_step = cls._translate_step(separator == LocatorCache.DESCENDANT_SEPARATOR, step)
+            if condition_step is None:
+                return None
+            condition_steps.append(condition_step)
+
+        return tuple(condition_steps)
+
+    @classmethod
+    def _translate_step(cls, is_descendant: bool, step: str) -> Optional[ConditionStep]:
+        """
+        Translates a location step like Button[@Name='OK'] to a condition step.
+
+        Args:
+            is_descendant (bool): True if step is a descendant step.
+            step (str): Location step.
+        """
+        (name, predicates) = (step.split("[", 1) + [""])[:2]
+        if not cls._STEP_NAME.match(name):
+            return None
+
+        properties = []
+        for predicate in cls._split_predicates("[" + predicates if predicates else ""):
+            for term in cls._split_outside_quotes(predicate, " and "):
+                match = cls._COMPARISON.match(term)
+                if match is None or match.group("name") not in cls.PROPERTIES:
+                    return None
+
+                value = match.group("single") if match.group("single") is not None else match.group("double")
+                properties.append((match.group("name"), value))
+
+        return ConditionStep(is_descendant, None if name == "*" else name, tuple(properties))
+
+    @classmethod
+    def _split_predicates(cls, predicates: str) -> List[str]:
+        """
+        Splits bracket predicates like [@Name='A'][@ClassName='B'] into their content.
+
+        Args:
+            predicates (str): Predicates from a location step.
+
+        Returns:
+            List of predicate contents, an empty string is returned for invalid syntax to reject translation.
+        """
+        values = []
+        for part in cls._split_outside_quotes(predicates, "]"):
+            if not part:
+                continue
+            if not part.startswith("["):
+                return [""]
+            values.append(part[1:])
+
+        return values
+
+    @staticmethod
+    def _split_outside_quotes(value: str, separator: str) -> List[str]:
+        """
+        Splits a value by separator if the separator is not inside a quoted string literal.
+
+        Args:
+            value (str): Value to split.
+            separator (str): Separator.
+        """
+        parts = []
+        quote = None
+        start = 0
+        index = 0
+
+        while index < len(value):
+            char = value[index]
+            if quote:
+                if char == quote:
+                    quote = None
+            elif char in ("'", '"'):
+                quote = char
+            elif value.startswith(separator, index):
+                parts.append(value[start:index])
+                index += len(separator)
+                start = index
+                continue
+            index += 1
+
+        parts.append(value[start:])
+        return parts
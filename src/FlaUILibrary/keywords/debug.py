@@ -1,3 +1,4 @@
+from typing import Any, Dict, List
 from robotlibcore import keyword
 from FlaUILibrary.flaui.module.debug import Debug
 from FlaUILibrary.flaui.util.automationinterfacecontainer import AutomationInterfaceContainer
@@ -60,3 +61,69 @@ class DebugKeywords:
         | Log  <IDENTIFIER> |
         """
         return self._container.get_identifier()
+
+    @keyword
+    def get_flaui_performance_statistics(self, reset: bool = False) -> Dict[str, Any]:
+        """
+        Gets timing statistics from all library actions since library import or last reset.
+
+        Times are given in milliseconds and split into following phases:
+        | = Phase = | = Description = |
+        | element_resolution | Time to find elements by XPath |
+        | retries | Time waiting between retries, e.g. until an element exists |
+        | action | Time from the action itself like a click or reading a value |
+        | screenshot | Time to capture failure screenshots |
+
+        Each action contains count, failures, retries, total_ms, mean_ms, max_ms and phases.
+        Time from nested actions, e.g. an element lookup from a click, is counted only by the nested action.
+
+        Arguments:
+        | Argument | Type | Description                                     |
+        | reset    | bool | Removes all statistics after reading if ${True} |
+
+        Examples:
+        | ${STATISTICS}  Get FlaUI Performance Statistics |
+        | Log  ${STATISTICS}[phases][element_resolution] |
+        | ${STATISTICS}  Get FlaUI Performance Statistics  reset=${True} |
+        """
+        module = self._container.create_or_get_module()
+        statistics = module.get_performance_statistics()
+
+        if reset:
+            module.reset_performance_statistics()
+
+        return statistics
+
+    @keyword
+    def reset_flaui_performance_statistics(self):
+        """
+        Removes all timing statistics collected from library actions.
+
+        Examples:
+        | Reset FlaUI Performance Statistics |
+        """
+        self._container.create_or_get_module().reset_performance_statistics()
+
+    @keyword
+    def get_flaui_locator_statistics(self, reset: bool = False) -> List[Dict[str, Any]]:
+        """
+        Gets lookup statistics from each distinct XPath ranked by total lookup time, slowest locators first.
+
+        Each entry contains rank, xpath, count, not_found, retries, total_ms, mean_ms, p95_ms and max_ms.
+        Lookup times include retries until the element was found or the retry timeout was reached.
+
+        Arguments:
+        | Argument | Type | Description                                     |
+        | reset    | bool | Removes all statistics after reading if ${True} |
+
+        Examples:
+        | ${LOCATORS}  Get FlaUI Locator Statistics |
+        | Log  ${LOCATORS}[0][xpath] |
+        """
+        module = self._container.create_or_get_module()
+        statistics = module.get_locator_statistics()
+
+        if reset:
+            module.reset_locator_statistics()
+
+        return statistics
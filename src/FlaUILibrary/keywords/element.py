@@ -394,7 +394,105 @@ class ElementKeywords:
                       msg)
 
     @keyword
-    def wait_until_element_is_offscreen(self, identifier, retries=10, msg=None):
+    def set_search_root(self, identifier, name="default", msg=None):
+        """
+        Registers an element as named search root and activates it.
+
+        All following XPath lookups are evaluated relative to the search root element instead of the desktop.
+        An XPath starting with / selects children and // selects descendants from the search root.
+        The identifier from the search root itself is always evaluated from desktop.
+
+        If the search root element is not available anymore, it will be resolved again by its XPath.
+        Xpath values from `Find One Element` and `Find All Elements` are relative to the active search root.
+
+        XPaths syntax is explained in `XPath locator`.
+
+        Possible FlaUI-Errors:
+        | Element could not be found by xpath |
+
+        Arguments:
+        | Argument   | Type   | Description                                     |
+        | identifier | string | XPath identifier from search root element       |
+        | name       | string | Name from search root. By default, 'default'.   |
+        | msg        | string | Custom error message                            |
+
+        Example:
+        | Set Search Root  /Window[@Name='Main']  |
+        | Click  /Tab/TabItem[@Name='Settings']  |
+        | Set Search Root  /Window[@Name='Dialog']  name=Dialog |
+        | Reset Search Root  |
+        """
+        module = self._container.create_or_get_module()
+        module.action(Element.Action.SET_SEARCH_ROOT,
+                      Element.create_value_container(xpath=identifier, name=name, msg=msg),
+                      msg)
+
+    @keyword
+    def use_search_root(self, name="default", msg=None):
+        """
+        Activates a search root which was registered by `Set Search Root`.
+
+        Possible FlaUI-Errors:
+        | Search root is not registered |
+
+        Arguments:
+        | Argument | Type   | Description                                   |
+        | name     | string | Name from search root. By default, 'default'. |
+        | msg      | string | Custom error message                          |
+
+        Example:
+        | Set Search Root  /Window[@Name='Main']  name=Main |
+        | Set Search Root  /Window[@Name='Dialog']  name=Dialog |
+        | Use Search Root  Main |
+        """
+        module = self._container.create_or_get_module()
+        module.action(Element.Action.USE_SEARCH_ROOT,
+                      Element.create_value_container(name=name, msg=msg),
+                      msg)
+
+    @keyword
+    def reset_search_root(self, msg=None):
+        """
+        Deactivates the active search root. All following XPath lookups are evaluated from desktop again.
+        Registered search roots are kept and can be activated by `Use Search Root`.
+
+        Arguments:
+        | Argument | Type   | Description          |
+        | msg      | string | Custom error message |
+
+        Example:
+        | Reset Search Root  |
+        """
+        module = self._container.create_or_get_module()
+        module.action(Element.Action.RESET_SEARCH_ROOT, None, msg)
+
+    @keyword
+    def set_xpath_optimization(self, enabled: bool = True):
+        """
+        Enables or disables the optimization from XPaths starting with a descendant search like //Button[@Name='OK'].
+
+        Such XPaths walk the whole desktop tree. If enabled, they are searched below the main window from the last
+        attached or launched application first, e.g. /Window[@Name='App']//Button[@Name='OK'].
+        If the element is not found below the main window, the original XPath is searched from desktop.
+        XPaths starting with //Window, XPaths used with a search root and `Find All Elements` are never rewritten.
+
+        Disabled by default, because an element found below the main window is returned even if another window
+        contains a matching element before it.
+
+        Arguments:
+        | Argument | Type | Description                                         |
+        | enabled  | bool | ${True} to enable, ${False} to disable optimization |
+
+        Example:
+        | Set XPath Optimization  |
+        | Click  //Button[@Name='OK'] |
+        | Set XPath Optimization  ${False} |
+        """
+        module = self._container.create_or_get_module()
+        module.action(Element.Action.SET_XPATH_OPTIMIZATION, Element.create_value_container(enabled=enabled))
+
+    @keyword
+    def wait_until_element_is_offscreen(self, identifier, retries=10, msg=None, timeout_in_ms=None):
         """
         Waits until element is offscreen or timeout was reached. If timeout was reached an FlaUIError occurred.
 
@@ -403,22 +501,25 @@ class ElementKeywords:
         | Element <XPATH> is visible          |
 
         Arguments:
-        | Argument   | Type   | Description                                                           |
-        | identifier | string | XPath identifier from element                                         |
-        | retries    | number | Maximum amount of retries per seconds to wait. By default, 10 retries. |
-        | msg        | string | Custom error message                                                  |
+        | Argument      | Type   | Description                                                            |
+        | identifier    | string | XPath identifier from element                                          |
+        | retries       | number | Maximum amount of retries per seconds to wait. By default, 10 retries. |
+        | msg           | string | Custom error message                                                   |
+        | timeout_in_ms | number | Timeout in milliseconds to wait, replaces retries if set.              |
 
         Example:
         | Wait Until Element Is Offscreen  <XPATH>  <RETRIES=10> |
         | Wait Until Element Is Offscreen  <XPATH>  <RETRIES=10>  <MSG> |
+        | Wait Until Element Is Offscreen  <XPATH>  timeout_in_ms=2500 |
         """
         module = self._container.create_or_get_module()
         module.action(Element.Action.WAIT_UNTIL_ELEMENT_IS_OFFSCREEN,
-                      Element.create_value_container(xpath=identifier, retries=retries),
+                      Element.create_value_container(xpath=identifier, retries=retries,
+                                                     timeout_in_milliseconds=timeout_in_ms, msg=msg),
                       msg)
 
     @keyword
-    def wait_until_element_exist(self, identifier, retries=10, msg=None):
+    def wait_until_element_exist(self, identifier, retries=10, msg=None, timeout_in_ms=None):
         """
         Waits until element exist or timeout was reached. If timeout was reached an FlaUIError occurred.
 
@@ -428,22 +529,25 @@ class ElementKeywords:
         | Element <XPATH> is not enabled      |
 
         Arguments:
-        | Argument   | Type   | Description                                                            |
-        | identifier | string | XPath identifier from element                                          |
-        | retries    | number | Maximum amount of retries per seconds to wait. By default, 10 retries. |
-        | msg        | string | Custom error message                                                   |
+        | Argument      | Type   | Description                                                            |
+        | identifier    | string | XPath identifier from element                                          |
+        | retries       | number | Maximum amount of retries per seconds to wait. By default, 10 retries. |
+        | msg           | string | Custom error message                                                   |
+        | timeout_in_ms | number | Timeout in milliseconds to wait, replaces retries if set.              |
 
         Example:
         | Wait Until Element Exist  <XPATH>  <RETRIES=10> |
         | Wait Until Element Exist  <XPATH>  <RETRIES=10>  <MSG> |
+        | Wait Until Element Exist  <XPATH>  timeout_in_ms=2500 |
         """
         module = self._container.create_or_get_module()
         module.action(Element.Action.WAIT_UNTIL_ELEMENT_EXIST,
-                      Element.create_value_container(xpath=identifier, retries=retries),
+                      Element.create_value_container(xpath=identifier, retries=retries,
+                                                     timeout_in_milliseconds=timeout_in_ms, msg=msg),
                       msg)
 
     @keyword
-    def wait_until_element_does_not_exist(self, identifier, retries=10, msg=None):
+    def wait_until_element_does_not_exist(self, identifier, retries=10, msg=None, timeout_in_ms=None):
         """
         Waits until element does not exist or timeout was reached. If timeout was reached an FlaUIError occurred.
 
@@ -453,22 +557,25 @@ class ElementKeywords:
         | Element <XPATH> is not enabled      |
 
         Arguments:
-        | Argument   | Type   | Description                                                            |
-        | identifier | string | XPath identifier from element                                          |
-        | retries    | number | Maximum amount of retries per seconds to wait. By default, 10 retries. |
-        | msg        | string | Custom error message                                                   |
+        | Argument      | Type   | Description                                                            |
+        | identifier    | string | XPath identifier from element                                          |
+        | retries       | number | Maximum amount of retries per seconds to wait. By default, 10 retries. |
+        | msg           | string | Custom error message                                                   |
+        | timeout_in_ms | number | Timeout in milliseconds to wait, replaces retries if set.              |
 
         Example:
         | Wait Until Element Does Not Exist  <XPATH>  <RETRIES=10> |
         | Wait Until Element Does Not Exist  <XPATH>  <RETRIES=10>  <MSG> |
+        | Wait Until Element Does Not Exist  <XPATH>  timeout_in_ms=2500 |
         """
         module = self._container.create_or_get_module()
         module.action(Element.Action.WAIT_UNTIL_ELEMENT_DOES_NOT_EXIST,
-                      Element.create_value_container(xpath=identifier, retries=retries),
+                      Element.create_value_container(xpath=identifier, retries=retries,
+                                                     timeout_in_milliseconds=timeout_in_ms, msg=msg),
                       msg)
 
     @keyword
-    def wait_until_element_is_enabled(self, identifier, retries=10, msg=None):
+    def wait_until_element_is_enabled(self, identifier, retries=10, msg=None, timeout_in_ms=None):
         """
         Waits until element is enabled or timeout was reached. If timeout was reached an FlaUIError occurred.
 
@@ -478,18 +585,21 @@ class ElementKeywords:
         | Element <XPATH> is not enabled      |
 
         Arguments:
-        | Argument   | Type   | Description                                                           |
-        | identifier | string | XPath identifier from element                                         |
-        | retries    | number | Maximum amount of retries per seconds to wait. By default, 10 retries. |
-        | msg        | string | Custom error message                                                  |
+        | Argument      | Type   | Description                                                            |
+        | identifier    | string | XPath identifier from element                                          |
+        | retries       | number | Maximum amount of retries per seconds to wait. By default, 10 retries. |
+        | msg           | string | Custom error message                                                   |
+        | timeout_in_ms | number | Timeout in milliseconds to wait, replaces retries if set.              |
 
         Example:
         | Wait Until Element Is Enabled  <XPATH>  <RETRIES=10> |
         | Wait Until Element Is Enabled  <XPATH>  <RETRIES=10>  <MSG> |
+        | Wait Until Element Is Enabled  <XPATH>  timeout_in_ms=2500 |
         """
         module = self._container.create_or_get_module()
         module.action(Element.Action.WAIT_UNTIL_ELEMENT_IS_ENABLED,
-                      Element.create_value_container(xpath=identifier, retries=retries),
+                      Element.create_value_container(xpath=identifier, retries=retries,
+                                                     timeout_in_milliseconds=timeout_in_ms, msg=msg),
                       msg)
 
     @keyword
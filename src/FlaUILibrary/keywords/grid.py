@@ -18,7 +18,8 @@ class GridKeywords:
         self._container = container
 
     @keyword
-    def get_all_data_from_grid(self, identifier, msg=None):
+    def get_all_data_from_grid(self, identifier, start_row=None, end_row=None, columns=None, virtualized=False,
+                               msg=None):
         """
         Get all data from a grid as an array collection.
 
@@ -30,21 +31,99 @@ class GridKeywords:
           [ "Data_1", "Data_2", "Data_3" ],
         ]
 
+        Rows are read in bulk, so large grids can be verified in seconds. If a virtualized grid reports more rows
+        than are realized, rows which are not realized yet are scrolled into view page by page. Otherwise the grid
+        is not scrolled, set virtualized to ${True} to scroll through grids which do not report their row count.
+        A row range or a subset of columns reduces the amount of read cells. Row range refers to the row index
+        from the grid, starts by index 0 and end row is excluded.
+
         XPaths syntax is explained in `XPath locator`.
 
         If element could not be found by xpath an error message will be thrown.
 
         Arguments:
-        | Argument   | Type   | Description                   |
-        | identifier | string | XPath identifier from element |
-        | msg        | string | Custom error message          |
+        | Argument    | Type   | Description                                            |
+        | identifier  | string | XPath identifier from element                          |
+        | start_row   | int    | Index from first row to read, by default first row     |
+        | end_row     | int    | Index after last row to read, by default all rows      |
+        | columns     | list   | Indices from columns to read, by default all columns   |
+        | virtualized | bool   | ${True} to always realize rows page by page            |
+        | msg         | string | Custom error message                                   |
 
         Examples:
         | ${data}  Get All Data From Grid  <XPath>   |
+        | ${data}  Get All Data From Grid  <XPath>  start_row=100  end_row=200  |
+        | @{columns}  Create List  0  2  |
+        | ${data}  Get All Data From Grid  <XPath>  columns=${columns}  |
+        | ${data}  Get All Data From Grid  <XPath>  virtualized=${True}  |
+        """
+        module = self._container.create_or_get_module()
+        element = module.get_element(identifier=identifier, ui_type=InterfaceType.LISTVIEW, msg=msg)
+        return module.action(Grid.Action.GET_ALL_DATA,
+                             Grid.create_value_container(element=element, start_row=start_row, end_row=end_row,
+                                                         columns=columns, virtualized=virtualized, msg=msg),
+                             msg)
+
+    @keyword
+    def grid_should_contain_row(self, identifier, values, columns=None, msg=None):
+        """
+        Verify that a grid contains a row with the given cell values.
+
+        Rows are read in bulk and reading stops at the first matching row, so large grids can be verified in
+        seconds. By default values are compared with the leading columns from each row. If columns are given
+        each value is compared with the column from the same position.
+
+        XPaths syntax is explained in `XPath locator`.
+
+        If element could not be found by xpath an error message will be thrown.
+
+        Arguments:
+        | Argument   | Type   | Description                                      |
+        | identifier | string | XPath identifier from element                    |
+        | values     | list   | Expected cell values from the row                |
+        | columns    | list   | Indices from columns to compare with the values  |
+        | msg        | string | Custom error message                             |
+
+        Examples:
+        | @{values}  Create List  John  12  |
+        | Grid Should Contain Row  <XPath>  ${values}  |
+        | @{values}  Create List  12  |
+        | @{columns}  Create List  1  |
+        | Grid Should Contain Row  <XPath>  ${values}  columns=${columns}  |
+        """
+        module = self._container.create_or_get_module()
+        element = module.get_element(identifier=identifier, ui_type=InterfaceType.LISTVIEW, msg=msg)
+        module.action(Grid.Action.SHOULD_CONTAIN_ROW,
+                      Grid.create_value_container(element=element, values=values, columns=columns, msg=msg),
+                      msg)
+
+    @keyword
+    def get_grid_row_where(self, identifier, column, value, msg=None):
+        """
+        Get cell values from the first grid row whose cell in the given column equals the value.
+
+        Rows are read in bulk page by page and reading stops at the first matching row. Rows from a virtualized
+        grid which are not realized yet are scrolled into view, so the whole grid is searched without reading
+        all rows.
+
+        XPaths syntax is explained in `XPath locator`.
+
+        If element could not be found by xpath an error message will be thrown.
+
+        Arguments:
+        | Argument   | Type   | Description                               |
+        | identifier | string | XPath identifier from element             |
+        | column     | int    | Index from column to compare, starts by 0 |
+        | value      | string | Expected cell value from the column       |
+        | msg        | string | Custom error message                      |
+
+        Examples:
+        | ${row}  Get Grid Row Where  <XPath>  column=2  value=X  |
         """
         module = self._container.create_or_get_module()
         element = module.get_element(identifier=identifier, ui_type=InterfaceType.LISTVIEW, msg=msg)
-        return module.action(Grid.Action.GET_ALL_DATA, Grid.create_value_container(element=element),
+        return module.action(Grid.Action.GET_ROW_WHERE,
+                             Grid.create_value_container(element=element, index=column, name=value, msg=msg),
                              msg)
 
     @keyword
@@ -205,3 +284,27 @@ class GridKeywords:
         return module.action(Grid.Action.GET_COLUMN_COUNT,
                              Grid.create_value_container(element=element, msg=msg),
                              msg)
+
+    @keyword
+    def set_grid_row_index(self, enabled: bool = True):
+        """
+        Enables or disables the index from cell values to grid rows.
+
+        If enabled, `Select Grid Row By Name` and `Grid Should Contain Row` read all rows from a grid once in bulk
+        and remember the row index by each cell value. Following lookups from the same grid read only the indexed
+        row again to verify it. The index is rebuilt if rows were added or removed or if a value is not found.
+
+        Disabled by default, because building the index reads the whole grid, which only pays off if the same grid
+        is searched repeatedly.
+
+        Arguments:
+        | Argument | Type | Description                                |
+        | enabled  | bool | ${True} to enable, ${False} to disable index |
+
+        Example:
+        | Set Grid Row Index  |
+        | Select Grid Row By Name  <XPATH>  0  Doe  |
+        | Set Grid Row Index  ${False} |
+        """
+        module = self._container.create_or_get_module()
+        module.action(Grid.Action.SET_ROW_INDEX, Grid.create_value_container(enabled=enabled))
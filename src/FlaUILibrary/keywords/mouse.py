@@ -408,7 +408,7 @@ class MouseKeywords:
         | focus_element_identifier_before_click | string | XPath identifier from element to be focused before clicking click_element |
         | focus_element_identifier_after_open | string | XPath identifier from element to be focused after openning open_element |
         | max_repeat | int | Maximum number of tries |
-        | timeout_between_repeats | int | wait time in milliseconds in between every try |
+        | timeout_between_repeats | int | maximum wait time in milliseconds for the expected element after every try |
         | ignore_if_already_open | bool | the keyword will not be executed if excepted element is already open |
         | msg | string | Custom error message |
 
@@ -454,7 +454,7 @@ class MouseKeywords:
         | focus_element_identifier_before_click | string | XPath identifier from element to be focused before double clicking click_element |
         | focus_element_identifier_after_open | string | XPath identifier from element to be focused after openning open_element |
         | max_repeat | int | Maximum number of tries |
-        | timeout_between_repeats | int | wait time in milliseconds in between every try |
+        | timeout_between_repeats | int | maximum wait time in milliseconds for the expected element after every try |
         | ignore_if_already_open | bool | the keyword will not be executed if excepted element is already open |
         | msg | string | Custom error message |
 
@@ -499,7 +499,7 @@ class MouseKeywords:
         | focus_element_identifier_before_click | string | XPath identifier from element to be focused before right clicking click_element |
         | focus_element_identifier_after_open | string | XPath identifier from element to be focused after openning open_element |
         | max_repeat | int | Maximum number of tries |
-        | timeout_between_repeats | int | wait time in milliseconds in between every try |
+        | timeout_between_repeats | int | maximum wait time in milliseconds for the expected element after every try |
         | ignore_if_already_open | bool | the keyword will not be executed if excepted element is already open |
         | msg | string | Custom error message |
 
@@ -544,7 +544,7 @@ class MouseKeywords:
         | focus_element_identifier_before_click | string | XPath identifier from element to be focused before middle clicking click_element |
         | focus_element_identifier_after_open | string | XPath identifier from element to be focused after openning open_element |
         | max_repeat | int | Maximum number of tries |
-        | timeout_between_repeats | int | wait time in milliseconds in between every try |
+        | timeout_between_repeats | int | maximum wait time in milliseconds for the expected element after every try |
         | ignore_if_already_open | bool | the keyword will not be executed if excepted element is already open |
         | msg | string | Custom error message |
 
@@ -591,7 +591,7 @@ class MouseKeywords:
         | focus_element_identifier_before_click | string | XPath identifier from element to be focused before clicking click_element |
         | focus_element_identifier_after_open | string | XPath identifier from element to be focused after openning open_element |
         | max_repeat | int | Maximum number of tries |
-        | timeout_between_repeats | int | wait time in milliseconds in between every try |
+        | timeout_between_repeats | int | maximum wait time in milliseconds for the expected element after every try |
         | ignore_if_already_open | bool | the keyword will not be executed if excepted element is already open |
         | msg | string | Custom error message |
 
@@ -638,7 +638,7 @@ class MouseKeywords:
         | focus_element_identifier_before_click | string | XPath identifier from element to be focused before clicking click_element |
         | focus_element_identifier_after_close | string | XPath identifier from element to be focused after openning close_element |
         | max_repeat | int | Maximum number of tries |
-        | timeout_between_repeats | int | wait time in milliseconds in between every try |
+        | timeout_between_repeats | int | maximum wait time in milliseconds for the expected element after every try |
         | ignore_if_already_open | bool | the keyword will not be executed if excepted element is already closed |
         | msg        | string | Custom error message          |
 
@@ -687,7 +687,7 @@ class MouseKeywords:
         | focus_element_identifier_before_click | string | XPath identifier from element to be focused before double clicking click_element |
         | focus_element_identifier_after_close | string | XPath identifier from element to be focused after openning close_element |
         | max_repeat | int | Maximum number of tries |
-        | timeout_between_repeats | int | wait time in milliseconds in between every try |
+        | timeout_between_repeats | int | maximum wait time in milliseconds for the expected element after every try |
         | ignore_if_already_open | bool | the keyword will not be executed if excepted element is already closed |
         | msg        | string | Custom error message          |
 
@@ -736,7 +736,7 @@ class MouseKeywords:
         | focus_element_identifier_before_click | string | XPath identifier from element to be focused before right clicking click_element |
         | focus_element_identifier_after_close | string | XPath identifier from element to be focused after openning close_element |
         | max_repeat | int | Maximum number of tries |
-        | timeout_between_repeats | int | wait time in milliseconds in between every try |
+        | timeout_between_repeats | int | maximum wait time in milliseconds for the expected element after every try |
         | ignore_if_already_open | bool | the keyword will not be executed if excepted element is already closed |
         | msg        | string | Custom error message          |
 
@@ -785,7 +785,7 @@ class MouseKeywords:
         | focus_element_identifier_before_click | string | XPath identifier from element to be focused before middle clicking click_element |
         | focus_element_identifier_after_close | string | XPath identifier from element to be focused after openning close_element |
         | max_repeat | int | Maximum number of tries |
-        | timeout_between_repeats | int | wait time in milliseconds in between every try |
+        | timeout_between_repeats | int | maximum wait time in milliseconds for the expected element after every try |
         | ignore_if_already_open | bool | the keyword will not be executed if excepted element is already closed |
         | msg        | string | Custom error message          |
 
@@ -836,7 +836,7 @@ class MouseKeywords:
         | focus_element_identifier_before_click | string | XPath identifier from element to be focused before middle clicking click_element |
         | focus_element_identifier_after_close | string | XPath identifier from element to be focused after openning close_element |
         | max_repeat | int | Maximum number of tries |
-        | timeout_between_repeats | int | wait time in milliseconds in between every try |
+        | timeout_between_repeats | int | maximum wait time in milliseconds for the expected element after every try |
         | ignore_if_already_open | bool | the keyword will not be executed if excepted element is already closed |
         | msg        | string | Custom error message          |
 
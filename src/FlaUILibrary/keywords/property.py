@@ -129,6 +129,52 @@ class PropertyKeywords:  # pylint: disable=too-many-public-methods
 
         return property_value
 
+    @keyword
+    def get_element_properties(self, identifier, *property_names, msg=None):
+        """
+        Returns multiple property values from a given element as dictionary.
+
+        The element is resolved once and all properties are fetched in one round trip by an UI Automation
+        cache request. Properties which are not supported by the element are returned as None.
+
+        XPaths syntax is explained in `XPath locator`.
+
+        Supported property names:
+        | Property | Description |
+        | Name, AutomationId, ClassName, HelpText, IsEnabled, IsOffscreen, ... | Element properties from FlaUI property library |
+        | Value, IsReadOnly | Value pattern properties |
+        | ToggleState | Toggle pattern state |
+        | ExpandCollapseState | ExpandCollapse pattern state |
+        | IsSelected | SelectionItem pattern state |
+        | RangeValue, RangeMinimum, RangeMaximum | RangeValue pattern properties |
+        | WindowVisualState, WindowInteractionState, CanMaximize, CanMinimize | Window pattern properties |
+        | <Pattern>.<Property> | Any pattern property from FlaUI property library like Toggle.ToggleState |
+
+        Enumerations are returned as string, rectangles as list [X, Y, Width, Height].
+
+        Possible FlaUI-Errors:
+        | Element could not be found by xpath |
+        | Property is not supported           |
+
+        Arguments:
+        | Argument       | Type   | Description                   |
+        | identifier     | string | XPath identifier from element |
+        | property_names | string | Names from properties to read |
+        | msg            | string | Custom error message          |
+
+        Examples:
+        | ${properties}  Get Element Properties  <XPATH>  Name  IsEnabled  Value  ToggleState |
+        | Should Be True  ${properties}[IsEnabled] |
+
+        """
+        module = self._container.create_or_get_module()
+        element = module.get_element(identifier=identifier, msg=msg)
+        return module.action(Property.Action.PROPERTIES,
+                             Property.create_value_container(element=element,
+                                                             uia=module.identifier(),
+                                                             property_names=list(property_names)),
+                             msg)
+
     @keyword
     def get_background_color(self, identifier, msg=None):
         """
@@ -1,3 +1,4 @@
+from typing import Optional
 from robotlibcore import keyword
 from FlaUILibrary.flaui.module.screenshot import Screenshot
 from FlaUILibrary.flaui.util.automationinterfacecontainer import AutomationInterfaceContainer
@@ -23,10 +24,14 @@ class ScreenshotKeywords:
         ``suffix`` File type and suffix for writing.
         """
         self._container = container
-        self.set_screenshot_directory(directory)
-        self.take_screenshots_on_failure(is_enabled)
-        self.set_screenshot_log_mode(mode)
-        self.set_screenshot_file_suffix(suffix)
+
+        # Settings are performed when the automation module is created, so library import stays fast
+        container.set_module_setting(Screenshot.Action.SET_DIRECTORY,
+                                     Screenshot.create_value_container(directory=directory))
+        container.set_module_setting(Screenshot.Action.SET_ENABLED_TO,
+                                     Screenshot.create_value_container(enabled=is_enabled))
+        container.set_module_setting(Screenshot.Action.SET_MODE, Screenshot.create_value_container(mode=mode))
+        container.set_module_setting(Screenshot.Action.SET_FILE_SUFFIX, Screenshot.create_value_container(suffix=suffix))
 
     @keyword
     def get_screenshot_log_mode(self):
@@ -54,6 +59,66 @@ class ScreenshotKeywords:
         module = self._container.create_or_get_module()
         module.action(Screenshot.Action.SET_MODE, Screenshot.create_value_container(mode=log_mode))
 
+    @keyword
+    def set_screenshot_base64_size_limit(self, max_size_in_kb: Optional[int] = None):
+        """Sets the maximum size from screenshots in log mode 'Base64'. Default is unlimited.
+        Screenshots which exceed the limit as PNG are encoded as JPEG and scaled down until they fit.
+
+        Arguments:
+        | Argument       | Type   | Description                                        |
+        | max_size_in_kb | number | Maximum size in kilobytes, None for unlimited      |
+
+        Example:
+        | Set Screenshot Base64 Size Limit    500 |
+        | Set Screenshot Base64 Size Limit    |
+        """
+        module = self._container.create_or_get_module()
+        module.action(Screenshot.Action.SET_BASE64_SIZE_LIMIT,
+                      Screenshot.create_value_container(max_size_in_kb=max_size_in_kb))
+
+    @keyword
+    def set_screenshot_capture_options(self,
+                                       target: str = "Screen",
+                                       x: Optional[int] = None,
+                                       y: Optional[int] = None,
+                                       width: Optional[int] = None,
+                                       height: Optional[int] = None,
+                                       max_dimension: Optional[int] = None,
+                                       jpeg_quality: int = 75):
+        """Sets what is captured if no element is given and how images are scaled and encoded.
+        Calling the keyword without arguments restores the defaults.
+
+        Targets:
+        | Screen     | All monitors, default                                         |
+        | MainScreen | Primary monitor only                                          |
+        | Window     | Top level window which contains the focused element           |
+        | Region     | Rectangle from x, y, width and height in screen coordinates   |
+
+        Arguments:
+        | Argument      | Type   | Description                                                      |
+        | target        | string | Screen, MainScreen, Window or Region                             |
+        | x             | number | Left position from region in pixels                              |
+        | y             | number | Top position from region in pixels                               |
+        | width         | number | Width from region in pixels                                      |
+        | height        | number | Height from region in pixels                                     |
+        | max_dimension | number | Images are scaled down to this maximum width and height, None unlimited |
+        | jpeg_quality  | number | Quality between 1 and 100 for jpg files and Base64 JPEG images   |
+
+        Example:
+        | Set Screenshot Capture Options    Window    max_dimension=1920    jpeg_quality=60 |
+        | Set Screenshot Capture Options    Region    0    0    800    600                  |
+        | Set Screenshot Capture Options                                                   |
+        """
+        module = self._container.create_or_get_module()
+        module.action(Screenshot.Action.SET_CAPTURE_OPTIONS,
+                      Screenshot.create_value_container(target=target,
+                                                        x=x,
+                                                        y=y,
+                                                        width=width,
+                                                        height=height,
+                                                        max_dimension=max_dimension,
+                                                        jpeg_quality=jpeg_quality))
+
     @keyword
     def take_screenshot(self, identifier=None, msg=None):
         """ Takes a screenshot of the whole desktop or the element, from the optionally provided identifier. 
@@ -98,6 +163,54 @@ class ScreenshotKeywords:
         module = self._container.create_or_get_module()
         module.action(Screenshot.Action.SET_ENABLED_TO, Screenshot.create_value_container(enabled=enabled))
 
+    @keyword
+    def set_asynchronous_screenshots_on_failure(self, enabled: bool):
+        """
+        Enables or disables writing screenshots on failure by a background thread. Default is enabled.
+
+        The screen is captured on failure, encoding and writing the file happens in background so failing keywords
+        return faster. All pending screenshots are written at the end of each test.
+        Only used in screenshot log mode 'File', screenshots by Take Screenshot are always written immediately.
+
+        Arguments:
+        | Argument   | Type   | Description      |
+        | enabled    | string | True or False    |
+
+        Example:
+        | Set Asynchronous Screenshots On Failure  ${FALSE/TRUE} |
+        """
+        module = self._container.create_or_get_module()
+        module.action(Screenshot.Action.SET_ASYNCHRONOUS_TO,
+                      Screenshot.create_value_container(asynchronous=enabled))
+
+    @keyword
+    def set_screenshot_limits_on_failure(self,
+                                         max_per_test: Optional[int] = None,
+                                         min_interval_in_ms: int = 0,
+                                         skip_duplicates: bool = True):
+        """
+        Limits screenshots taken on failure within a single test, e.g. if a failing keyword is retried by
+        Wait Until Keyword Succeeds. Limits are reset at the start of each test.
+
+        If duplicates are skipped, a screenshot identical to a previous screenshot from the same test is not stored
+        again and the log refers to the previous screenshot instead.
+
+        Arguments:
+        | Argument           | Type   | Description                                                        |
+        | max_per_test       | number | Maximum amount of screenshots on failure per test, None unlimited  |
+        | min_interval_in_ms | number | Minimum time between two screenshots on failure in milliseconds    |
+        | skip_duplicates    | bool   | True or False to skip identical screenshots, default True          |
+
+        Example:
+        | Set Screenshot Limits On Failure  max_per_test=5  min_interval_in_ms=1000 |
+        | Set Screenshot Limits On Failure  skip_duplicates=${FALSE}                |
+        """
+        module = self._container.create_or_get_module()
+        module.action(Screenshot.Action.SET_LIMITS,
+                      Screenshot.create_value_container(max_per_test=max_per_test,
+                                                        min_interval_in_ms=min_interval_in_ms,
+                                                        skip_duplicates=skip_duplicates))
+
     @keyword
     def set_screenshot_directory(self, directory=None):
         """
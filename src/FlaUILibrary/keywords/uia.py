@@ -21,20 +21,20 @@ class UiaKeywords:
         """
         Switch automation user interface from library.
 
-        Possible arguments are 'UIA2' or 'UIA3'.
+        Possible arguments are 'UIA2' or 'UIA3'. 'FAKE' is possible if the library was imported with a fake_tree.
 
         All other interface usage will force a Rush Exception.
 
         Arguments:
         | Argument   | Type   | Description                             |
-        | uia        | string | 'UIA2' or 'UIA3'                        |
+        | uia        | string | 'UIA2', 'UIA3' or 'FAKE'                |
 
         Example:
         | Switch UIA To  UIA2           |
         | Switch UIA To  UIA3           |
 
         """
-        if uia in ("UIA2", "UIA3"):
+        if uia in ("UIA2", "UIA3", "FAKE"):
             self._container.set_identifier(uia)
             return
 
@@ -12,40 +12,64 @@ SYSTEM_CODE_DOME_DLL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file_
 SAFE_XPATH_DLL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bin', 'FlaUiNative.dll')
 
 
+# FlaUI.Core, System.CodeDom and FlaUiNative are referenced on import because all modules import their namespaces.
+# Assemblies from UIA2 and UIA3 are only referenced on first usage from the automation, see load_assemblies.
 clr.AddReference(FLAUI_CORE_DLL_PATH)
-clr.AddReference(FLAUI_UIA2_DLL_PATH)
-clr.AddReference(FLAUI_UIA3_DLL_PATH)
-clr.AddReference(INTEROP_DLL_PATH)
 clr.AddReference(SYSTEM_CODE_DOME_DLL_PATH)
 clr.AddReference(SAFE_XPATH_DLL_PATH)
 
 clr.AddReference("System")
 clr.AddReference("FlaUI.Core")
-clr.AddReference("FlaUI.UIA2")
-clr.AddReference("FlaUI.UIA3")
-clr.AddReference("Interop.UIAutomationClient")
 clr.AddReference("System.CodeDom")
 clr.AddReference("FlaUiNative")
 
-from System.Reflection import Assembly, BindingFlags  # pylint: disable=import-error,wrong-import-position
+from System import Delegate, Func, Object, String  # pylint: disable=import-error,wrong-import-position
+from System.Reflection import Assembly  # pylint: disable=import-error,wrong-import-position
 
-_SAFE_XPATH_TYPE = Assembly.LoadFrom(SAFE_XPATH_DLL_PATH).GetType("FlaUiNative.SafeXPath")
-_INVOKE_STATIC = BindingFlags.InvokeMethod | BindingFlags.Public | BindingFlags.Static
+_AUTOMATION_ASSEMBLIES = {
+    "UIA2": ((FLAUI_UIA2_DLL_PATH, "FlaUI.UIA2"),),
+    "UIA3": ((INTEROP_DLL_PATH, "Interop.UIAutomationClient"), (FLAUI_UIA3_DLL_PATH, "FlaUI.UIA3")),
+}
+_LOADED_AUTOMATION_ASSEMBLIES = set()
+_LOOKUPS = {}
+
+
+def load_assemblies(identifier):
+    """Reference assemblies from UIA2 or UIA3 automation once before their namespaces are imported."""
+    if identifier not in _LOADED_AUTOMATION_ASSEMBLIES:
+        for (path, name) in _AUTOMATION_ASSEMBLIES[identifier]:
+            clr.AddReference(path)
+            clr.AddReference(name)
+        _LOADED_AUTOMATION_ASSEMBLIES.add(identifier)
+
+
+def get_loaded_assemblies():
+    """Return identifiers like UIA3 from automations whose assemblies are already loaded."""
+    return frozenset(_LOADED_AUTOMATION_ASSEMBLIES)
+
+
+def _get_lookup(method_name):
+    """Bind a FlaUiNative.SafeXPath static method on first usage as delegate to avoid reflection per call."""
+    lookup = _LOOKUPS.get(method_name)
+    if lookup is None:
+        safe_xpath_type = Assembly.LoadFrom(SAFE_XPATH_DLL_PATH).GetType("FlaUiNative.SafeXPath")
+        lookup = Delegate.CreateDelegate(clr.GetClrType(Func[Object, String, Object]),
+                                         safe_xpath_type.GetMethod(method_name))
+        _LOOKUPS[method_name] = lookup
+    return lookup
 
 
 class SafeXPath:  # pylint: disable=invalid-name
-    """Wrapper for FlaUiNative.SafeXPath static methods."""
+    """
+    Wrapper for FlaUiNative.SafeXPath static methods.
+    """
 
     @staticmethod
     def FindFirstByXPath(element, xpath):
         """Find the first automation element matching xpath."""
-        return _SAFE_XPATH_TYPE.InvokeMember(
-            "FindFirstByXPath", _INVOKE_STATIC, None, None, [element, xpath]
-        )
+        return _get_lookup("FindFirstByXPath")(element, xpath)
 
     @staticmethod
     def FindAllByXPath(element, xpath):
         """Find all automation elements matching xpath."""
-        return _SAFE_XPATH_TYPE.InvokeMember(
-            "FindAllByXPath", _INVOKE_STATIC, None, None, [element, xpath]
-        )
+        return _get_lookup("FindAllByXPath")(element, xpath)
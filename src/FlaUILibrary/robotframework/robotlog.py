@@ -23,6 +23,15 @@ def log(message: str):
     logger.info(message)
 
 
+def log_warning(message: str):
+    """
+    Log given message as warning to robot result.
+
+    ``message`` Message to log to robot.
+    """
+    logger.warn(message)
+
+
 def log_screenshot(filepath: str):
     """
     Append testing log by a screenshot
@@ -38,14 +47,14 @@ def log_screenshot(filepath: str):
         html=True,
     )
 
-def log_screenshot_base64(image: str):
+def log_screenshot_base64(image: str, mime_type: str = "image/png"):
     """
     Append testing log by a screenshot in base64 format.
 
-    ``image`` Image as string in base64 encoding. 
+    ``image`` Image as string in base64 encoding.
+    ``mime_type`` Mime type from encoded image like image/png or image/jpeg.
     """
     logger.info(
-        '</td></tr><tr><td colspan="3">' +
-        f'<img src="data:image/png;base64,{image}" width="800px"/>',
+        f'</td></tr><tr><td colspan="3"><img src="data:{mime_type};base64,{image}" width="800px"/>',
         html=True
     )
@@ -0,0 +1,17 @@
+"""
+Unit tests for Python helpers which do not need UI Automation.
+
+The .NET namespaces are replaced by the stubs from benchmarks/dotnetstubs.py, so the tests run with plain pytest
+on any platform without pythonnet and the FlaUI assemblies.
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path[0:0] = [os.path.join(ROOT, "src"), os.path.join(ROOT, "benchmarks")]
+os.environ.setdefault("COMPUTERNAME", "utest")
+
+import dotnetstubs  # pylint: disable=wrong-import-position
+
+dotnetstubs.install()
@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+import pytest
+from FlaUILibrary.flaui.module.element import Element
+
+
+def _element(control_type, name, parent):
+    properties = SimpleNamespace(Name=SimpleNamespace(ValueOrDefault=name),
+                                 AutomationId=SimpleNamespace(ValueOrDefault=""),
+                                 ClassName=SimpleNamespace(ValueOrDefault=""),
+                                 HelpText=SimpleNamespace(ValueOrDefault=""))
+    return SimpleNamespace(ControlType=SimpleNamespace(ToString=lambda: control_type),
+                           Properties=properties,
+                           parent=parent)
+
+
+DESKTOP = _element("Pane", "Desktop", None)
+WINDOW_A = _element("Window", "A", DESKTOP)
+PANE_A = _element("Pane", "", WINDOW_A)
+BUTTON_A = _element("Button", "OK", PANE_A)
+WINDOW_B = _element("Window", "B", DESKTOP)
+BUTTON_B = _element("Button", "OK", WINDOW_B)
+
+
+@pytest.fixture(name="module")
+def fixture_module():
+    walker = SimpleNamespace(GetParent=lambda element: element.parent)
+    automation = SimpleNamespace(TreeWalkerFactory=SimpleNamespace(GetControlViewWalker=lambda: walker))
+    return Element(automation, 0)
+
+
+@pytest.mark.parametrize("xpath, element", [
+    ("//Window[@Name='B']//Button[@Name='OK']", BUTTON_B),
+    ("/Window[@Name='A']/Pane/Button[@Name='OK']", BUTTON_A),
+    ("/Window[@Name='A']//Button[@Name='OK']", BUTTON_A),
+    ("//Pane/Button[@Name='OK']", BUTTON_A),
+    ("//Button[@Name='OK']", BUTTON_B),
+])
+def test_stored_element_matches_all_steps(module, xpath, element):
+    assert module._matches_xpath(xpath, element)  # pylint: disable=protected-access
+
+
+@pytest.mark.parametrize("xpath, element", [
+    # Element matches the last step only, but is located in another window
+    ("//Window[@Name='B']//Button[@Name='OK']", BUTTON_A),
+    ("/Window[@Name='A']/Button[@Name='OK']", BUTTON_A),
+    ("/Pane/Button[@Name='OK']", BUTTON_A),
+    ("//Button[@Name='Cancel']", BUTTON_A),
+    # Steps which can not be verified
+    ("//*", BUTTON_A),
+    ("//Button[2]", BUTTON_A),
+])
+def test_stored_element_does_not_match(module, xpath, element):
+    assert not module._matches_xpath(xpath, element)  # pylint: disable=protected-access
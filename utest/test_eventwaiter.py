@@ -0,0 +1,30 @@
+from FlaUILibrary.flaui.util.eventwaiter import EventWaiter
+
+
+def test_condition_is_polled_without_element():
+    calls = []
+
+    def condition():
+        calls.append(True)
+        return len(calls) == 3
+
+    assert EventWaiter(None).wait(condition, 1000)
+    assert len(calls) == 3
+
+
+def test_timeout_without_element():
+    assert not EventWaiter(None).wait(lambda: False, 50)
+
+
+def test_steady_events_do_not_reset_backoff():
+    waiter = EventWaiter(None)
+    calls = []
+
+    def condition():
+        calls.append(True)
+        waiter._changed.set()  # pylint: disable=protected-access
+        return False
+
+    assert not waiter.wait(condition, 300)
+    # Intervals of 10 ms would evaluate the condition about 30 times, growing intervals about 8 times
+    assert len(calls) < 12
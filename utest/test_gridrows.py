@@ -0,0 +1,115 @@
+from types import SimpleNamespace
+from FlaUILibrary.flaui.util.gridrows import GridRows
+
+VALUE = "Value.Value"
+ROW = "GridItem.Row"
+
+
+class FakeCell:
+    """
+    Cell with cached value and row index.
+    """
+
+    def __init__(self, value, row_index):
+        self.ControlType = "DataItem"  # pylint: disable=invalid-name
+        properties = {VALUE: value, ROW: row_index}
+        self.FrameworkAutomationElement = SimpleNamespace(  # pylint: disable=invalid-name
+            TryGetPropertyValue=lambda property_id: (properties.get(property_id) is not None,
+                                                     properties.get(property_id)))
+
+
+class FakeRow:
+    """
+    Row with cells, scrolls the grid if it is scrolled into view.
+    """
+
+    def __init__(self, grid, row_index, with_row_index=True):
+        self.index = row_index
+        cached_row_index = row_index if with_row_index else None
+        self.CachedChildren = [FakeCell(f"Row {row_index}", cached_row_index),  # pylint: disable=invalid-name
+                               FakeCell(str(row_index * 2), cached_row_index)]
+        scroll_item = SimpleNamespace(ScrollIntoView=lambda: grid.scroll_to(row_index))
+        self.Patterns = SimpleNamespace(  # pylint: disable=invalid-name
+            VirtualizedItem=SimpleNamespace(PatternOrDefault=None),
+            ScrollItem=SimpleNamespace(PatternOrDefault=scroll_item))
+
+
+class FakeGrid:
+    """
+    Grid with row_count rows from which only page_size rows from offset are realized.
+    """
+
+    def __init__(self, row_count, page_size, reported_row_count=None, with_row_index=True):
+        self.rows = [FakeRow(self, index, with_row_index) for index in range(row_count)]
+        self.page_size = page_size
+        self.offset = 0
+        self.scrolls = 0
+        self.RowCount = row_count if reported_row_count is None else reported_row_count  # pylint: disable=invalid-name
+        self.Automation = SimpleNamespace(PropertyLibrary=SimpleNamespace(  # pylint: disable=invalid-name
+            Value=SimpleNamespace(Value=VALUE), GridItem=SimpleNamespace(Row=ROW),
+            Element=SimpleNamespace(ControlType="ControlType")))
+        condition = SimpleNamespace(Or=lambda other: other)
+        self.ConditionFactory = SimpleNamespace(  # pylint: disable=invalid-name
+            ByControlType=lambda _control_type: condition)
+        item_container = SimpleNamespace(FindItemByProperty=self._find_item_by_property)
+        self.Patterns = SimpleNamespace(  # pylint: disable=invalid-name
+            ItemContainer=SimpleNamespace(PatternOrDefault=item_container))
+
+    def FindAll(self, _scope, _condition):  # pylint: disable=invalid-name
+        """
+        Returns realized rows.
+        """
+        return self.rows[self.offset:self.offset + self.page_size]
+
+    def scroll_to(self, row_index):
+        """
+        Scrolls a row into view as first realized row.
+        """
+        self.scrolls += 1
+        self.offset = min(row_index, max(len(self.rows) - self.page_size, 0))
+
+    def _find_item_by_property(self, start_after, _property, _value):
+        index = 0 if start_after is None else start_after.index + 1
+        return self.rows[index] if index < len(self.rows) else None
+
+
+def test_realized_grid_is_read_without_scrolling():
+    grid = FakeGrid(5, 10)
+
+    rows = list(GridRows.iterate_virtualized(grid))
+
+    assert rows == [[f"Row {index}", str(index * 2)] for index in range(5)]
+    assert grid.scrolls == 0
+
+
+def test_virtualized_grid_is_read_page_by_page():
+    grid = FakeGrid(25, 10)
+
+    rows = list(GridRows.iterate_virtualized(grid, columns=[0]))
+
+    assert rows == [[f"Row {index}"] for index in range(25)]
+    assert grid.scrolls > 0
+
+
+def test_scroll_realizes_pages_if_row_count_is_not_reported():
+    grid = FakeGrid(25, 10, reported_row_count=0)
+
+    assert len(list(GridRows.iterate_virtualized(grid))) == 10
+    assert len(list(GridRows.iterate_virtualized(grid, scroll=True))) == 25
+
+
+def test_row_range_refers_to_grid_row_index():
+    grid = FakeGrid(25, 10)
+    grid.offset = 5
+
+    realized = list(GridRows.iterate_with_index(grid, 7, 9, [0]))
+    virtualized = list(GridRows.iterate_virtualized_with_index(grid, 7, 9, [0]))
+
+    assert realized == [(7, ["Row 7"]), (8, ["Row 8"])]
+    assert virtualized == realized
+
+
+def test_rows_without_grid_item_are_indexed_by_position():
+    grid = FakeGrid(5, 10, with_row_index=False)
+
+    assert list(GridRows.iterate_with_index(grid, 1, 3, [0])) == [(1, ["Row 1"]), (2, ["Row 2"])]
@@ -0,0 +1,42 @@
+import pytest
+from FlaUILibrary.flaui.util.locatorcache import LocatorCache
+
+
+@pytest.mark.parametrize("xpath, expected", [
+    ("/Window[@Name='App']/Button", [("/", "Window[@Name='App']"), ("/", "Button")]),
+    ("//Button[@Name='x']//Text", [("//", "Button[@Name='x']"), ("//", "Text")]),
+    ("/Window[@Name='App']//Pane/Button[2]", [("/", "Window[@Name='App']"), ("//", "Pane"), ("/", "Button[2]")]),
+])
+def test_split_steps(xpath, expected):
+    assert LocatorCache.split_steps(xpath) == expected
+
+
+@pytest.mark.parametrize("xpath, expected", [
+    ("//Button[@Name='a/b']", [("//", "Button[@Name='a/b']")]),
+    ("//Button[@Name=\"a//b\"]", [("//", "Button[@Name=\"a//b\"]")]),
+    ("//Button[@Name='a]b']", [("//", "Button[@Name='a]b']")]),
+    ("/Pane[Button[@Name='x']]/Text", [("/", "Pane[Button[@Name='x']]"), ("/", "Text")]),
+])
+def test_split_steps_ignores_separators_inside_predicates_and_quotes(xpath, expected):
+    assert LocatorCache.split_steps(xpath) == expected
+
+
+@pytest.mark.parametrize("xpath", [
+    None,
+    "",
+    "Button",
+    "(/Window)[1]",
+    "/Window | /Pane",
+    "/Window/..",
+    "/Window/.",
+    "/Window[@Name='App",
+    "/Window[@Name='App']]",
+])
+def test_split_steps_rejects_unsupported_xpaths(xpath):
+    assert LocatorCache.split_steps(xpath) is None
+
+
+def test_join_steps_restores_xpath():
+    xpath = "/Window[@Name='App']//Pane/Button[@Name='a/b']"
+
+    assert LocatorCache.join_steps(LocatorCache.split_steps(xpath)) == xpath
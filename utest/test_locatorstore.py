@@ -0,0 +1,108 @@
+import json
+from FlaUILibrary.flaui.util.locatorstore import LocatorStore
+
+
+def _write(filepath, content):
+    filepath.write_text(json.dumps(content), encoding="utf-8")
+
+
+def test_missing_file_starts_empty(tmp_path):
+    store = LocatorStore(str(tmp_path / "locators.json"))
+
+    assert store.get("App", "//Button[@Name='OK']") is None
+
+
+def test_save_and_load(tmp_path):
+    filepath = tmp_path / "locators.json"
+    store = LocatorStore(str(filepath))
+    store.put("App", "//Button[@Name='OK']", "/Window[2]/Pane/Button[3]")
+    store.save()
+
+    assert json.loads(filepath.read_text(encoding="utf-8")) == {
+        "version": LocatorStore.VERSION,
+        "applications": {"App": {"//Button[@Name='OK']": "/Window[2]/Pane/Button[3]"}},
+    }
+    assert LocatorStore(str(filepath)).get("App", "//Button[@Name='OK']") == "/Window[2]/Pane/Button[3]"
+
+
+def test_entries_are_stored_per_application(tmp_path):
+    store = LocatorStore(str(tmp_path / "locators.json"))
+    store.put("App", "//Button", "/Window/Button")
+
+    assert store.get("Other", "//Button") is None
+
+
+def test_save_creates_directory(tmp_path):
+    filepath = tmp_path / "locators" / "store.json"
+    store = LocatorStore(str(filepath))
+    store.put("App", "//Button", "/Window/Button")
+    store.save()
+
+    assert filepath.exists()
+
+
+def test_save_without_changes_does_not_write(tmp_path):
+    filepath = tmp_path / "locators.json"
+    store = LocatorStore(str(filepath))
+    store.put("App", "//Button", "/Window/Button")
+    store.save()
+    filepath.unlink()
+
+    store.put("App", "//Button", "/Window/Button")
+    store.save()
+
+    assert not filepath.exists()
+
+
+def test_remove_is_saved(tmp_path):
+    filepath = tmp_path / "locators.json"
+    _write(filepath, {"version": LocatorStore.VERSION, "applications": {"App": {"//Button": "/Window/Button"}}})
+    store = LocatorStore(str(filepath))
+    store.remove("App", "//Button")
+    store.save()
+
+    assert LocatorStore(str(filepath)).get("App", "//Button") is None
+
+
+def test_other_version_is_ignored(tmp_path):
+    filepath = tmp_path / "locators.json"
+    _write(filepath, {"version": LocatorStore.VERSION + 1, "applications": {"App": {"//Button": "/Window/Button"}}})
+
+    assert LocatorStore(str(filepath)).get("App", "//Button") is None
+
+
+def test_file_without_version_is_ignored(tmp_path):
+    filepath = tmp_path / "locators.json"
+    _write(filepath, {"applications": {"App": {"//Button": "/Window/Button"}}})
+
+    assert LocatorStore(str(filepath)).get("App", "//Button") is None
+
+
+def test_other_version_is_replaced_on_save(tmp_path):
+    filepath = tmp_path / "locators.json"
+    _write(filepath, {"version": LocatorStore.VERSION + 1, "applications": {"App": {"//Button": "/Window/Button"}}})
+    store = LocatorStore(str(filepath))
+    store.put("App", "//Text", "/Window/Text")
+    store.save()
+
+    assert json.loads(filepath.read_text(encoding="utf-8")) == {
+        "version": LocatorStore.VERSION,
+        "applications": {"App": {"//Text": "/Window/Text"}},
+    }
+
+
+def test_invalid_file_starts_empty(tmp_path):
+    filepath = tmp_path / "locators.json"
+    filepath.write_text("{ invalid", encoding="utf-8")
+
+    assert LocatorStore(str(filepath)).get("App", "//Button") is None
+
+
+def test_invalid_application_entries_are_skipped(tmp_path):
+    filepath = tmp_path / "locators.json"
+    _write(filepath, {"version": LocatorStore.VERSION,
+                      "applications": {"App": ["//Button"], "Other": {"//Button": "/Window/Button"}}})
+    store = LocatorStore(str(filepath))
+
+    assert store.get("App", "//Button") is None
+    assert store.get("Other", "//Button") == "/Window/Button"
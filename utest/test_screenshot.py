@@ -0,0 +1,24 @@
+import pytest
+from FlaUILibrary.flaui.module.screenshot import Screenshot
+
+
+@pytest.fixture(name="screenshot")
+def fixture_screenshot():
+    screenshot = Screenshot(None)
+    screenshot.execute_action(Screenshot.Action.SET_LIMITS,
+                              Screenshot.create_value_container(max_per_test=1, min_interval_in_ms=0,
+                                                                skip_duplicates=True))
+    return screenshot
+
+
+def test_manual_screenshots_do_not_use_up_failure_budget(screenshot):
+    for index in range(3):
+        screenshot._register_capture(str(index), f"manual_{index}.jpg", False)  # pylint: disable=protected-access
+
+    assert screenshot._is_capture_allowed()  # pylint: disable=protected-access
+
+
+def test_failure_screenshots_use_up_failure_budget(screenshot):
+    screenshot._register_capture("hash", "failure.jpg", True)  # pylint: disable=protected-access
+
+    assert not screenshot._is_capture_allowed()  # pylint: disable=protected-access
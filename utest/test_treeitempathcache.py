@@ -0,0 +1,103 @@
+from types import SimpleNamespace
+import pytest
+from FlaUILibrary.flaui.util import treeitempathcache
+from FlaUILibrary.flaui.util.treeitempathcache import TreeItemPathCache
+
+TREE_ID = (42,)
+LIBRARY = SimpleNamespace(RuntimeId="RuntimeId", Name="Name", ControlType="ControlType")
+
+
+class FakeTreeItem:
+    """
+    Tree item with name and runtime id which can be read from cache.
+    """
+
+    def __init__(self, name, runtime_id, control_type="TreeItem"):
+        self.Name = name  # pylint: disable=invalid-name
+        self.ControlType = control_type  # pylint: disable=invalid-name
+        self.Properties = SimpleNamespace(RuntimeId=SimpleNamespace(Value=runtime_id))  # pylint: disable=invalid-name
+        properties = {LIBRARY.RuntimeId: runtime_id, LIBRARY.Name: name}
+        self.FrameworkAutomationElement = SimpleNamespace(  # pylint: disable=invalid-name
+            TryGetPropertyValue=lambda property_id: (properties.get(property_id) is not None,
+                                                     properties.get(property_id)))
+
+
+class FakeTree:
+    """
+    Tree control whose children are returned by a cache request.
+    """
+
+    def __init__(self, *items):
+        self.Items = list(items)  # pylint: disable=invalid-name
+        self.Automation = SimpleNamespace(PropertyLibrary=SimpleNamespace(Element=LIBRARY))  # pylint: disable=invalid-name
+        self.FrameworkAutomationElement = SimpleNamespace(  # pylint: disable=invalid-name
+            GetUpdatedCache=lambda: SimpleNamespace(CachedChildren=self.Items))
+
+
+@pytest.fixture(autouse=True)
+def fixture_control_type(monkeypatch):
+    monkeypatch.setattr(treeitempathcache, "ControlType", SimpleNamespace(TreeItem="TreeItem"))
+
+
+def _cache(path, treeitem):
+    cache = TreeItemPathCache()
+    cache.put(TREE_ID, path, treeitem)
+    return cache
+
+
+@pytest.mark.parametrize("path", [(("N:", "b"),), (("I:", "1"),)])
+def test_unchanged_tree_item_is_returned(path):
+    item = FakeTreeItem("b", [2])
+    tree = FakeTree(FakeTreeItem("a", [1]), item)
+
+    assert _cache(path, item).get(TREE_ID, path, tree) is item
+
+
+def test_index_is_checked_after_item_was_inserted_before():
+    item = FakeTreeItem("b", [2])
+    tree = FakeTree(FakeTreeItem("a", [1]), item)
+    cache = _cache((("I:", "1"),), item)
+    tree.Items.insert(0, FakeTreeItem("b", [3]))
+
+    assert cache.get(TREE_ID, (("I:", "1"),), tree) is None
+    assert len(cache) == 0
+
+
+def test_index_is_checked_after_item_was_removed_before():
+    item = FakeTreeItem("c", [3])
+    tree = FakeTree(FakeTreeItem("a", [1]), FakeTreeItem("b", [2]), item)
+    cache = _cache((("I:", "1"),), tree.Items[1])
+    tree.Items.pop(0)
+
+    assert cache.get(TREE_ID, (("I:", "1"),), tree) is None
+
+
+def test_name_resolves_to_first_item_after_duplicate_was_inserted_before():
+    item = FakeTreeItem("b", [2])
+    tree = FakeTree(FakeTreeItem("a", [1]), item)
+    cache = _cache((("N:", "b"),), item)
+    tree.Items.insert(1, FakeTreeItem("b", [3]))
+
+    assert cache.get(TREE_ID, (("N:", "b"),), tree) is None
+
+
+def test_name_is_checked_after_item_was_renamed():
+    item = FakeTreeItem("b", [2])
+    tree = FakeTree(FakeTreeItem("a", [1]), item)
+    cache = _cache((("N:", "b"),), item)
+    tree.Items[1] = FakeTreeItem("c", [2])
+
+    assert cache.get(TREE_ID, (("N:", "b"),), tree) is None
+
+
+def test_other_control_types_are_ignored_for_index():
+    item = FakeTreeItem("b", [2])
+    tree = FakeTree(FakeTreeItem("", [9], "ScrollBar"), FakeTreeItem("a", [1]), item)
+
+    assert _cache((("I:", "1"),), item).get(TREE_ID, (("I:", "1"),), tree) is item
+
+
+def test_tree_item_without_runtime_id_is_not_cached():
+    cache = _cache((("N:", "b"),), FakeTreeItem("b", None))
+
+    assert len(cache) == 0
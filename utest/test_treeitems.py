@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+import pytest
+from FlaUILibrary.flaui.enum.treeitemaction import TreeItemAction
+from FlaUILibrary.flaui.exception.flauierror import FlaUiError
+from FlaUILibrary.flaui.util import treeitems
+from FlaUILibrary.flaui.util.treeitems import TreeItems
+
+STATES = SimpleNamespace(Collapsed="Collapsed", Expanded="Expanded", PartiallyExpanded="PartiallyExpanded",
+                         LeafNode="LeafNode")
+
+
+class FakeTreeItem:
+    """
+    Tree item which counts expand and select calls.
+    """
+
+    def __init__(self, name, state, *items):
+        self.Name = name  # pylint: disable=invalid-name
+        self.ExpandCollapseState = state  # pylint: disable=invalid-name
+        self.Items = list(items)  # pylint: disable=invalid-name
+        self.expands = 0
+        self.selects = 0
+
+    def Expand(self):  # pylint: disable=invalid-name
+        """
+        Expands the tree item.
+        """
+        self.expands += 1
+        self.ExpandCollapseState = STATES.Expanded
+
+    def Select(self):  # pylint: disable=invalid-name
+        """
+        Selects the tree item.
+        """
+        self.selects += 1
+
+
+@pytest.fixture(autouse=True)
+def fixture_expand_collapse_state(monkeypatch):
+    monkeypatch.setattr(treeitems, "ExpandCollapseState", STATES)
+
+
+@pytest.mark.parametrize("state, expands", [
+    (STATES.Collapsed, 1),
+    (STATES.Expanded, 0),
+    (STATES.PartiallyExpanded, 0),
+])
+def test_ancestor_is_only_expanded_if_collapsed(state, expands):
+    leaf = FakeTreeItem("b", STATES.LeafNode)
+    ancestor = FakeTreeItem("a", state, leaf)
+    tree = SimpleNamespace(Items=[ancestor])
+
+    TreeItems.execute_by_location(tree, "N:a->N:b", "->", TreeItemAction.SELECT)
+
+    assert ancestor.expands == expands
+    assert leaf.selects == 1
+
+
+def test_leaf_node_ancestor_is_not_expandable():
+    tree = SimpleNamespace(Items=[FakeTreeItem("a", STATES.LeafNode)])
+
+    with pytest.raises(FlaUiError):
+        TreeItems.execute_by_location(tree, "N:a->I:0", "->", TreeItemAction.SELECT)
@@ -0,0 +1,57 @@
+import pytest
+from FlaUILibrary.flaui.util.xpathanalyzer import XPathAnalyzer
+
+
+@pytest.mark.parametrize("xpath, is_unbounded, is_anchorable", [
+    ("//Button[@Name='OK']", True, True),
+    ("//*[@AutomationId='Ok']", True, True),
+    ("//Window[@Name='App']//Button", True, False),
+    ("//Window", True, False),
+    ("/Window[@Name='App']//Button", False, False),
+    ("Button", False, False),
+])
+def test_analyze(xpath, is_unbounded, is_anchorable):
+    analysis = XPathAnalyzer().analyze(xpath)
+
+    assert analysis.xpath == xpath
+    assert analysis.is_unbounded == is_unbounded
+    assert analysis.is_anchorable == is_anchorable
+
+
+def test_analyze_reuses_cached_analysis():
+    analyzer = XPathAnalyzer()
+
+    assert analyzer.analyze("//Button") is analyzer.analyze("//Button")
+
+
+def test_anchor_prefers_automation_id():
+    anchored = XPathAnalyzer().anchor("//Button[@Name='OK']", "Main", "App")
+
+    assert anchored == "/Window[@AutomationId='Main']//Button[@Name='OK']"
+
+
+@pytest.mark.parametrize("automation_id", [None, ""])
+def test_anchor_by_name_without_automation_id(automation_id):
+    anchored = XPathAnalyzer().anchor("//Button[@Name='OK']", automation_id, "It's")
+
+    assert anchored == "/Window[@Name=\"It's\"]//Button[@Name='OK']"
+
+
+@pytest.mark.parametrize("xpath, automation_id, name", [
+    ("/Window[@Name='App']//Button", "Main", "App"),
+    ("//Window[@Name='App']", "Main", "App"),
+    ("//Button[@Name='OK']", None, None),
+    ("//Button[@Name='OK']", "", "a'b\"c"),
+])
+def test_anchor_not_possible(xpath, automation_id, name):
+    assert XPathAnalyzer().anchor(xpath, automation_id, name) is None
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("App", "'App'"),
+    ("", "''"),
+    ("It's", "\"It's\""),
+    ("a'b\"c", None),
+])
+def test_quote(value, expected):
+    assert XPathAnalyzer.quote(value) == expected
@@ -0,0 +1,76 @@
+import pytest
+from FlaUILibrary.flaui.util.xpathtranslator import XPathTranslator
+
+
+def _translate(xpath):
+    steps = XPathTranslator().translate(xpath)
+    if steps is None:
+        return None
+
+    return [(step.is_descendant, step.control_type, step.properties) for step in steps]
+
+
+def test_translate_child_and_descendant_steps():
+    assert _translate("/Window[@Name='App']//Button[@AutomationId='Ok']") == [
+        (False, "Window", (("Name", "App"),)),
+        (True, "Button", (("AutomationId", "Ok"),)),
+    ]
+
+
+def test_translate_any_control_type_without_predicates():
+    assert _translate("/Window[@Name='App']/*") == [
+        (False, "Window", (("Name", "App"),)),
+        (False, None, ()),
+    ]
+
+
+@pytest.mark.parametrize("xpath", [
+    "//Button[@AutomationId='Ok' and @ClassName='Button']",
+    "//Button[@AutomationId='Ok'][@ClassName='Button']",
+    "//Button[ @AutomationId = 'Ok'  and  @ClassName = \"Button\" ]",
+])
+def test_translate_combined_predicates(xpath):
+    assert _translate(xpath) == [(True, "Button", (("AutomationId", "Ok"), ("ClassName", "Button")))]
+
+
+@pytest.mark.parametrize("xpath, value", [
+    ("//Button[@Name='a]b']", "a]b"),
+    ("//Button[@Name='[x]']", "[x]"),
+    ("//Button[@Name=\"It's\"]", "It's"),
+    ("//Button[@Name='Say \"Hi\"']", "Say \"Hi\""),
+    ("//Button[@Name='x and y']", "x and y"),
+    ("//Button[@Name='a/b']", "a/b"),
+])
+def test_translate_quoted_values(xpath, value):
+    assert _translate(xpath) == [(True, "Button", (("Name", value),))]
+
+
+@pytest.mark.parametrize("xpath", [
+    "//Button[2]",
+    "/Window[@Name='App']/Button[last()]",
+    "//Button[contains(@Name, 'OK')]",
+    "//Button[starts-with(@Name, 'OK')]",
+    "//Button[not(@Name='OK')]",
+    "//Button[@Name!='OK']",
+    "//Button[@Name='OK' or @Name='Cancel']",
+    "/Window/child::Button",
+    "//Button/parent::Pane",
+    "/Window/..",
+    "//Button[@name='OK']",
+    "//Button[@automationid='Ok']",
+    "//Button[@IsEnabled='True']",
+    "//Button[@Name=OK]",
+    "//Button[@Name]",
+    "Button[@Name='OK']",
+    "",
+])
+def test_translate_rejects_unsupported_xpaths(xpath):
+    assert _translate(xpath) is None
+
+
+def test_translate_returns_new_list_from_cache():
+    translator = XPathTranslator()
+    steps = translator.translate("//Button[@Name='OK']")
+    steps.clear()
+
+    assert len(translator.translate("//Button[@Name='OK']")) == 1